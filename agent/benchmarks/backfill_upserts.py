@@ -0,0 +1,166 @@
+"""
+Benchmark: serial backfill upserts vs. the batched bulk enqueue path.
+
+Run from the agent/ directory:
+
+    python benchmarks/backfill_upserts.py [--meetings 40] [--upsert-ms 250] [--bridge-concurrency 3]
+
+Starts a stand-in for the bridge's meeting-register upsert endpoints
+(POST /api/meeting-register/upsert-by-external and .../upsert-by-external/batch)
+in which every upsert takes --upsert-ms and a batch runs --bridge-concurrency
+upserts at a time, like REGISTER_BATCH_CONCURRENCY on the real bridge. Then
+queues --meetings missing meetings:
+
+  serial      one upsert-by-external call after another (the old backfill loop)
+  bulk        main._queue_meetings_for_backfill: AUTO_BACKFILL_BATCH_SIZE items
+              per batch call, batches sent concurrently
+  fallback    the same call against a stand-in without the batch endpoint
+              (individual upserts, AUTO_BACKFILL_CONCURRENCY at a time)
+
+One item is rejected by the stand-in to show per-item outcomes. The Notion
+token bucket is disabled here; in production it bounds all three paths.
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("AGENT_DATA_DIR", tempfile.mkdtemp())
+os.environ["NOTION_REQUESTS_PER_SECOND"] = "0"
+
+REJECTED_ID = "ff-bad"
+
+
+class BridgeStandin:
+    """Upsert endpoints of the Notion bridge with a fixed per-upsert latency."""
+
+    def __init__(self, upsert_ms: int, concurrency: int, batch_endpoint: bool = True):
+        self.latency = upsert_ms / 1000
+        self.concurrency = concurrency
+        self.batch_endpoint = batch_endpoint
+        self.calls = 0
+        self.rows = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+
+    @property
+    def base(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def upsert(self, item: dict) -> dict:
+        time.sleep(self.latency)
+        external_id = item.get("externalMeetingId")
+        if external_id == REJECTED_ID:
+            return {"success": False, "error": "validation_error: Meeting Date is invalid", "status": 400}
+        with self._lock:
+            created = external_id not in self.rows
+            self.rows.setdefault(external_id, f"row-{len(self.rows)}")
+            return {"success": True, "id": self.rows[external_id], "created": created}
+
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, payload: dict):
+                raw = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+                standin.calls += 1
+                if self.path == "/api/meeting-register/upsert-by-external":
+                    result = standin.upsert(body)
+                    return self._send(200 if result["success"] else result["status"],
+                                      result if result["success"] else {"error": result["error"]})
+                if self.path == "/api/meeting-register/upsert-by-external/batch" and standin.batch_endpoint:
+                    items = body.get("items") or []
+                    with ThreadPoolExecutor(standin.concurrency) as pool:
+                        results = list(pool.map(standin.upsert, items))
+                    for item, result in zip(items, results):
+                        result["externalMeetingId"] = item.get("externalMeetingId")
+                    return self._send(200, {"success": all(r["success"] for r in results), "results": results})
+                self._send(404, {"error": "Not found"})
+
+        return Handler
+
+
+def make_transcripts(n: int) -> list:
+    transcripts = [{"id": f"ff-{i:04d}", "title": f"Missed meeting {i}", "date": "2026-01-05T09:00:00Z"}
+                   for i in range(n - 1)]
+    return transcripts + [{"id": REJECTED_ID, "title": "Bad row", "date": "2026-01-05T09:00:00Z"}]
+
+
+async def serial(base: str, transcripts: list) -> None:
+    import httpx
+    from main import _backfill_payload
+
+    async with httpx.AsyncClient() as client:
+        for transcript in transcripts:
+            resp = await client.post(f"{base}/api/meeting-register/upsert-by-external",
+                                     json=_backfill_payload(transcript), timeout=30.0)
+            if transcript["id"] != REJECTED_ID:
+                resp.raise_for_status()
+
+
+async def bulk(base: str, transcripts: list) -> dict:
+    import main
+
+    main.NOTION_API_BASE = base
+    main._backfill_batch_supported = True
+    return await main._queue_meetings_for_backfill(transcripts)
+
+
+async def run(args) -> None:
+    transcripts = make_transcripts(args.meetings)
+    timings = {}
+    for label, batch_endpoint in (("serial", True), ("bulk", True), ("fallback", False)):
+        with BridgeStandin(args.upsert_ms, args.bridge_concurrency, batch_endpoint) as standin:
+            started = time.perf_counter()
+            if label == "serial":
+                await serial(standin.base, transcripts)
+                outcome = None
+            else:
+                outcome = await bulk(standin.base, transcripts)
+            timings[label] = (time.perf_counter() - started, standin.calls, outcome)
+
+    print(f"{args.meetings} meetings, {args.upsert_ms} ms per upsert, bridge concurrency {args.bridge_concurrency}")
+    for label, (seconds, calls, outcome) in timings.items():
+        failed = sum(1 for error in (outcome or {}).values() if error)
+        detail = f"   failed {failed}: {outcome[REJECTED_ID]}" if outcome else ""
+        print(f"  {label:<9} {seconds * 1000:8.1f} ms   bridge calls {calls:3d}{detail}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--meetings", type=int, default=40)
+    parser.add_argument("--upsert-ms", type=int, default=250)
+    parser.add_argument("--bridge-concurrency", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark: per-row Fireflies fetches vs. the batched FirefliesClient.
+
+Run from the agent/ directory:
+
+    python benchmarks/fireflies_batch.py [--rows 50] [--concurrency 3] [--latency-ms 150]
+
+Starts the stand-in GraphQL server (benchmarks/fireflies_standin.py) and
+recovers a backlog of --rows meetings the way the retry worker does after an
+outage, --concurrency rows at a time:
+
+  legacy     one new httpx client and one request per row (the old
+             _fetch_fireflies_transcript)
+  batched    FirefliesClient with the worker's read-ahead: each row that
+             finds nothing read ahead prefetches itself and the next
+             FIREFLIES_BATCH_SIZE - 1 rows in one aliased GraphQL request
+
+Also checks coalescing (the same id requested by several callers at once
+costs one request) and that an unknown id fails alone inside its batch.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("JOB_STORE_PATH", os.path.join(tempfile.mkdtemp(), "bench.sqlite3"))
+os.environ.setdefault("FIREFLIES_REQUESTS_PER_MINUTE", "0")
+
+import httpx  # noqa: E402
+
+from benchmarks.fireflies_standin import StandinServer, make_transcripts  # noqa: E402
+from fireflies_client import FirefliesClient, FIREFLIES_BATCH_SIZE  # noqa: E402
+
+LEGACY_QUERY = """
+query Transcript($transcriptId: String!) {
+  transcript(id: $transcriptId) { id title date duration sentences { speaker_name text } }
+}
+"""
+
+
+async def legacy_backlog(url: str, ids: list, concurrency: int) -> None:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(transcript_id: str) -> None:
+        async with sem:
+            async with httpx.AsyncClient() as client:
+                resp = await client.post(
+                    url,
+                    json={"query": LEGACY_QUERY, "variables": {"transcriptId": transcript_id}},
+                    headers={"Authorization": "Bearer standin"},
+                    timeout=60.0,
+                )
+                resp.raise_for_status()
+                assert resp.json()["data"]["transcript"]["id"] == transcript_id
+
+    await asyncio.gather(*(_one(i) for i in ids))
+
+
+async def batched_backlog(client: FirefliesClient, ids: list, concurrency: int) -> None:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(index: int, transcript_id: str) -> None:
+        async with sem:
+            if not client.is_pending(transcript_id):
+                client.prefetch(ids[index:index + FIREFLIES_BATCH_SIZE])
+            transcript = client.take_prefetched(transcript_id) or await client.fetch_transcript(transcript_id)
+            assert transcript["id"] == transcript_id
+
+    await asyncio.gather(*(_one(i, transcript_id) for i, transcript_id in enumerate(ids)))
+    client.discard(ids)
+
+
+async def run(args) -> None:
+    with StandinServer(make_transcripts(args.rows), latency_ms=args.latency_ms) as server:
+        ids = sorted(server.transcripts)
+
+        started = time.perf_counter()
+        await legacy_backlog(server.url, ids, args.concurrency)
+        legacy = {"requests": server.requests, "seconds": time.perf_counter() - started}
+
+        server.requests = 0
+        client = FirefliesClient(server.url, "standin")
+        started = time.perf_counter()
+        await batched_backlog(client, ids, args.concurrency)
+        batched = {"requests": server.requests, "seconds": time.perf_counter() - started}
+
+        server.requests = 0
+        same = await asyncio.gather(*(client.fetch_transcript(ids[0]) for _ in range(10)))
+        coalesced_requests = server.requests
+        assert all(t is same[0] for t in same)
+
+        outcome = await client.fetch_transcripts([ids[1], "missing-id", ids[2]])
+        assert isinstance(outcome["missing-id"], Exception) and outcome["missing-id"].kind == "not_found"
+        assert outcome[ids[1]]["id"] == ids[1] and outcome[ids[2]]["id"] == ids[2]
+        await client.close()
+
+    print(f"{args.rows} rows, concurrency {args.concurrency}, {args.latency_ms} ms per request, "
+          f"batch size {FIREFLIES_BATCH_SIZE}")
+    for label, stats in (("legacy", legacy), ("batched", batched)):
+        print(f"  {label:<8} requests {stats['requests']:4d}   {stats['seconds'] * 1000:8.1f} ms")
+    print(f"  10 concurrent fetches of one id: {coalesced_requests} request(s)")
+    print("  unknown id inside a batch: fails alone (not_found), neighbours resolve")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=3)
+    parser.add_argument("--latency-ms", type=int, default=150)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
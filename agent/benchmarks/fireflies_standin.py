@@ -0,0 +1,201 @@
+"""
+Local stand-in for the Fireflies GraphQL API.
+
+Run from the agent/ directory:
+
+    python benchmarks/fireflies_standin.py [--port 8765] [--transcripts 50] [--rpm 60] [--latency-ms 150]
+
+then point the agent at it:
+
+    FIREFLIES_API_URL=http://127.0.0.1:8765/graphql FIREFLY_API_KEY=standin python main.py
+
+It understands the queries fireflies_client.py sends (and the single-id
+`transcript(id: $transcriptId)` form): aliased `transcript(id: $idN)` fields,
+and `transcripts(limit, skip, fromDate)`. Behaves like Fireflies where it
+matters for the client:
+
+  - Bearer auth: a missing key is a 401
+  - more than --rpm requests in a rolling minute is a 429 with Retry-After
+    and a `too_many_requests` GraphQL error
+  - an unknown id is an `object_not_found` error whose path is that alias,
+    with the alias itself null; the other aliases still resolve
+  - each request takes --latency-ms, so batching shows up in wall time
+
+StandinServer can also be started in-process (see benchmarks/fireflies_batch.py);
+`requests` counts every request it answered.
+"""
+
+import re
+import json
+import time
+import random
+import argparse
+import threading
+from collections import deque
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_ALIAS_RE = re.compile(r"(\w+)\s*:\s*transcript\(id:\s*\$(\w+)\)")
+_SINGLE_RE = re.compile(r"(?<![:\w])\s*transcript\(id:\s*\$(\w+)\)")
+_SPEAKERS = ["Alice Mwangi", "Brian Otieno", "Carol Nakato", "David Kiprop"]
+
+
+def make_transcripts(count: int, sentences: int = 200, seed: int = 11) -> dict:
+    rng = random.Random(seed)
+    transcripts = {}
+    base_ms = int(time.time() * 1000) - count * 86_400_000
+    for i in range(count):
+        transcript_id = f"ff-{i:04d}"
+        transcripts[transcript_id] = {
+            "id": transcript_id,
+            "title": f"Stand-in meeting {i}",
+            "date": base_ms + i * 86_400_000,
+            "duration": round(rng.uniform(0.2, 1.5), 2),
+            "organizer_email": "ops@example.com",
+            "participants": _SPEAKERS[: rng.randint(2, 4)],
+            "transcript_url": f"https://app.fireflies.ai/view/{transcript_id}",
+            "summary": {
+                "overview": f"Overview of meeting {i}.",
+                "shorthand_bullet": "- point one\n- point two",
+                "action_items": "Alice to send the report\nBrian to follow up",
+                "keywords": ["budget", "rollout"],
+            },
+            "sentences": [
+                {"speaker_name": rng.choice(_SPEAKERS), "text": f"Sentence {n} of meeting {i}."}
+                for n in range(sentences)
+            ],
+        }
+    return transcripts
+
+
+class StandinServer:
+    """Threaded stand-in server; use as a context manager or start()/stop()."""
+
+    def __init__(self, transcripts: dict, port: int = 0, rpm: int = 0, latency_ms: int = 0,
+                 api_key: str = "standin"):
+        self.transcripts = transcripts
+        self.rpm = rpm
+        self.latency = latency_ms / 1000
+        self.api_key = api_key
+        self.requests = 0
+        self.rejected = 0
+        self._window = deque()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/graphql"
+
+    def start(self) -> "StandinServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _admit(self) -> float:
+        """0 when the request is within quota, else seconds until it would be."""
+        with self._lock:
+            self.requests += 1
+            if not self.rpm:
+                return 0.0
+            now = time.monotonic()
+            while self._window and self._window[0] <= now - 60:
+                self._window.popleft()
+            if len(self._window) >= self.rpm:
+                self.rejected += 1
+                return 60 - (now - self._window[0])
+            self._window.append(now)
+            return 0.0
+
+    def _resolve(self, body: dict) -> dict:
+        query = body.get("query") or ""
+        variables = body.get("variables") or {}
+        data, errors = {}, []
+        if "transcripts(" in query:
+            ordered = sorted(self.transcripts.values(), key=lambda t: t["date"], reverse=True)
+            if variables.get("fromDate"):
+                from_ms = datetime.fromisoformat(variables["fromDate"].replace("Z", "+00:00")).timestamp() * 1000
+                ordered = [t for t in ordered if t["date"] >= from_ms]
+            skip, limit = variables.get("skip") or 0, variables.get("limit") or 50
+            data["transcripts"] = [
+                {k: t[k] for k in ("id", "title", "date", "duration")} for t in ordered[skip:skip + limit]
+            ]
+            return {"data": data}
+        fields = _ALIAS_RE.findall(query) or [("transcript", name) for name in _SINGLE_RE.findall(query)]
+        for alias, variable in fields:
+            transcript = self.transcripts.get(variables.get(variable))
+            data[alias] = transcript
+            if transcript is None:
+                errors.append({
+                    "message": "Object not found",
+                    "path": [alias],
+                    "extensions": {"code": "object_not_found", "status": 404},
+                })
+        return {"data": data, **({"errors": errors} if errors else {})}
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, payload: dict, headers: dict = None):
+                raw = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+                if self.headers.get("Authorization") != f"Bearer {server.api_key}":
+                    return self._send(401, {"errors": [{"message": "Unauthorized",
+                                                        "extensions": {"code": "unauthorized"}}]})
+                wait = server._admit()
+                if wait:
+                    retry_ms = int((time.time() + wait) * 1000)
+                    return self._send(429, {"errors": [{
+                        "message": "Too many requests",
+                        "extensions": {"code": "too_many_requests", "metadata": {"retryAfter": retry_ms}},
+                    }]}, {"Retry-After": str(int(wait) + 1)})
+                if server.latency:
+                    time.sleep(server.latency)
+                self._send(200, server._resolve(body))
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--transcripts", type=int, default=50)
+    parser.add_argument("--rpm", type=int, default=60)
+    parser.add_argument("--latency-ms", type=int, default=150)
+    parser.add_argument("--api-key", default="standin")
+    args = parser.parse_args()
+
+    server = StandinServer(make_transcripts(args.transcripts), args.port, args.rpm, args.latency_ms, args.api_key)
+    print(f"Fireflies stand-in on {server.url} ({args.transcripts} transcripts, ids ff-0000..; key {args.api_key!r})")
+    try:
+        server.start()._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark: serial retry rows vs. the pipelined transcript/context prefetch.
+
+Run from the agent/ directory:
+
+    python benchmarks/retry_pipeline.py [--rows 6] [--transcript-ms 1500] [--context-ms 2000] [--claude-ms 4000]
+
+Runs main._process_retry_rows over --rows due Meeting Register rows with a
+retry window of one row (as after a provider outage, or with
+RETRY_ROW_CONCURRENCY=1). The network stages are stand-ins with fixed
+latency: the Meeting Register transcript snapshot (--transcript-ms), the
+/api/context load (--context-ms), and the agent run itself (--claude-ms,
+which loads the context first, as process_meeting_transcript does). The
+register patches are no-ops.
+
+  serial     RETRY_PIPELINE_DEPTH=0 and NOTION_CONTEXT_TTL_SECONDS=0:
+             transcript, context, run — one row after another
+  pipelined  the defaults: the next row's transcript loads while the current
+             row runs, and the context is cached and warmed between rows
+
+Prints total wall time and the average gap between one row's run ending and
+the next row's run starting.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("AGENT_DATA_DIR", tempfile.mkdtemp())
+os.environ["ENABLE_MEETING_LEASES"] = "false"
+
+
+def make_rows(n: int) -> list:
+    return [{"id": f"row-{i}", "externalMeetingId": f"ff-{i:04d}", "processingStatus": "Pending",
+             "retryCount": 0} for i in range(n)]
+
+
+async def run_once(args, depth: int, context_ttl: float) -> dict:
+    import main
+    import context_loader
+    from rate_limiter import AdaptiveConcurrency
+
+    main.RETRY_PIPELINE_DEPTH = depth
+    context_loader.NOTION_CONTEXT_TTL_SECONDS = context_ttl
+    context_loader.invalidate_notion_context()
+    main.retry_concurrency = AdaptiveConcurrency("bench", 1)
+    runs = []
+
+    async def snapshot(row_id):
+        await asyncio.sleep(args.transcript_ms / 1000)
+        return {"id": row_id, "title": row_id, "sentences": [{"speaker_name": "A", "text": "Hello."}]}
+
+    async def context():
+        await asyncio.sleep(args.context_ms / 1000)
+        return {"people": [], "projects": []}
+
+    async def agent_run(transcript, meeting_register_id=None, meeting_id=None, resume=False):
+        started = time.perf_counter()
+        await context_loader.fetch_notion_context()
+        await asyncio.sleep(args.claude_ms / 1000)
+        runs.append((started, time.perf_counter()))
+        return {"success": True, "created_note_id": f"note-{meeting_id}"}, False
+
+    async def patch(row_id, payload):
+        return None
+
+    async def write_through(*_):
+        return None
+
+    main._fetch_cached_transcript = snapshot
+    main._write_through_transcript = write_through
+    context_loader._fetch_notion_context = context
+    main._process_meeting_once = agent_run
+    main._patch_meeting_register = patch
+    main.transcript_cache.max_bytes = 0  # every row goes to the (stand-in) snapshot
+
+    started = time.perf_counter()
+    await main._process_retry_rows(make_rows(args.rows))
+    total = time.perf_counter() - started
+    runs.sort()
+    gaps = [runs[i + 1][0] - runs[i][1] for i in range(len(runs) - 1)]
+    return {"total": total, "gap": sum(gaps) / len(gaps) if gaps else 0.0, "runs": len(runs)}
+
+
+async def run(args) -> None:
+    serial = await run_once(args, depth=0, context_ttl=0)
+    pipelined = await run_once(args, depth=1, context_ttl=300)
+    print(f"{args.rows} rows, window 1: transcript {args.transcript_ms} ms, context {args.context_ms} ms, "
+          f"agent run {args.claude_ms} ms")
+    for label, stats in (("serial", serial), ("pipelined", pipelined)):
+        print(f"  {label:<10} total {stats['total']:6.2f} s   gap between runs {stats['gap'] * 1000:7.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=6)
+    parser.add_argument("--transcript-ms", type=int, default=1500)
+    parser.add_argument("--context-ms", type=int, default=2000)
+    parser.add_argument("--claude-ms", type=int, default=4000)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
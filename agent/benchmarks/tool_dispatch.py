@@ -0,0 +1,174 @@
+"""
+Benchmark: serial vs. concurrent, dependency-aware tool dispatch for one assistant turn.
+
+Run from the agent/ directory:
+
+    python benchmarks/tool_dispatch.py [--tasks 15] [--validator-ms 2500] [--notion-ms 600]
+
+Runs claude_agent.execute_tools over one tool-heavy turn: a meeting note,
+--tasks create_task calls, three subtasks, two EOS issues, two speaker
+aliases, and the meeting register. execute_tool runs for real; the validator
+is a stand-in whose Phase 2 check takes --validator-ms, and the bridge is a
+local stand-in in which every create POST takes --notion-ms.
+
+  serial      AGENT_TOOL_CONCURRENCY=1: the calls one after another, as the
+              agent loop used to run them
+  concurrent  the default AGENT_TOOL_CONCURRENCY
+
+Checks that results come back in call order, that every subtask POST starts
+after the last task POST finished, and that the register and the issues
+start after the meeting note was created.
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import threading
+from types import SimpleNamespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("AGENT_DATA_DIR", tempfile.mkdtemp())
+os.environ.setdefault("ANTHROPIC_API_KEY", "benchmark")
+os.environ["NOTION_REQUESTS_PER_SECOND"] = "0"
+
+_ENDPOINT_TOOLS = {
+    "/api/notes": "create_meeting_note", "/api/tasks": "create_task",
+    "/api/eos-issues": "create_eos_issue", "/api/speaker-aliases": "create_speaker_alias",
+    "/api/meeting-register": "create_meeting_register",
+}
+
+
+class BridgeStandin:
+    """Create endpoints of the Notion bridge; every POST sleeps a fixed latency and records its span."""
+
+    def __init__(self, notion_ms: int):
+        self.latency = notion_ms / 1000
+        self.spans = []  # (tool, started, finished)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+
+    @property
+    def base(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                started = time.perf_counter()
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+                time.sleep(standin.latency)
+                tool = _ENDPOINT_TOOLS.get(self.path, "unknown")
+                if tool == "create_task" and body.get("parentTaskId"):
+                    tool = "create_subtask"
+                with standin._lock:
+                    standin.spans.append((tool, started, time.perf_counter()))
+                    record_id = f"{tool}-{len(standin.spans)}"
+                raw = json.dumps({"success": True, "id": record_id}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+        return Handler
+
+
+class ValidatorStandin:
+    """OutputValidator.validate with a fixed Phase 2 latency and no corrections."""
+
+    def __init__(self, validator_ms: int):
+        self.latency = validator_ms / 1000
+
+    async def validate(self, tool_name, tool_input, context_section):
+        await asyncio.sleep(self.latency)
+        return {"payload": tool_input, "corrections": [], "confidence": 0.98, "passed": True}
+
+
+def make_turn(tasks: int) -> list:
+    calls = [("create_meeting_note", {"title": "L10 Meeting Notes — Mar 02, 2026", "date": "2026-03-02"})]
+    calls += [("create_task", {"name": f"Task {i}", "description": "d", "definition_of_done": "done"})
+              for i in range(tasks)]
+    calls += [("create_subtask", {"name": f"Subtask {i}", "parent_task_id": "task-parent", "description": "d",
+                                  "definition_of_done": "done"}) for i in range(3)]
+    calls += [("create_eos_issue", {"title": f"Issue {i}", "sourceMeetingIds": []}) for i in range(2)]
+    calls += [("create_speaker_alias", {"alias": f"Speaker {i}"}) for i in range(2)]
+    calls += [("create_meeting_register", {"title": "L10 — Mar 02, 2026", "meetingNoteIds": []})]
+    return [SimpleNamespace(id=f"toolu_{i:02d}", name=name, input=payload) for i, (name, payload) in enumerate(calls)]
+
+
+def check_order(spans: list, outputs: list, turn: list) -> None:
+    for tool_use, output in zip(turn, outputs):
+        label = tool_use.input.get("title") or tool_use.input.get("name") or tool_use.input.get("alias")
+        expected = "subtask" if tool_use.name == "create_subtask" else label
+        assert expected and expected in output, (tool_use.name, output)
+
+    def first_start(tool):
+        return min(s for t, s, _ in spans if t == tool)
+
+    def last_end(tool):
+        return max(e for t, _, e in spans if t == tool)
+
+    assert first_start("create_subtask") >= last_end("create_task")
+    assert first_start("create_meeting_register") >= last_end("create_meeting_note")
+    assert first_start("create_eos_issue") >= last_end("create_meeting_note")
+
+
+async def run_once(args, concurrency: int) -> float:
+    import claude_agent
+
+    claude_agent.AGENT_TOOL_CONCURRENCY = concurrency
+    turn = make_turn(args.tasks)
+    with BridgeStandin(args.notion_ms) as standin:
+        claude_agent.NOTION_API_BASE = standin.base
+        started = time.perf_counter()
+        outputs = await claude_agent.execute_tools(
+            turn, {}, validator=ValidatorStandin(args.validator_ms), context_section="KNOWN DATA",
+            meeting_register_id="register-1", errors=[],
+        )
+        elapsed = time.perf_counter() - started
+        check_order(standin.spans, outputs, turn)
+    return elapsed
+
+
+async def run(args) -> None:
+    import claude_agent
+
+    concurrent_limit = claude_agent.AGENT_TOOL_CONCURRENCY
+    serial = await run_once(args, 1)
+    concurrent = await run_once(args, concurrent_limit)
+    calls = len(make_turn(args.tasks))
+    print(f"{calls} tool calls in one turn: validator {args.validator_ms} ms, Notion POST {args.notion_ms} ms")
+    print(f"  serial      {serial:6.2f} s")
+    print(f"  concurrent  {concurrent:6.2f} s   (limit {concurrent_limit}, {serial / concurrent:.1f}x)")
+    print("  results in call order; subtasks after tasks, register and issues after the note")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=15)
+    parser.add_argument("--validator-ms", type=int, default=2500)
+    parser.add_argument("--notion-ms", type=int, default=600)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Benchmark: single-request transcript append vs. paged, concurrent, resumable pages.
+
+Run from the agent/ directory:
+
+    python benchmarks/transcript_append.py [--sentences 30000] [--notion-ms 600] [--fail-every 4]
+
+Starts a stand-in for the bridge's transcript endpoints in which every Notion
+call (page create, children list, 100-block append, block delete) takes
+--notion-ms, then appends a stand-in transcript of --sentences sentences:
+
+  single     POST /api/notes/{id}/transcript with every sentence (the old
+             _append_transcript_to_note); the bridge appends 100 blocks at a time
+  paged      transcript_append.TranscriptAppender: one POST .../transcript/pages,
+             then one PUT .../transcript/parts/{id} per page,
+             TRANSCRIPT_APPEND_CONCURRENCY at a time
+  resumed    the same with every --fail-every'th part write failing once (503);
+             a first run with one retry round stops short, a second run sends
+             only the pages that were not acknowledged
+
+Prints wall time, Notion calls, and the longest single bridge request (what
+the old 120s timeout was measured against), and checks that every part ends
+with exactly its own sentences (no duplicates from retried parts).
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("AGENT_DATA_DIR", tempfile.mkdtemp())
+os.environ["NOTION_REQUESTS_PER_SECOND"] = "0"
+os.environ.setdefault("TRANSCRIPT_APPEND_RETRY_SECONDS", "0.05")
+
+
+class BridgeStandin:
+    """Transcript endpoints of the Notion bridge; each Notion call sleeps a fixed latency."""
+
+    def __init__(self, notion_ms: int, fail_every: int = 0):
+        self.latency = notion_ms / 1000
+        self.fail_every = fail_every
+        self.notion_calls = 0
+        self.part_writes = 0
+        self.longest = 0.0  # slowest single request, seconds
+        self.parts = {}  # part id -> sentences currently under it
+        self._failed = set()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+
+    @property
+    def base(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def notion(self, calls: int = 1) -> None:
+        with self._lock:
+            self.notion_calls += calls
+        time.sleep(self.latency * calls)
+
+    @staticmethod
+    def blocks_for(sentences: list) -> int:
+        # 30 sentences per paragraph, split at 1900 characters (buildSentenceBlocks)
+        blocks = 0
+        for i in range(0, len(sentences), 30):
+            content = "\n".join(s.get("text", "") for s in sentences[i:i + 30])
+            blocks += -(-len(content) // 1900)
+        return blocks
+
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, payload: dict):
+                with standin._lock:
+                    standin.longest = max(standin.longest, time.perf_counter() - self._started)
+                raw = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def _body(self) -> dict:
+                self._started = time.perf_counter()
+                return json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+
+            def do_POST(self):
+                body = self._body()
+                if self.path.endswith("/transcript/pages"):
+                    parts = body.get("parts") or []
+                    standin.notion(1 + -(-(len(parts) + 3) // 100))
+                    ids = [f"part-{len(standin.parts) + i}" for i in range(len(parts))]
+                    for part_id in ids:
+                        standin.parts[part_id] = []
+                    return self._send(200, {"success": True, "child_page_id": "child-1", "part_ids": ids})
+                if self.path.endswith("/transcript"):
+                    sentences = body.get("sentences") or []
+                    standin.notion(1 + -(-(standin.blocks_for(sentences) + 3) // 100))
+                    return self._send(200, {"success": True, "child_page_id": "child-0"})
+                self._send(404, {"error": "Not found"})
+
+            def do_PUT(self):
+                part_id = self.path.rsplit("/", 1)[-1]
+                body = self._body()
+                with standin._lock:
+                    standin.part_writes += 1
+                    index = int(part_id.split("-")[1])
+                    fail = (standin.fail_every and index % standin.fail_every == 0
+                            and part_id not in standin._failed)
+                    if fail:
+                        standin._failed.add(part_id)
+                if body.get("replace", True):
+                    # List the part's children, then delete (one call per block) what a failed attempt left
+                    standin.notion(1 + standin.blocks_for(standin.parts.get(part_id, [])))
+                if fail:
+                    # Half the part was written before the failure
+                    standin.parts[part_id] = body["sentences"][: len(body["sentences"]) // 2]
+                    return self._send(503, {"error": "service_unavailable: Notion is overloaded"})
+                standin.notion(-(-standin.blocks_for(body["sentences"]) // 100))
+                standin.parts[part_id] = body["sentences"]
+                self._send(200, {"success": True, "blocks_written": standin.blocks_for(body["sentences"])})
+
+        return Handler
+
+
+def make_transcript(n: int) -> dict:
+    return {
+        "id": "ff-append",
+        "transcript_url": "https://app.fireflies.ai/view/ff-append",
+        "sentences": [{"speaker_name": f"Speaker {i % 5}", "text": f"Sentence {i} " + "words " * 12,
+                       "start_time": i * 4.0} for i in range(n)],
+    }
+
+
+async def single(base: str, transcript: dict) -> None:
+    import httpx
+
+    async with httpx.AsyncClient() as client:
+        resp = await client.post(f"{base}/api/notes/note-0/transcript", json=transcript, timeout=600)
+        resp.raise_for_status()
+
+
+async def run(args) -> None:
+    import transcript_append
+    from compact_transcript import CompactTranscript
+
+    transcript = make_transcript(args.sentences)
+    compact = CompactTranscript.from_sentences(transcript["sentences"])
+    page = transcript_append.TRANSCRIPT_APPEND_PAGE_SENTENCES
+    rows = []
+
+    with BridgeStandin(args.notion_ms) as standin:
+        started = time.perf_counter()
+        await single(standin.base, transcript)
+        rows.append(("single", time.perf_counter() - started, standin.notion_calls, standin.longest, "1 request"))
+
+    with BridgeStandin(args.notion_ms) as standin:
+        transcript_append.NOTION_API_BASE = standin.base
+        started = time.perf_counter()
+        await transcript_append.transcript_appender.append("note-1", compact, transcript["transcript_url"])
+        rows.append(("paged", time.perf_counter() - started, standin.notion_calls, standin.longest,
+                     f"{standin.part_writes} part writes"))
+
+    with BridgeStandin(args.notion_ms, args.fail_every) as standin:
+        transcript_append.NOTION_API_BASE = standin.base
+        transcript_append.TRANSCRIPT_APPEND_ROUNDS = 1
+        started = time.perf_counter()
+        try:
+            await transcript_append.transcript_appender.append("note-2", compact, transcript["transcript_url"])
+        except Exception as e:
+            record = transcript_append.transcript_appender.get("note-2")
+            first = f"run 1 stopped ({type(e).__name__}) with {len(record['acked'])}/{record['total_pages']} pages acked"
+        writes_before = standin.part_writes
+        record = await transcript_append.transcript_appender.append("note-2", compact, transcript["transcript_url"])
+        assert record["status"] == "completed"
+        rows.append(("resumed", time.perf_counter() - started, standin.notion_calls, standin.longest,
+                     f"{first}; run 2 wrote {standin.part_writes - writes_before} part(s)"))
+        for i, part_id in enumerate(record["part_ids"]):
+            expected = transcript["sentences"][i * page:(i + 1) * page]
+            assert [s["text"] for s in standin.parts[part_id]] == [s["text"] for s in expected], part_id
+
+    print(f"{args.sentences} sentences, {args.notion_ms} ms per Notion call, page {page} sentences, "
+          f"concurrency {transcript_append.TRANSCRIPT_APPEND_CONCURRENCY}")
+    for label, seconds, calls, longest, detail in rows:
+        print(f"  {label:<8} {seconds:6.2f} s   Notion calls {calls:3d}   longest request {longest:5.2f} s   {detail}")
+    print("  every part holds exactly its own sentences after the resume")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sentences", type=int, default=30000)
+    parser.add_argument("--notion-ms", type=int, default=600)
+    parser.add_argument("--fail-every", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
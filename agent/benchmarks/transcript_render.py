@@ -0,0 +1,122 @@
+"""
+Benchmark: per-stage transcript rendering vs. the render-once CompactTranscript.
+
+Run from the agent/ directory:
+
+    python benchmarks/transcript_render.py [--sentences 10000] [--repeat 5]
+
+The "legacy" path reproduces what the pipeline did before CompactTranscript:
+one f-string per line for the token estimate + prompt, again per line in
+chunk_transcript(), and a list of dicts for the transcript-append payload.
+Reports best wall time and tracemalloc peak for each path.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from compact_transcript import CompactTranscript  # noqa: E402
+from long_meeting_processor import MAX_TOKENS_PER_CHUNK, estimate_tokens  # noqa: E402
+
+SPEAKERS = ["Ivan Kiiza", "Sarah Namutebi", "Peter Okello", "Grace Achieng", "Daniel Mugisha", None]
+WORDS = ("revenue stabex depot tanker fleet forecast margin rollout audit supplier invoice target "
+         "quarter rock issue pricing station diesel contract review follow up blocker").split()
+
+
+def make_sentences(n: int) -> list:
+    rng = random.Random(42)
+    return [
+        {
+            "speaker_name": rng.choice(SPEAKERS),
+            "text": " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 40))),
+            "start_time": round(i * 4.2, 2),
+        }
+        for i in range(n)
+    ]
+
+
+def legacy_pipeline(sentences: list):
+    full_text = "\n".join(f"**{s.get('speaker_name') or 'Speaker'}**: {s.get('text', '')}" for s in sentences)
+    tokens = estimate_tokens(full_text)
+
+    chunks, current_lines, current_tokens = [], [], 0
+    for s in sentences:
+        line = f"**{s.get('speaker_name') or 'Speaker'}**: {s.get('text', '')}"
+        line_tokens = estimate_tokens(line)
+        if current_tokens + line_tokens > MAX_TOKENS_PER_CHUNK and current_lines:
+            chunks.append("\n".join(current_lines))
+            current_lines, current_tokens = [], 0
+        current_lines.append(line)
+        current_tokens += line_tokens
+    if current_lines:
+        chunks.append("\n".join(current_lines))
+
+    payload = json.dumps({
+        "sentences": [
+            {"speaker_name": s.get("speaker_name"), "start_time": s.get("start_time"), "text": s.get("text", "")}
+            for s in sentences
+        ],
+        "transcript_url": None,
+    }).encode("utf-8")
+    return tokens, full_text, chunks, len(payload)
+
+
+def compact_pipeline(sentences: list):
+    transcript = CompactTranscript.from_sentences(sentences)
+    tokens = transcript.estimated_tokens
+    chunks = transcript.chunks(MAX_TOKENS_PER_CHUNK)
+    payload_bytes = sum(len(batch) for batch in transcript.iter_append_json())
+    return tokens, transcript.text, chunks, payload_bytes
+
+
+def measure(fn, sentences: list, repeat: int) -> dict:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(sentences)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn(sentences)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sentences", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sentences = make_sentences(args.sentences)
+    legacy_tokens, legacy_text, legacy_chunks, _ = legacy_pipeline(sentences)
+    compact_tokens, compact_text, compact_chunks, _ = compact_pipeline(sentences)
+    assert legacy_text == compact_text, "rendered transcript differs"
+    assert legacy_chunks == compact_chunks, "chunk boundaries differ"
+    assert legacy_tokens == compact_tokens
+    batches = b",".join(CompactTranscript.from_sentences(sentences).iter_append_json())
+    assert json.loads(b"[" + batches + b"]") == [
+        {"speaker_name": s.get("speaker_name"), "start_time": s.get("start_time"), "text": s.get("text", "")}
+        for s in sentences
+    ], "transcript-append sentences differ"
+
+    legacy = measure(legacy_pipeline, sentences, args.repeat)
+    compact = measure(compact_pipeline, sentences, args.repeat)
+
+    print(f"{args.sentences} sentences, {compact_tokens} estimated tokens, {len(compact_chunks)} chunks")
+    for label, stats in (("legacy", legacy), ("compact", compact)):
+        print(f"  {label:<8} {stats['seconds'] * 1000:8.1f} ms   peak {stats['peak_bytes'] / 1_048_576:7.2f} MiB")
+    print(
+        f"  speedup {legacy['seconds'] / compact['seconds']:.2f}x, "
+        f"peak memory {compact['peak_bytes'] / legacy['peak_bytes']:.0%} of legacy"
+    )
+
+
+if __name__ == "__main__":
+    main()
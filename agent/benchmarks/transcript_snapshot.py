@@ -0,0 +1,151 @@
+"""
+Benchmark: legacy JSON transcript snapshots vs. the compact snapshot format.
+
+Run from the agent/ directory:
+
+    python benchmarks/transcript_snapshot.py [--sentences 1500,4000,10000] [--speakers 8]
+
+For stand-in transcripts of each size, compares what _store_cached_transcript
+uploads and what the retry path parses:
+
+  legacy     the raw transcript JSON the bridge used to chunk into Notion
+  gzip       transcript_snapshot.encode_snapshot with the gzip codec
+  zstd       the same with zstd (only when `zstandard` is installed)
+
+Columns: upload size, Notion code blocks (TRANSCRIPT_CACHE_CHUNK_SIZE chars
+each) and append calls (100 blocks per call) the bridge needs, encode time,
+and decode time (json.loads for legacy, decode_snapshot otherwise).
+
+Before timing, it checks round trips: speakerless sentences, unicode,
+raw_start_time, empty transcripts, legacy pass-through, and that unknown
+versions and corrupt data raise SnapshotFormatError.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transcript_snapshot import (  # noqa: E402
+    SnapshotFormatError, decode_snapshot, encode_snapshot, _zstd,
+)
+
+CHUNK_SIZE = 1800  # notion-api-bridge.js TRANSCRIPT_CACHE_CHUNK_SIZE
+BLOCKS_PER_APPEND = 100
+_WORDS = ("budget rollout pipeline quarter hiring target revenue customer churn pricing review action "
+          "follow up deadline vendor contract forecast margin onboarding support escalation").split()
+
+
+def make_transcript(sentences: int, speakers: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    names = [f"Speaker {chr(65 + i)} Nakato" for i in range(speakers)]
+    start = 0.0
+    rows = []
+    for _ in range(sentences):
+        start += round(rng.uniform(1.5, 9.0), 2)
+        rows.append({
+            "speaker_name": rng.choice(names),
+            "text": " ".join(rng.choice(_WORDS) for _ in range(rng.randint(6, 28))).capitalize() + ".",
+            "start_time": round(start, 2),
+        })
+    return {
+        "id": f"ff-{sentences}",
+        "title": f"Board meeting ({sentences} sentences)",
+        "date": "2026-03-02T09:00:00+00:00",
+        "duration": round(start / 60, 1),
+        "organizer_email": "ops@example.com",
+        "participants": names,
+        "transcript_url": "https://app.fireflies.ai/view/ff",
+        "summary": {"overview": "Quarterly review.", "action_items": "Send the report", "keywords": ["budget"]},
+        "sentences": rows,
+    }
+
+
+def check_round_trips(codecs: list) -> None:
+    tricky = {
+        "id": "ff-edge",
+        "title": "Ünïcödé — 会议",
+        "summary": None,
+        "sentences": [
+            {"speaker_name": "Zoë", "text": "Ça va? 👍", "start_time": 0.5},
+            {"speaker_name": None, "text": "(crosstalk)", "start_time": None},
+            {"speaker_name": "", "text": "", "raw_start_time": 3.25},
+            {"speaker_name": "Zoë", "text": "Again", "start_time": 4},
+        ],
+    }
+    expected = [
+        {"speaker_name": "Zoë", "text": "Ça va? 👍", "start_time": 0.5},
+        {"speaker_name": None, "text": "(crosstalk)", "start_time": None},
+        {"speaker_name": None, "text": "", "start_time": 3.25},
+        {"speaker_name": "Zoë", "text": "Again", "start_time": 4},
+    ]
+    for codec in codecs:
+        decoded = decode_snapshot(json.loads(json.dumps(encode_snapshot(tricky, codec))))
+        assert decoded["sentences"] == expected, decoded["sentences"]
+        assert {k: v for k, v in decoded.items() if k != "sentences"} == \
+            {k: v for k, v in tricky.items() if k != "sentences"}
+        empty = decode_snapshot(encode_snapshot({"id": "ff-empty", "sentences": []}, codec))
+        assert empty == {"id": "ff-empty", "sentences": []}
+        full = make_transcript(300, 4)
+        assert decode_snapshot(encode_snapshot(full, codec)) == full
+
+    legacy = make_transcript(5, 2)
+    assert decode_snapshot(legacy) is legacy
+
+    envelope = encode_snapshot(tricky, codecs[0])
+    for broken in ({**envelope, "version": 2}, {**envelope, "data": envelope["data"][:-12]},
+                   {**envelope, "codec": "lz4"}, {**envelope, "sentence_count": 9}):
+        try:
+            decode_snapshot(broken)
+        except SnapshotFormatError:
+            continue
+        raise AssertionError(f"decode_snapshot accepted a broken envelope: {sorted(broken)}")
+
+
+def _timed(fn, repeat: int = 3):
+    best, result = math.inf, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sentences", default="1500,4000,10000")
+    parser.add_argument("--speakers", type=int, default=8)
+    args = parser.parse_args()
+
+    codecs = ["gzip"] + (["zstd"] if _zstd else [])
+    check_round_trips(codecs)
+    print(f"round trips ok ({', '.join(codecs)}){'' if _zstd else '; zstandard not installed, zstd skipped'}")
+
+    for count in (int(n) for n in args.sentences.split(",")):
+        transcript = make_transcript(count, args.speakers)
+        print(f"\n{count} sentences, {args.speakers} speakers")
+        rows = []
+        body, encode_s = _timed(lambda: json.dumps(transcript))
+        _, decode_s = _timed(lambda: json.loads(body))
+        rows.append(("legacy", len(body), encode_s, decode_s))
+        for codec in codecs:
+            envelope, encode_s = _timed(lambda: encode_snapshot(transcript, codec))
+            body = json.dumps(envelope)
+            decoded, decode_s = _timed(lambda: decode_snapshot(json.loads(body)))
+            assert decoded == transcript
+            rows.append((codec, len(body), encode_s, decode_s))
+        legacy_size = rows[0][1]
+        for label, size, encode_s, decode_s in rows:
+            blocks = math.ceil(size / CHUNK_SIZE)
+            print(f"  {label:<7} {size / 1024:8.1f} KiB ({legacy_size / size:4.1f}x smaller)  "
+                  f"blocks {blocks:4d}  appends {math.ceil((blocks + 4) / BLOCKS_PER_APPEND):3d}  "
+                  f"encode {encode_s * 1000:6.1f} ms  decode {decode_s * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
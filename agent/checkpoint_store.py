@@ -0,0 +1,117 @@
+"""
+Checkpoint Store — Resume point for the agentic loop (SQLite, shared job store DB).
+
+After every iteration whose tool calls all succeeded, process_meeting_transcript
+saves the conversation so far: the message history, the exact system prompt
+and Notion context it ran with, created note/record ids, token usage and
+validator totals. When the durable retry worker picks the meeting up again,
+the loop continues from the last checkpointed iteration instead of resending
+the transcript and repeating every Claude, validator and Notion call.
+
+  - the first user message (prompt + transcript, the bulky part), the system
+    prompt and the Notion context are written once per run; later checkpoints
+    only rewrite the tail of the conversation. A run that does not resume
+    discards the previous run's row first, so these never mix across runs
+  - the system prompt is reused verbatim so the prompt cache still hits
+  - iterations with a tool failure are never checkpointed: resuming must
+    replay the failed write, not skip past it
+  - a successful run deletes its checkpoint; abandoned ones expire after
+    CHECKPOINT_TTL_HOURS
+"""
+
+import os
+import json
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, List, Optional
+
+from job_store import get_connection
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_TTL_HOURS = int(os.getenv("CHECKPOINT_TTL_HOURS", "168"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS agent_checkpoints (
+    meeting_id        TEXT PRIMARY KEY,
+    iteration         INTEGER NOT NULL,
+    model             TEXT,
+    processing_method TEXT,
+    system_prompt     TEXT NOT NULL,
+    context_section   TEXT,
+    prompt            TEXT NOT NULL,
+    messages_json     TEXT NOT NULL,
+    state_json        TEXT NOT NULL,
+    updated_at        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_checkpoints_updated ON agent_checkpoints(updated_at);
+"""
+
+
+def _jsonable_content(content: Any) -> Any:
+    """Anthropic content blocks → plain dicts that can be sent back to the API."""
+    if isinstance(content, list):
+        return [
+            block.model_dump(exclude_none=True) if hasattr(block, "model_dump") else block
+            for block in content
+        ]
+    return content
+
+
+class CheckpointStore:
+    """Latest agentic-loop checkpoint per meeting id."""
+
+    def __init__(self, conn=None):
+        self.conn = conn or get_connection()
+        self.conn.executescript(_SCHEMA)
+
+    def save(self, meeting_id: str, iteration: int, messages: List[Dict[str, Any]], *, model: str,
+             processing_method: str, system_prompt: str, context_section: str, state: Dict[str, Any]) -> None:
+        """Record that `iteration` iterations have completed cleanly."""
+        self.conn.execute(
+            """
+            INSERT INTO agent_checkpoints (meeting_id, iteration, model, processing_method, system_prompt,
+                                           context_section, prompt, messages_json, state_json, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(meeting_id) DO UPDATE SET
+                iteration = excluded.iteration,
+                model = excluded.model,
+                processing_method = excluded.processing_method,
+                messages_json = excluded.messages_json,
+                state_json = excluded.state_json,
+                updated_at = excluded.updated_at
+            """,
+            (
+                meeting_id, iteration, model, processing_method, system_prompt, context_section,
+                messages[0]["content"],
+                json.dumps([{"role": m["role"], "content": _jsonable_content(m["content"])} for m in messages[1:]],
+                           default=str),
+                json.dumps(state, default=str),
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+
+    def load(self, meeting_id: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT * FROM agent_checkpoints WHERE meeting_id = ?", (meeting_id,)).fetchone()
+        if row is None:
+            return None
+        return {
+            "iteration": row["iteration"],
+            "model": row["model"],
+            "processing_method": row["processing_method"],
+            "system_prompt": row["system_prompt"],
+            "context_section": row["context_section"] or "",
+            "messages": [{"role": "user", "content": row["prompt"]}] + json.loads(row["messages_json"]),
+            "state": json.loads(row["state_json"]),
+            "updated_at": row["updated_at"],
+        }
+
+    def discard(self, meeting_id: str) -> None:
+        self.conn.execute("DELETE FROM agent_checkpoints WHERE meeting_id = ?", (meeting_id,))
+
+    def evict_expired(self) -> int:
+        cutoff = (datetime.now(timezone.utc) - timedelta(hours=CHECKPOINT_TTL_HOURS)).isoformat()
+        return self.conn.execute("DELETE FROM agent_checkpoints WHERE updated_at < ?", (cutoff,)).rowcount
+
+
+checkpoint_store = CheckpointStore()
@@ -0,0 +1,240 @@
+"""
+Circuit Breaker — Per-provider outage state (SQLite, shared job store DB).
+
+Replaces the in-memory provider hold dict. One breaker per provider
+(anthropic, fireflies, notion), persisted so a redeploy during a hold does
+not send the queue straight back into the same failure:
+
+  closed     calls flow; nothing is stored
+  open       calls fail fast with CircuitOpenError until `open_until`
+  half_open  `open_until` has passed: exactly one call (the probe) is let
+             through and everything else stays held until it reports back
+             (at most BREAKER_PROBE_TIMEOUT_SECONDS). If it succeeds the
+             breaker closes; if it fails the breaker reopens for a longer
+             window
+
+A rate limit alone does not trip a breaker: the retry classifier counts
+rate-limited failures per provider (record_rate_limit) and treats them as an
+outage only after BREAKER_RATE_LIMIT_TRIPS in a row with no successful call
+in between. Until then each one is an ordinary retry. Likewise a dependency
+that is hard down (connection failures, timeouts, 502/503/504) trips its
+breaker after BREAKER_FAILURE_TRIPS such failures in a row (record_failure).
+
+The open window starts at BREAKER_MIN_OPEN_SECONDS and doubles with every
+consecutive failed probe, capped by the classifier's cooldown for the error
+and by BREAKER_MAX_OPEN_SECONDS, so a recovered provider is noticed within
+one probe interval. A provider-supplied retry-after always wins.
+
+Call paths consult the breaker directly: AnthropicBudget.create (every Claude
+call), the Notion bridge client's request hook, and the Fireflies fetches.
+"""
+
+import os
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, List, Optional
+
+from job_store import get_connection
+from errors import CircuitOpenError  # noqa: F401 — re-exported for callers of check()
+
+logger = logging.getLogger(__name__)
+
+BREAKER_MIN_OPEN_SECONDS = int(os.getenv("BREAKER_MIN_OPEN_SECONDS", "60"))
+BREAKER_MAX_OPEN_SECONDS = int(os.getenv("BREAKER_MAX_OPEN_SECONDS", "1800"))
+BREAKER_PROBE_TIMEOUT_SECONDS = int(os.getenv("BREAKER_PROBE_TIMEOUT_SECONDS", "300"))
+# Consecutive rate-limited failures (no success in between) that count as a sustained limit
+BREAKER_RATE_LIMIT_TRIPS = max(1, int(os.getenv("BREAKER_RATE_LIMIT_TRIPS", "3")))
+# Consecutive network/overloaded failures (no success in between) that count as the provider being down
+BREAKER_FAILURE_TRIPS = max(1, int(os.getenv("BREAKER_FAILURE_TRIPS", "5")))
+
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS circuit_breakers (
+    provider      TEXT PRIMARY KEY,
+    state         TEXT NOT NULL,
+    code          TEXT NOT NULL,
+    message       TEXT,
+    open_until    TEXT NOT NULL,
+    trips         INTEGER NOT NULL DEFAULT 1,
+    release_slots INTEGER NOT NULL DEFAULT 0,
+    updated_at    TEXT NOT NULL
+);
+"""
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class CircuitBreakers:
+    """Breaker state for every provider, cached in memory and written through to SQLite."""
+
+    def __init__(self, conn=None):
+        self.conn = conn or get_connection()
+        self.conn.executescript(_SCHEMA)
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self._rate_limited: Dict[str, int] = {}  # provider -> consecutive rate-limited failures (in memory)
+        self._failing: Dict[str, int] = {}  # provider -> consecutive network/overloaded failures (in memory)
+        for row in self.conn.execute("SELECT * FROM circuit_breakers"):
+            self._states[row["provider"]] = self._from_row(row)
+        if self._states:
+            restored = ", ".join(f"{name}={state['state']}" for name, state in self._states.items())
+            logger.warning(f"Restored circuit breakers: {restored}")
+
+    @staticmethod
+    def _from_row(row) -> Dict[str, Any]:
+        open_until = datetime.fromisoformat(row["open_until"])
+        return {
+            "provider": row["provider"],
+            "state": row["state"],
+            "code": row["code"],
+            "message": row["message"] or "",
+            "until_dt": open_until,
+            "until_iso": open_until.isoformat(),
+            "trips": row["trips"],
+            "release_slots": row["release_slots"],
+        }
+
+    def _save(self, state: Dict[str, Any]) -> None:
+        self.conn.execute(
+            """
+            INSERT INTO circuit_breakers (provider, state, code, message, open_until, trips,
+                                          release_slots, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(provider) DO UPDATE SET
+                state = excluded.state, code = excluded.code, message = excluded.message,
+                open_until = excluded.open_until, trips = excluded.trips,
+                release_slots = excluded.release_slots, updated_at = excluded.updated_at
+            """,
+            (
+                state["provider"], state["state"], state["code"], state["message"], state["until_iso"],
+                state["trips"], state["release_slots"], _now().isoformat(),
+            ),
+        )
+
+    def save_release_slots(self, provider: str) -> None:
+        state = self._states.get(provider)
+        if state is not None:
+            self._save(state)
+
+    # ── transitions ──
+    def trip(self, provider: str, code: str, message: str, retry_after: Optional[datetime] = None,
+             max_open_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """Open (or keep open) the provider's breaker after a provider-wide failure."""
+        now = _now()
+        existing = self._states.get(provider)
+        if existing and existing["state"] == OPEN and existing["until_dt"] > now:
+            # Another call failed inside the same window; keep it, only extend for a later retry-after
+            if retry_after and retry_after > existing["until_dt"]:
+                existing.update(until_dt=retry_after, until_iso=retry_after.isoformat(), code=code, message=message)
+                self._save(existing)
+            return existing
+
+        trips = existing["trips"] + 1 if existing else 1
+        open_seconds = BREAKER_MIN_OPEN_SECONDS * 2 ** (trips - 1)
+        if max_open_seconds:
+            open_seconds = min(open_seconds, max_open_seconds)
+        until = retry_after or now + timedelta(seconds=min(open_seconds, BREAKER_MAX_OPEN_SECONDS))
+        state = {
+            "provider": provider,
+            "state": OPEN,
+            "code": code,
+            "message": message,
+            "until_dt": until,
+            "until_iso": until.isoformat(),
+            "trips": trips,
+            "release_slots": 0,
+        }
+        self._states[provider] = state
+        self._save(state)
+        logger.warning(f"Circuit breaker [{provider}] open until {state['until_iso']} ({code}, trip {trips})")
+        return state
+
+    def record_rate_limit(self, provider: str) -> bool:
+        """Count a rate-limited failure; True once the limit is sustained (BREAKER_RATE_LIMIT_TRIPS in a row)."""
+        count = self._rate_limited.get(provider, 0) + 1
+        self._rate_limited[provider] = count
+        return count >= BREAKER_RATE_LIMIT_TRIPS
+
+    def record_failure(self, provider: str) -> bool:
+        """Count a network/overloaded failure; True once the provider looks down (BREAKER_FAILURE_TRIPS in a row)."""
+        count = self._failing.get(provider, 0) + 1
+        self._failing[provider] = count
+        return count >= BREAKER_FAILURE_TRIPS
+
+    def allow(self, provider: str) -> bool:
+        """True if a call to the provider may go out now. Grants the single half-open probe."""
+        state = self._states.get(provider)
+        if state is None:
+            return True
+        now = _now()
+        if now < state["until_dt"]:
+            return False
+        # Hold everything else until the probe reports back (or its deadline passes)
+        probe_until = now + timedelta(seconds=BREAKER_PROBE_TIMEOUT_SECONDS)
+        state.update(state=HALF_OPEN, until_dt=probe_until, until_iso=probe_until.isoformat())
+        self._save(state)
+        logger.info(f"Circuit breaker [{provider}] half-open: letting one probe call through")
+        return True
+
+    def check(self, provider: str) -> None:
+        """Raise CircuitOpenError unless a call to the provider may go out now."""
+        if not self.allow(provider):
+            state = self._states[provider]
+            raise CircuitOpenError(provider, state["code"], state["until_iso"])
+
+    def record_success(self, provider: str) -> None:
+        """A call succeeded: a half-open breaker closes. Successes while open are stragglers and ignored."""
+        self._rate_limited.pop(provider, None)
+        self._failing.pop(provider, None)
+        state = self._states.get(provider)
+        if state is None or state["state"] != HALF_OPEN:
+            return
+        del self._states[provider]
+        self.conn.execute("DELETE FROM circuit_breakers WHERE provider = ?", (provider,))
+        logger.info(f"Circuit breaker [{provider}] closed — probe succeeded after {state['trips']} trip(s)")
+
+    def reset(self, provider: Optional[str] = None) -> List[str]:
+        """Operator override: close one or every breaker."""
+        cleared = [provider] if provider and provider in self._states else ([] if provider else list(self._states))
+        for name in [provider] if provider else [*self._rate_limited, *self._failing]:
+            self._rate_limited.pop(name, None)
+            self._failing.pop(name, None)
+        for name in cleared:
+            del self._states[name]
+            self.conn.execute("DELETE FROM circuit_breakers WHERE provider = ?", (name,))
+        return cleared
+
+    # ── queries ──
+    def blocking(self) -> Optional[Dict[str, Any]]:
+        """The breaker currently refusing work (latest reopening wins), if any.
+
+        An open breaker whose window has passed is not blocking: the next call
+        becomes its probe. A half-open breaker blocks while its probe is out.
+        """
+        now = _now()
+        blocking = [state for state in self._states.values() if now < state["until_dt"]]
+        if not blocking:
+            return None
+        return max(blocking, key=lambda state: state["until_dt"])
+
+    def get(self, provider: str) -> Optional[Dict[str, Any]]:
+        return self._states.get(provider)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "provider": state["provider"],
+                "state": state["state"],
+                "code": state["code"],
+                "until": state["until_iso"],
+                "trips": state["trips"],
+                "message": state["message"],
+            }
+            for state in self._states.values()
+        ]
+
+
+circuit_breakers = CircuitBreakers()
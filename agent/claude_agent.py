@@ -1,15 +1,21 @@
 import os
+import re
 import asyncio
 import httpx
 import logging
-import anthropic as _anthropic
 from datetime import datetime
 from typing import Optional
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from prompts.system_prompt import build_system_prompt
-from long_meeting_processor import process_long_meeting, estimate_tokens
-from context_loader import load_context_for_prompt
+from long_meeting_processor import process_long_meeting
+from compact_transcript import get_compact_transcript
+from context_loader import load_context_for_prompt, fetch_notion_context, invalidate_notion_context
 from output_validator import OutputValidator
+from rate_limiter import anthropic_budget
+from checkpoint_store import checkpoint_store
+from http_client import get_notion_client, NOTION_TIMEOUT
+from errors import ProviderError, as_provider_error, most_severe
+from single_flight import LeaseHeldElsewhere, check_lease
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,6 +31,9 @@ SONNET_MODEL = os.getenv("CLAUDE_MODEL", "claude-sonnet-4-6")
 # Long meeting threshold (tokens) — set high to leverage 1M context window directly
 LONG_MEETING_THRESHOLD = int(os.getenv("LONG_MEETING_THRESHOLD_TOKENS", "900000"))
 
+# Tool calls from one assistant turn run concurrently, at most this many at once
+AGENT_TOOL_CONCURRENCY = max(1, int(os.getenv("AGENT_TOOL_CONCURRENCY", "6")))
+
 # Define tools for Claude API (function calling)
 TOOLS = [
     {
@@ -338,7 +347,8 @@ TOOLS = [
 
 async def execute_tool(tool_name: str, tool_input: dict, projects_cache: dict = None,
                        validator: OutputValidator = None, context_section: str = "",
-                       meeting_register_id: Optional[str] = None) -> str:
+                       meeting_register_id: Optional[str] = None,
+                       errors: Optional[list] = None) -> str:
     """Execute a tool and return the result as a string.
 
     Args:
@@ -348,11 +358,16 @@ async def execute_tool(tool_name: str, tool_input: dict, projects_cache: dict =
         meeting_register_id: Notion meeting register row ID. When provided,
             create_task / create_subtask attach a provenance marker so a retry
             after partial failure can dedupe instead of creating duplicates.
+        errors: When provided, a failed call appends its typed ProviderError
+            here; the returned string is still what the agent sees.
     """
     # ── Validate write operations before executing ──
     write_tools = {"create_meeting_note", "create_task", "create_subtask",
                    "create_meeting_register", "create_eos_issue",
                    "create_speaker_alias", "create_meeting_agenda"}
+    if tool_name in write_tools:
+        # Another replica took over this meeting's lease — stop before writing anything else
+        check_lease()
     if validator and tool_name in write_tools and context_section:
         logger.info(f"  Validating {tool_name} payload...")
         validation = await validator.validate(tool_name, tool_input, context_section)
@@ -367,156 +382,204 @@ async def execute_tool(tool_name: str, tool_input: dict, projects_cache: dict =
         response.raise_for_status()
         result = response.json()
         if result.get("success") is False:
-            raise RuntimeError(f"{label} request returned success=false: {result}")
+            raise ProviderError(f"{label} request returned success=false: {result}", "notion")
         if not result.get("id"):
-            raise RuntimeError(f"{label} response did not include an id: {result}")
+            raise ProviderError(f"{label} response did not include an id: {result}", "notion")
         return result
 
     logger.info(f"Connecting to Notion API at: {NOTION_API_BASE}")
-    async with httpx.AsyncClient() as client:
-        try:
-            if tool_name == "get_projects":
-                # Return cached result if available
-                if projects_cache is not None and "result" in projects_cache:
-                    logger.info("Using cached projects data")
-                    return projects_cache["result"]
-
-                url = f"{NOTION_API_BASE}/api/projects"
-                logger.info(f"GET {url}")
-                response = await client.get(url, timeout=30.0)
-                response.raise_for_status()
-                projects = response.json()
-                if not projects:
-                    result_str = "No projects found in the database."
-                else:
-                    def _fmt_project(p):
-                        keywords = ", ".join(p.get("keywords", [])) or "—"
-                        client = p.get("client", "") or "—"
-                        desc = (p.get("description", "") or "")[:120]
-                        desc_str = (desc + "...") if len(p.get("description", "") or "") > 120 else desc or "—"
-                        return (
-                            f"- {p['name']} (ID: {p['id']}, Status: {p.get('status', 'Unknown')}, "
-                            f"Client: {client}, Keywords: [{keywords}], Description: {desc_str})"
-                        )
-                    result_str = f"Found {len(projects)} projects:\n" + "\n".join(
-                        _fmt_project(p) for p in projects
+    client = get_notion_client()
+    try:
+        if tool_name == "get_projects":
+            # Return cached result if available
+            if projects_cache is not None and "result" in projects_cache:
+                logger.info("Using cached projects data")
+                return projects_cache["result"]
+
+            url = f"{NOTION_API_BASE}/api/projects"
+            logger.info(f"GET {url}")
+            response = await client.get(url, timeout=NOTION_TIMEOUT)
+            response.raise_for_status()
+            projects = response.json()
+            if not projects:
+                result_str = "No projects found in the database."
+            else:
+                def _fmt_project(p):
+                    keywords = ", ".join(p.get("keywords", [])) or "—"
+                    client = p.get("client", "") or "—"
+                    desc = (p.get("description", "") or "")[:120]
+                    desc_str = (desc + "...") if len(p.get("description", "") or "") > 120 else desc or "—"
+                    return (
+                        f"- {p['name']} (ID: {p['id']}, Status: {p.get('status', 'Unknown')}, "
+                        f"Client: {client}, Keywords: [{keywords}], Description: {desc_str})"
                     )
+                result_str = f"Found {len(projects)} projects:\n" + "\n".join(
+                    _fmt_project(p) for p in projects
+                )
 
-                # Cache for this session
-                if projects_cache is not None:
-                    projects_cache["result"] = result_str
+            # Cache for this session
+            if projects_cache is not None:
+                projects_cache["result"] = result_str
 
-                return result_str
+            return result_str
 
-            elif tool_name == "create_meeting_note":
-                # Pass people_ids and department_ids alongside the rest of the payload
-                payload = dict(tool_input)
-                response = await client.post(
-                    f"{NOTION_API_BASE}/api/notes",
-                    json=payload,
-                    timeout=30.0
-                )
-                result = _parse_create_response(response, "create_meeting_note")
-                return f"Created meeting note '{tool_input.get('title')}' with ID: {result.get('id')}"
-
-            elif tool_name == "create_task":
-                response = await client.post(
-                    f"{NOTION_API_BASE}/api/tasks",
-                    json={
-                        "name": tool_input.get("name"),
-                        "description": tool_input.get("description"),
-                        "definitionOfDone": tool_input.get("definition_of_done"),
-                        "priority": tool_input.get("priority", "Medium"),
-                        "dueDate": tool_input.get("due_date"),
-                        "status": tool_input.get("status", "To Do"),
-                        "projectId": tool_input.get("project_id"),
-                        "departmentIds": tool_input.get("department_ids", []),
-                        "peopleIds": tool_input.get("people_ids", []),
-                        "meetingRegisterId": meeting_register_id,
-                    },
-                    timeout=30.0
-                )
-                result = _parse_create_response(response, "create_task")
-                action = "Reused existing" if result.get("reused") else "Created"
-                return f"{action} task '{tool_input.get('name')}' (ID: {result.get('id')})"
-
-            elif tool_name == "create_subtask":
-                response = await client.post(
-                    f"{NOTION_API_BASE}/api/tasks",
-                    json={
-                        "name": tool_input.get("name"),
-                        "description": tool_input.get("description"),
-                        "definitionOfDone": tool_input.get("definition_of_done"),
-                        "priority": tool_input.get("priority", "Medium"),
-                        "dueDate": tool_input.get("due_date"),
-                        "status": "To Do",
-                        "parentTaskId": tool_input.get("parent_task_id"),
-                        "projectId": tool_input.get("project_id"),
-                        "departmentIds": tool_input.get("department_ids", []),
-                        "peopleIds": tool_input.get("people_ids", []),
-                        "meetingRegisterId": meeting_register_id,
-                    },
-                    timeout=30.0
-                )
-                result = _parse_create_response(response, "create_subtask")
-                action = "Reused existing" if result.get("reused") else "Created"
-                return f"{action} subtask '{tool_input.get('name')}' (ID: {result.get('id')})"
-
-            elif tool_name == "create_meeting_register":
-                response = await client.post(
-                    f"{NOTION_API_BASE}/api/meeting-register",
-                    json=tool_input,
-                    timeout=30.0
-                )
-                result = _parse_create_response(response, "create_meeting_register")
-                return f"Created meeting register entry '{tool_input.get('title')}' (ID: {result.get('id')})"
-
-            elif tool_name == "create_eos_issue":
-                response = await client.post(
-                    f"{NOTION_API_BASE}/api/eos-issues",
-                    json=tool_input,
-                    timeout=30.0
-                )
-                result = _parse_create_response(response, "create_eos_issue")
-                return f"Created EOS issue '{tool_input.get('title')}' (ID: {result.get('id')})"
-
-            elif tool_name == "create_speaker_alias":
-                response = await client.post(
-                    f"{NOTION_API_BASE}/api/speaker-aliases",
-                    json=tool_input,
-                    timeout=30.0
-                )
-                result = _parse_create_response(response, "create_speaker_alias")
-                return f"Created speaker alias '{tool_input.get('alias')}' (ID: {result.get('id')})"
-
-            elif tool_name == "create_meeting_agenda":
-                response = await client.post(
-                    f"{NOTION_API_BASE}/api/agendas",
-                    json={
-                        "title": tool_input.get("title"),
-                        "meeting_date": tool_input.get("meeting_date"),
-                        "meeting_type": tool_input.get("meeting_type"),
-                        "duration_minutes": tool_input.get("duration_minutes", 90),
-                        "location": tool_input.get("location"),
-                        "facilitator": tool_input.get("facilitator"),
-                        "attendees": tool_input.get("attendees", []),
-                        "rocks_to_review": tool_input.get("rocks_to_review", []),
-                        "known_issues": tool_input.get("known_issues", []),
-                        "agenda_items": tool_input.get("agenda_items", []),
-                        "project_id": tool_input.get("project_id"),
-                        "organization_name": tool_input.get("organization_name")
-                    },
-                    timeout=30.0
-                )
-                result = _parse_create_response(response, "create_meeting_agenda")
-                return f"Created meeting agenda '{tool_input.get('title')}' for {tool_input.get('meeting_date')} (ID: {result.get('id')})"
+        elif tool_name == "create_meeting_note":
+            # Pass people_ids and department_ids alongside the rest of the payload
+            payload = dict(tool_input)
+            response = await client.post(
+                f"{NOTION_API_BASE}/api/notes",
+                json=payload,
+                timeout=NOTION_TIMEOUT
+            )
+            result = _parse_create_response(response, "create_meeting_note")
+            return f"Created meeting note '{tool_input.get('title')}' with ID: {result.get('id')}"
+
+        elif tool_name == "create_task":
+            response = await client.post(
+                f"{NOTION_API_BASE}/api/tasks",
+                json={
+                    "name": tool_input.get("name"),
+                    "description": tool_input.get("description"),
+                    "definitionOfDone": tool_input.get("definition_of_done"),
+                    "priority": tool_input.get("priority", "Medium"),
+                    "dueDate": tool_input.get("due_date"),
+                    "status": tool_input.get("status", "To Do"),
+                    "projectId": tool_input.get("project_id"),
+                    "departmentIds": tool_input.get("department_ids", []),
+                    "peopleIds": tool_input.get("people_ids", []),
+                    "meetingRegisterId": meeting_register_id,
+                },
+                timeout=NOTION_TIMEOUT
+            )
+            result = _parse_create_response(response, "create_task")
+            action = "Reused existing" if result.get("reused") else "Created"
+            return f"{action} task '{tool_input.get('name')}' (ID: {result.get('id')})"
+
+        elif tool_name == "create_subtask":
+            response = await client.post(
+                f"{NOTION_API_BASE}/api/tasks",
+                json={
+                    "name": tool_input.get("name"),
+                    "description": tool_input.get("description"),
+                    "definitionOfDone": tool_input.get("definition_of_done"),
+                    "priority": tool_input.get("priority", "Medium"),
+                    "dueDate": tool_input.get("due_date"),
+                    "status": "To Do",
+                    "parentTaskId": tool_input.get("parent_task_id"),
+                    "projectId": tool_input.get("project_id"),
+                    "departmentIds": tool_input.get("department_ids", []),
+                    "peopleIds": tool_input.get("people_ids", []),
+                    "meetingRegisterId": meeting_register_id,
+                },
+                timeout=NOTION_TIMEOUT
+            )
+            result = _parse_create_response(response, "create_subtask")
+            action = "Reused existing" if result.get("reused") else "Created"
+            return f"{action} subtask '{tool_input.get('name')}' (ID: {result.get('id')})"
+
+        elif tool_name == "create_meeting_register":
+            response = await client.post(
+                f"{NOTION_API_BASE}/api/meeting-register",
+                json=tool_input,
+                timeout=NOTION_TIMEOUT
+            )
+            result = _parse_create_response(response, "create_meeting_register")
+            return f"Created meeting register entry '{tool_input.get('title')}' (ID: {result.get('id')})"
+
+        elif tool_name == "create_eos_issue":
+            response = await client.post(
+                f"{NOTION_API_BASE}/api/eos-issues",
+                json=tool_input,
+                timeout=NOTION_TIMEOUT
+            )
+            result = _parse_create_response(response, "create_eos_issue")
+            invalidate_notion_context()  # open issues are part of the context
+            return f"Created EOS issue '{tool_input.get('title')}' (ID: {result.get('id')})"
+
+        elif tool_name == "create_speaker_alias":
+            response = await client.post(
+                f"{NOTION_API_BASE}/api/speaker-aliases",
+                json=tool_input,
+                timeout=NOTION_TIMEOUT
+            )
+            result = _parse_create_response(response, "create_speaker_alias")
+            invalidate_notion_context()
+            return f"Created speaker alias '{tool_input.get('alias')}' (ID: {result.get('id')})"
+
+        elif tool_name == "create_meeting_agenda":
+            response = await client.post(
+                f"{NOTION_API_BASE}/api/agendas",
+                json={
+                    "title": tool_input.get("title"),
+                    "meeting_date": tool_input.get("meeting_date"),
+                    "meeting_type": tool_input.get("meeting_type"),
+                    "duration_minutes": tool_input.get("duration_minutes", 90),
+                    "location": tool_input.get("location"),
+                    "facilitator": tool_input.get("facilitator"),
+                    "attendees": tool_input.get("attendees", []),
+                    "rocks_to_review": tool_input.get("rocks_to_review", []),
+                    "known_issues": tool_input.get("known_issues", []),
+                    "agenda_items": tool_input.get("agenda_items", []),
+                    "project_id": tool_input.get("project_id"),
+                    "organization_name": tool_input.get("organization_name")
+                },
+                timeout=NOTION_TIMEOUT
+            )
+            result = _parse_create_response(response, "create_meeting_agenda")
+            return f"Created meeting agenda '{tool_input.get('title')}' for {tool_input.get('meeting_date')} (ID: {result.get('id')})"
 
-            else:
-                return f"Unknown tool: {tool_name}"
+        else:
+            return f"Unknown tool: {tool_name}"
 
-        except Exception as e:
-            logger.error(f"Error executing {tool_name}: {str(e)}")
-            return f"TOOL_ERROR[{tool_name}][provider=notion]: {str(e)}"
+    except Exception as e:
+        error = as_provider_error(e, "notion")
+        if errors is not None:
+            errors.append(error)
+        logger.error(f"Error executing {tool_name} ({error.kind}): {error}")
+        return f"TOOL_ERROR[{tool_name}][provider={error.provider}]: {error}"
+
+
+# A call to the key tool waits for every earlier call (same turn) to the listed
+# tools: the records it links to — parent task, meeting note — may be created there
+_TOOL_DEPENDENCIES = {
+    "create_subtask": {"create_task"},
+    "create_meeting_register": {"create_meeting_note"},
+    "create_eos_issue": {"create_meeting_note"},
+}
+
+
+async def execute_tools(tool_uses: list, projects_cache: dict = None, **kwargs) -> list:
+    """Execute one assistant turn's tool calls concurrently; returns the results in call order.
+
+    Independent calls (tasks, issues, aliases, ...) run up to AGENT_TOOL_CONCURRENCY
+    at once, each with its own validator check. A call in _TOOL_DEPENDENCIES starts
+    only after the earlier calls it may depend on have finished. kwargs are passed
+    to execute_tool. An exception raised by one call (execute_tool turns provider
+    errors into result strings) is re-raised once every started call has finished;
+    calls that depend on it are not run.
+    """
+    sem = asyncio.Semaphore(AGENT_TOOL_CONCURRENCY)
+    tasks: list = []
+
+    async def _run(tool_use, deps: list) -> Optional[str]:
+        if deps:
+            await asyncio.wait(deps)
+            if any(dep.exception() is not None for dep in deps):
+                return None
+        async with sem:
+            logger.info(f"Executing tool: {tool_use.name} with input: {tool_use.input}")
+            return await execute_tool(tool_use.name, tool_use.input, projects_cache, **kwargs)
+
+    for index, tool_use in enumerate(tool_uses):
+        needs = _TOOL_DEPENDENCIES.get(tool_use.name, ())
+        deps = [tasks[i] for i in range(index) if tool_uses[i].name in needs]
+        tasks.append(asyncio.create_task(_run(tool_use, deps)))
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
 
 
 def detect_meeting_complexity(transcript_data: dict) -> str:
@@ -546,17 +609,20 @@ def detect_meeting_complexity(transcript_data: dict) -> str:
 
 _RETRY_DELAYS = [5, 15, 30, 60, 120]  # seconds between attempts (5 total)
 
+# Record ids reported by the create_* tools ("... with ID: x" / "... (ID: x)")
+_CREATED_ID_RE = re.compile(r"\(ID: ([^)\s]+)\)|with ID: (\S+)")
+
 
 async def _call_with_retry(client, **kwargs):
     """Call Claude API with exponential backoff for rate limits and overload errors."""
     for attempt, delay in enumerate(_RETRY_DELAYS):
         try:
-            return client.messages.create(**kwargs)
-        except (_anthropic.RateLimitError, _anthropic.InternalServerError, _anthropic.APIConnectionError) as e:
-            if attempt == len(_RETRY_DELAYS) - 1:
+            return await anthropic_budget.create(client, **kwargs)
+        except ProviderError as e:
+            if not e.transient or attempt == len(_RETRY_DELAYS) - 1:
                 raise
             logger.warning(
-                f"Claude API error ({type(e).__name__}), retrying in {delay}s "
+                f"Claude API error ({e.kind}, HTTP {e.status_code}), retrying in {delay}s "
                 f"(attempt {attempt + 1}/{len(_RETRY_DELAYS)})..."
             )
             await asyncio.sleep(delay)
@@ -572,27 +638,22 @@ async def _claude_preflight_check(client) -> None:
     haiku_model = os.getenv("CLAUDE_HAIKU_MODEL", "claude-haiku-4-5-20251001")
     logger.info(f"Pre-flight credit/auth check via {haiku_model}…")
     try:
-        await asyncio.to_thread(
-            client.messages.create,
+        await anthropic_budget.create(
+            client,
             model=haiku_model,
             max_tokens=1,
             messages=[{"role": "user", "content": "."}],
         )
         logger.info("Pre-flight check passed — Anthropic API ready.")
-    except _anthropic.BadRequestError as e:
-        # 400 with "credit balance is too low" lands here. Re-raise so the
-        # outer handler in main.py classifies as billing and installs a hold.
-        logger.warning(f"Pre-flight failed (BadRequest, likely billing): {e}")
-        raise
-    except _anthropic.AuthenticationError as e:
-        logger.warning(f"Pre-flight failed (auth): {e}")
-        raise
-    except _anthropic.PermissionDeniedError as e:
-        logger.warning(f"Pre-flight failed (permission): {e}")
+    except ProviderError as e:
+        # "credit balance is too low" arrives as kind=billing, bad keys as kind=auth.
+        # Re-raise so the outer handler in main.py installs the matching hold.
+        logger.warning(f"Pre-flight failed ({e.kind}, HTTP {e.status_code}): {e}")
         raise
 
 
-async def process_meeting_transcript(transcript_data: dict, meeting_register_id: Optional[str] = None) -> dict:
+async def process_meeting_transcript(transcript_data: dict, meeting_register_id: Optional[str] = None,
+                                     resume: bool = False, stop_event: Optional[asyncio.Event] = None) -> dict:
     """
     Process a meeting transcript using Claude API with optimized token usage.
 
@@ -602,6 +663,9 @@ async def process_meeting_transcript(transcript_data: dict, meeting_register_id:
     - Smart model selection: Haiku for simple meetings, Sonnet for standard
     - Token usage tracking with cost calculation
     - Session-scoped tool result caching
+    - Checkpoint after each clean iteration; resume=True continues from it
+    - stop_event (shutdown drain) ends the loop at the next iteration boundary
+      with results["drained"] set, leaving the checkpoint for the retry worker
     """
     # Parse the meeting date
     date_str = transcript_data.get('date', '')
@@ -619,7 +683,6 @@ async def process_meeting_transcript(transcript_data: dict, meeting_register_id:
     overview = summary.get('overview', 'No overview available')
     action_items = summary.get('action_items', [])
     key_points = summary.get('shorthand_bullet', [])
-    sentences = transcript_data.get('sentences', [])
 
     # Format action items (handle both string and list)
     if isinstance(action_items, str):
@@ -637,28 +700,43 @@ async def process_meeting_transcript(transcript_data: dict, meeting_register_id:
     else:
         key_points_text = 'No key points available'
 
-    # Estimate total transcript tokens
-    full_transcript_text = '\n'.join(
-        f"**{s.get('speaker_name') or 'Speaker'}**: {s.get('text', '')}"
-        for s in sentences
+    # Render the transcript once; the estimate, chunker, prompt and append all slice from it
+    transcript = get_compact_transcript(transcript_data)
+    transcript_tokens = transcript.estimated_tokens
+    logger.info(
+        f"Transcript size: {transcript_tokens} estimated tokens ({len(transcript)} segments, "
+        f"{len(transcript.speakers)} speakers)"
     )
-    transcript_tokens = estimate_tokens(full_transcript_text)
-    logger.info(f"Transcript size: {transcript_tokens} estimated tokens ({len(sentences)} segments)")
 
-    # Initialize Anthropic client (shared across passes)
-    client = Anthropic()
+    # Initialize async Anthropic client (shared across passes) so Claude calls
+    # never block the event loop serving /health and incoming webhooks
+    client = AsyncAnthropic()
 
     # Pre-flight credit/auth check — fail fast BEFORE any Notion writes if the
     # account is out of credits or otherwise blocked. Saves cleanup work from
     # partial-state failures (orphan tasks, missing meeting note).
     await _claude_preflight_check(client)
 
+    # A retry resumes from the last clean iteration of the previous attempt;
+    # any other run starts over and drops a stale checkpoint
+    meeting_id = transcript_data.get('id')
+    checkpoint = checkpoint_store.load(meeting_id) if resume and meeting_id else None
+    if checkpoint is None and meeting_id:
+        checkpoint_store.discard(meeting_id)
+
     # Determine processing method based on transcript length
     processing_method = "standard"
     extraction_cost = 0.0
     extraction_usage = {"input_tokens": 0, "output_tokens": 0}
 
-    if transcript_tokens > LONG_MEETING_THRESHOLD:
+    if checkpoint:
+        # The checkpointed conversation already carries the transcript (or its extraction)
+        processing_method = checkpoint["processing_method"] or processing_method
+        extraction_cost = checkpoint["state"].get("extraction_cost", 0.0)
+        extraction_usage = checkpoint["state"].get("extraction_usage", extraction_usage)
+        transcript_text = ""
+        logger.info(f"Resuming meeting {meeting_id} from checkpoint after iteration {checkpoint['iteration']}")
+    elif transcript_tokens > LONG_MEETING_THRESHOLD:
         # Two-pass processing: Haiku extracts, then Sonnet creates
         processing_method = "two_pass"
         logger.info(f"Long meeting detected: {transcript_tokens} tokens — using two-pass processing")
@@ -667,9 +745,7 @@ async def process_meeting_transcript(transcript_data: dict, meeting_register_id:
         # This runs BEFORE the full context load, so build it from raw context if available
         haiku_brief = ""
         try:
-            import httpx as _hx
-            _resp = _hx.get(f"{NOTION_API_BASE}/api/context", timeout=15.0)
-            _ctx = _resp.json()
+            _ctx = await fetch_notion_context()
             _rock_titles = [r.get("title", "") for r in _ctx.get("rocks", [])]
             _people_names = [p.get("name", "") for p in _ctx.get("people", [])]
             _dept_names = [d.get("name", "") for d in _ctx.get("departments", [])]
@@ -684,7 +760,7 @@ async def process_meeting_transcript(transcript_data: dict, meeting_register_id:
         except Exception as _e:
             logger.warning(f"Could not load context brief for Haiku: {_e}")
 
-        long_result = process_long_meeting(client, sentences, context_brief=haiku_brief)
+        long_result = await process_long_meeting(client, transcript, context_brief=haiku_brief)
         extraction_cost = long_result["extraction_cost"]
         extraction_usage = long_result["extraction_usage"]
 
@@ -698,7 +774,7 @@ async def process_meeting_transcript(transcript_data: dict, meeting_register_id:
         )
     else:
         # Standard processing: send transcript directly
-        transcript_text = full_transcript_text if full_transcript_text else 'No transcript available'
+        transcript_text = transcript.text if transcript else 'No transcript available'
 
     # Duration — Fireflies sends minutes as a float (e.g., 49.58 for ~50 min)
     duration_raw = transcript_data.get('duration', 0) or 0
@@ -716,25 +792,32 @@ async def process_meeting_transcript(transcript_data: dict, meeting_register_id:
         logger.info(f"Meeting format: {meeting_format}")
 
     # ── Load fresh Notion context ──
-    logger.info("Loading fresh Notion context for prompt injection...")
-    try:
-        raw_context, context_section = await load_context_for_prompt(meeting_format=meeting_format)
-        # Find default project ID from context
-        projects_list = raw_context.get("projects", [])
-        default_project_id = projects_list[0]["id"] if projects_list else None
-        project_list_text = "\n".join(
-            f"- {p['name']} (ID: {p['id']}, Status: {p.get('status', '?')})"
-            for p in projects_list
-        ) if projects_list else "No projects found."
-        logger.info(f"Context loaded. {len(projects_list)} projects, default: {default_project_id}")
-    except Exception as e:
-        logger.warning(f"Failed to load Notion context: {e} — falling back to static prompt")
-        context_section = ""
-        default_project_id = None
-        project_list_text = "Context unavailable — call get_projects() manually."
+    if checkpoint:
+        # Reuse the exact context the checkpointed conversation was built on
+        context_section = checkpoint["context_section"]
+        projects_list = []
+        project_list_text = ""
+    else:
+        logger.info("Loading fresh Notion context for prompt injection...")
+        try:
+            raw_context, context_section = await load_context_for_prompt(meeting_format=meeting_format)
+            # Find default project ID from context
+            projects_list = raw_context.get("projects", [])
+            default_project_id = projects_list[0]["id"] if projects_list else None
+            project_list_text = "\n".join(
+                f"- {p['name']} (ID: {p['id']}, Status: {p.get('status', '?')})"
+                for p in projects_list
+            ) if projects_list else "No projects found."
+            logger.info(f"Context loaded. {len(projects_list)} projects, default: {default_project_id}")
+        except Exception as e:
+            logger.warning(f"Failed to load Notion context: {e} — falling back to static prompt")
+            context_section = ""
+            default_project_id = None
+            project_list_text = "Context unavailable — call get_projects() manually."
+            projects_list = []
 
     # Build dynamic system prompt with injected context
-    dynamic_system_prompt = build_system_prompt(context_section)
+    dynamic_system_prompt = checkpoint["system_prompt"] if checkpoint else build_system_prompt(context_section)
     CACHED_SYSTEM = [
         {
             "type": "text",
@@ -822,8 +905,11 @@ Do NOT call get_projects() - the project list is already provided above."""
         "messages": [],
         "success": False,
         "error": None,
+        "error_info": None,
         "summary": None,
         "created_note_id": None,
+        "created_ids": [],
+        "resumed_from_iteration": checkpoint["iteration"] if checkpoint else None,
         "processing_method": processing_method,
         "model_used": selected_model,
         "complexity": complexity,
@@ -841,17 +927,32 @@ Do NOT call get_projects() - the project list is already provided above."""
     # Session-scoped cache for tool results
     projects_cache = {}
     tool_failures = []
+    tool_errors = []
 
     # Initialize the output validator (Sonnet-powered cross-check layer)
     validator = OutputValidator()
     logger.info("Output validator initialized — all writes will be cross-checked against Notion data")
 
+    start_iteration = 0
+    if checkpoint:
+        state = checkpoint["state"]
+        results["token_usage"].update(state.get("token_usage", {}))
+        results["created_note_id"] = state.get("created_note_id")
+        results["created_ids"] = state.get("created_ids", [])
+        validator.restore_state(state.get("validator", {}))
+        start_iteration = checkpoint["iteration"]
+
     try:
-        messages = [{"role": "user", "content": prompt}]
+        messages = checkpoint["messages"] if checkpoint else [{"role": "user", "content": prompt}]
 
         # Agentic loop - keep calling until no more tool use
         max_iterations = 30
-        for iteration in range(max_iterations):
+        for iteration in range(start_iteration, max_iterations):
+            if stop_event is not None and stop_event.is_set():
+                results["drained"] = True
+                logger.warning(f"Shutdown drain — stopping before iteration {iteration + 1}; resumable from checkpoint")
+                break
+            check_lease()
             logger.info(f"Claude iteration {iteration + 1} ({selected_model})...")
 
             response = await _call_with_retry(
@@ -902,18 +1003,20 @@ Do NOT call get_projects() - the project list is already provided above."""
                         results["messages"].append(block.text)
                 break
 
-            # Execute tools and add results (with validator cross-check)
+            # Execute tools concurrently (with validator cross-check) and add results in call order
             tool_results = []
-            for tool_use in tool_uses:
-                logger.info(f"Executing tool: {tool_use.name} with input: {tool_use.input}")
-                result = await execute_tool(
-                    tool_use.name, tool_use.input, projects_cache,
-                    validator=validator, context_section=context_section,
-                    meeting_register_id=meeting_register_id,
-                )
+            outputs = await execute_tools(
+                tool_uses, projects_cache,
+                validator=validator, context_section=context_section,
+                meeting_register_id=meeting_register_id, errors=tool_errors,
+            )
+            for tool_use, result in zip(tool_uses, outputs):
                 logger.info(f"Tool result: {result[:200]}...")
                 if result.startswith("TOOL_ERROR["):
                     tool_failures.append(result)
+                created_id = _CREATED_ID_RE.search(result)
+                if created_id:
+                    results["created_ids"].append({"tool": tool_use.name, "id": created_id.group(1) or created_id.group(2)})
                 # Capture the created meeting note ID for transcript attachment
                 if tool_use.name == "create_meeting_note" and "with ID:" in result:
                     try:
@@ -930,14 +1033,42 @@ Do NOT call get_projects() - the project list is already provided above."""
 
             messages.append({"role": "user", "content": tool_results})
 
-        if tool_failures:
+            # Checkpoint only while every write so far succeeded — a retry must replay a failed write
+            if meeting_id and not tool_failures:
+                checkpoint_store.save(
+                    meeting_id, iteration + 1, messages,
+                    model=selected_model,
+                    processing_method=processing_method,
+                    system_prompt=dynamic_system_prompt,
+                    context_section=context_section,
+                    state={
+                        "token_usage": results["token_usage"],
+                        "created_note_id": results["created_note_id"],
+                        "created_ids": results["created_ids"],
+                        "extraction_cost": extraction_cost,
+                        "extraction_usage": extraction_usage,
+                        "validator": validator.export_state(),
+                    },
+                )
+
+        if results.get("drained"):
+            results["error"] = "Agent shut down before this meeting finished; handed back to the durable queue"
+        elif tool_failures:
             results["error"] = "Tool execution failures: " + " | ".join(tool_failures[:3])
+            primary = most_severe(tool_errors)
+            if primary is not None:
+                results["error_info"] = primary.to_dict()
             logger.error(results["error"])
         elif not results["created_note_id"]:
             results["error"] = "Meeting note was not created; leaving meeting queued for retry"
             logger.error(results["error"])
+            if meeting_id:
+                # Resuming this conversation would most likely end the same way; retry from scratch
+                checkpoint_store.discard(meeting_id)
         else:
             results["success"] = True
+            if meeting_id:
+                checkpoint_store.discard(meeting_id)
 
         if results["error"] and not results["summary"]:
             results["summary"] = results["error"]
@@ -982,8 +1113,13 @@ Do NOT call get_projects() - the project list is already provided above."""
         logger.info(f"  Validator: {val_summary['total_validations']} checks, {val_summary['total_corrections']} corrections, ${validator_cost:.4f}")
         logger.info(f"  Method: {processing_method} | Model: {selected_model} | Complexity: {complexity}")
 
+    except LeaseHeldElsewhere:
+        # The replica that now holds the lease owns the meeting; nothing to record here
+        raise
     except Exception as e:
         results["error"] = str(e)
+        if isinstance(e, (ProviderError, httpx.HTTPError)):
+            results["error_info"] = as_provider_error(e).to_dict()
         logger.error(f"Error processing transcript: {e}")
         import traceback
         traceback.print_exc()
@@ -0,0 +1,171 @@
+"""
+Compact Transcript — Render-once transcript shared by every pipeline stage.
+
+The `**Speaker**: text` rendering used to be rebuilt three times per meeting:
+once for the token estimate and prompt, once per line in chunk_transcript(),
+and once more when the transcript-append payload was serialized. A
+CompactTranscript renders the sentences exactly once:
+
+  - speaker names are interned into a small table; each sentence stores a
+    speaker index in an array('I')
+  - start times live in an array('d') (NaN = unknown)
+  - the whole transcript is one str buffer; line and text offsets are
+    array('Q'), so a sentence, a chunk or the full prompt text is a single
+    slice of that buffer instead of a fresh f-string per line
+
+Token estimates come from offsets (no string work at all), and chunk
+boundaries are computed from line lengths before one slice per chunk.
+"""
+
+import sys
+import json
+import math
+from array import array
+from json.encoder import encode_basestring_ascii as _encode_string
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_COMPACT_KEY = "_compact_transcript"
+
+
+class CompactTranscript:
+    """Sentences rendered once into a shared buffer, addressed by offsets."""
+
+    __slots__ = ("speakers", "_anonymous_id", "_speaker_ids", "_start_times", "_line_starts", "_text_starts",
+                 "text")
+
+    def __init__(self, speakers: List[str], anonymous_id: int, speaker_ids: array, start_times: array,
+                 line_starts: array, text_starts: array, text: str):
+        self.speakers = speakers
+        self._anonymous_id = anonymous_id  # speaker id used for sentences without a speaker_name, or -1
+        self._speaker_ids = speaker_ids
+        self._start_times = start_times
+        # n + 1 entries; line i is text[line_starts[i]:line_starts[i + 1] - 1] (the -1 drops the "\n")
+        self._line_starts = line_starts
+        self._text_starts = text_starts
+        self.text = text
+
+    @classmethod
+    def from_sentences(cls, sentences: Iterable[Dict[str, Any]]) -> "CompactTranscript":
+        speakers: List[str] = []
+        prefixes: List[str] = []  # "**Name**: " rendered once per speaker
+        speaker_index: Dict[Optional[str], int] = {}
+        speaker_ids = array("I")
+        start_times = array("d")
+        line_starts = array("Q")
+        text_starts = array("Q")
+        parts: List[str] = []  # references to existing strings only; joined once below
+        pos = 0
+
+        for s in sentences:
+            name = s.get("speaker_name") or None
+            sid = speaker_index.get(name)
+            if sid is None:
+                sid = speaker_index[name] = len(speakers)
+                speakers.append(sys.intern(name or "Speaker"))
+                prefixes.append(f"**{speakers[sid]}**: ")
+            start = s.get("start_time")
+            text = s.get("text", "") or ""
+            prefix = prefixes[sid]
+
+            line_starts.append(pos)
+            text_starts.append(pos + len(prefix))
+            pos += len(prefix) + len(text) + 1
+            parts.append(prefix)
+            parts.append(text)
+            parts.append("\n")
+            speaker_ids.append(sid)
+            start = float(start) if start is not None else math.nan
+            start_times.append(start if math.isfinite(start) else math.nan)  # NaN = unknown
+
+        line_starts.append(pos)
+        if parts:
+            parts.pop()  # no newline after the last line
+        text = "".join(parts)
+        return cls(speakers, speaker_index.get(None, -1), speaker_ids, start_times, line_starts, text_starts, text)
+
+    def __len__(self) -> int:
+        return len(self._speaker_ids)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    @property
+    def estimated_tokens(self) -> int:
+        """Same 1 token ≈ 4 chars heuristic as long_meeting_processor.estimate_tokens()."""
+        return len(self.text) // 4
+
+    def line_length(self, index: int) -> int:
+        return self._line_starts[index + 1] - 1 - self._line_starts[index]
+
+    def speaker(self, index: int) -> str:
+        return self.speakers[self._speaker_ids[index]]
+
+    def sentence_text(self, index: int) -> str:
+        return self.text[self._text_starts[index]:self._line_starts[index + 1] - 1]
+
+    def start_time(self, index: int) -> Optional[float]:
+        value = self._start_times[index]
+        return None if math.isnan(value) else value
+
+    def span_text(self, start: int, end: int) -> str:
+        """Rendered lines [start, end) as one slice of the shared buffer."""
+        if start >= end:
+            return ""
+        return self.text[self._line_starts[start]:self._line_starts[end] - 1]
+
+    def chunk_spans(self, max_tokens_per_chunk: int) -> List[Tuple[int, int]]:
+        """Sentence ranges whose summed per-line token estimates stay within the budget."""
+        spans = []
+        chunk_start = 0
+        current_tokens = 0
+        line_starts = self._line_starts
+        line_tokens_all = [(end - 1 - start) // 4 for start, end in zip(line_starts, line_starts[1:])]
+        for i, line_tokens in enumerate(line_tokens_all):
+            if current_tokens + line_tokens > max_tokens_per_chunk and i > chunk_start:
+                spans.append((chunk_start, i))
+                chunk_start = i
+                current_tokens = 0
+            current_tokens += line_tokens
+        if chunk_start < len(self):
+            spans.append((chunk_start, len(self)))
+        return spans
+
+    def chunks(self, max_tokens_per_chunk: int) -> List[str]:
+        return [self.span_text(start, end) for start, end in self.chunk_spans(max_tokens_per_chunk)]
+
+    def append_json(self, start: int, end: int) -> bytes:
+        """Sentences [start, end) as comma-joined JSON objects for a transcript-append `sentences` array."""
+        # Each speaker's '{"speaker_name":..,"start_time":' prefix is encoded once; per sentence only
+        # the start time and the text (C escaper, ASCII output) are encoded, with no dict per sentence
+        heads = [f'{{"speaker_name":{json.dumps(None if sid == self._anonymous_id else name)},"start_time":'
+                 for sid, name in enumerate(self.speakers)]
+        speaker_ids, start_times = self._speaker_ids, self._start_times
+        text, text_starts, line_starts = self.text, self._text_starts, self._line_starts
+        float_repr = float.__repr__
+        return ",".join([
+            f'{heads[speaker_ids[i]]}{"null" if start_times[i] != start_times[i] else float_repr(start_times[i])}'
+            f',"text":{_encode_string(text[text_starts[i]:line_starts[i + 1] - 1])}}}'
+            for i in range(start, min(end, len(self)))
+        ]).encode("ascii")
+
+    def iter_append_json(self, batch_size: int = 500) -> Iterator[bytes]:
+        """Yield the transcript-append `sentences` array body in batches of comma-joined JSON objects.
+
+        Batching keeps serialization in the C JSON encoder while the peak size
+        stays bounded by batch_size sentences rather than the whole meeting.
+        """
+        for batch_start in range(0, len(self), batch_size):
+            yield self.append_json(batch_start, batch_start + batch_size)
+
+
+def get_compact_transcript(transcript_data: Dict[str, Any]) -> CompactTranscript:
+    """Render transcript_data's sentences once and reuse the result for the rest of the job."""
+    compact = transcript_data.get(_COMPACT_KEY)
+    if compact is None:
+        compact = CompactTranscript.from_sentences(transcript_data.get("sentences") or [])
+        transcript_data[_COMPACT_KEY] = compact
+    return compact
+
+
+def discard_compact_transcript(transcript_data: Dict[str, Any]) -> None:
+    transcript_data.pop(_COMPACT_KEY, None)
@@ -2,28 +2,95 @@
 Context Loader — Fetches fresh Notion data and formats it as a
 KNOWN DATA section for injection into the Claude system prompt.
 
-Called before every transcript processing to ensure the agent
-always sees the current state of all Notion databases.
+Called before every transcript processing. The raw context is kept for
+NOTION_CONTEXT_TTL_SECONDS and shared by the prompt, the long-meeting brief
+and the output validator, so one meeting costs at most one /api/context call
+and back-to-back meetings usually none:
+
+  - concurrent callers share one in-flight fetch
+  - a meeting that creates EOS issues or speaker aliases invalidates it
+    (invalidate_notion_context), so the next meeting sees its own writes; a
+    fetch that started before the invalidation is not cached
+  - warm_notion_context() refreshes it in the background, e.g. while the
+    retry worker finishes one meeting before starting the next
+
+Edits made directly in Notion show up within the TTL.
 """
 
 import os
-import httpx
+import time
+import asyncio
 import logging
 from datetime import datetime
+from typing import Optional
+from http_client import get_notion_client, CONTEXT_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
 NOTION_API_BASE = os.getenv("NOTION_API_BASE", "http://127.0.0.1:3000")
+# 0 disables the cache (every call fetches)
+NOTION_CONTEXT_TTL_SECONDS = float(os.getenv("NOTION_CONTEXT_TTL_SECONDS", "300"))
+
+_context: Optional[dict] = None
+_context_fetched_at = 0.0
+_context_generation = 0
+_context_inflight: Optional[asyncio.Future] = None
+
+
+def _context_fresh() -> bool:
+    return _context is not None and time.monotonic() - _context_fetched_at < NOTION_CONTEXT_TTL_SECONDS
+
+
+def invalidate_notion_context() -> None:
+    """Drop the cached context (and any fetch in flight) after a write that changes it."""
+    global _context, _context_generation, _context_inflight
+    _context = None
+    _context_generation += 1
+    _context_inflight = None
 
 
 async def fetch_notion_context() -> dict:
+    """Aggregated context from the Notion API bridge, cached for NOTION_CONTEXT_TTL_SECONDS.
+
+    The returned dict is shared between callers; treat it as read-only.
+    """
+    global _context_inflight
+    if _context_fresh():
+        return _context
+    if _context_inflight is None:
+        _context_inflight = asyncio.ensure_future(_fetch_and_cache(_context_generation))
+    return await asyncio.shield(_context_inflight)
+
+
+def warm_notion_context() -> None:
+    """Start refreshing the context in the background unless a fresh copy is cached."""
+    if NOTION_CONTEXT_TTL_SECONDS <= 0 or _context_fresh() or _context_inflight is not None:
+        return
+    asyncio.ensure_future(fetch_notion_context()).add_done_callback(
+        lambda f: f.cancelled() or (f.exception() and logger.warning(f"Context warm-up failed: {f.exception()}"))
+    )
+
+
+async def _fetch_and_cache(generation: int) -> dict:
+    global _context, _context_fetched_at, _context_inflight
+    try:
+        ctx = await _fetch_notion_context()
+    finally:
+        if generation == _context_generation:
+            _context_inflight = None
+    if generation == _context_generation and NOTION_CONTEXT_TTL_SECONDS > 0:
+        _context, _context_fetched_at = ctx, time.monotonic()
+    return ctx
+
+
+async def _fetch_notion_context() -> dict:
     """Fetch aggregated context from the Notion API bridge."""
     url = f"{NOTION_API_BASE}/api/context"
     logger.info(f"Fetching Notion context from {url}")
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, timeout=30.0)
-        response.raise_for_status()
-        ctx = response.json()
+    client = get_notion_client()
+    response = await client.get(url, timeout=CONTEXT_TIMEOUT)
+    response.raise_for_status()
+    ctx = response.json()
     n_people = len(ctx.get('people', []))
     n_projects = len(ctx.get('projects', []))
     total_kw = sum(len(p.get('keywords', [])) for p in ctx.get('projects', []))
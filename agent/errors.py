@@ -0,0 +1,258 @@
+"""
+Errors — Typed provider failures for retry classification.
+
+Failures used to reach the retry worker as plain strings, and the classifier
+guessed the provider and the failure kind by scanning them for markers, so a
+Notion error whose payload mentioned "claude" was treated as an Anthropic
+outage. Every provider call path now raises a ProviderError instead:
+
+  provider     anthropic | fireflies | notion | upstream
+  kind         what went wrong, from the HTTP status / provider error type:
+               billing, auth, rate_limit, overloaded, network, upstream (5xx),
+               not_found, validation, circuit_open, unknown
+  status_code  HTTP status of the failed response, when there was one
+  retry_after  provider-supplied retry time (Retry-After header, Fireflies
+               retryAfter metadata, or the breaker's open window)
+
+Converters: from_anthropic (AnthropicBudget.create), from_httpx (Notion bridge
+and Fireflies calls), from_graphql (Fireflies GraphQL `errors`) and
+as_provider_error (anything, with a provider default). A failed agent run
+hands its error back to the retry worker as results["error_info"] (to_dict /
+from_dict).
+"""
+
+import os
+from datetime import datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+import httpx
+import anthropic as _anthropic
+
+NOTION_API_BASE = os.getenv("NOTION_API_BASE", "http://127.0.0.1:8080")
+
+# Kinds a short in-call retry can ride out; everything else goes back to the classifier
+TRANSIENT_KINDS = ("rate_limit", "overloaded", "network", "upstream")
+# Which failure of several (e.g. tool calls in one run) decides the row's fate
+_SEVERITY = ("circuit_open", "billing", "auth", "rate_limit", "validation", "not_found",
+             "overloaded", "upstream", "network", "unknown")
+
+# Fireflies GraphQL `extensions.code` values
+_FIREFLIES_CODES = {
+    "too_many_requests": "rate_limit",
+    "object_not_found": "not_found",
+    "invalid_arguments": "validation",
+    "args_required": "validation",
+    "forbidden": "auth",
+    "unauthorized": "auth",
+    "invalid_api_key": "auth",
+    "require_elevated_privilege": "auth",
+    "paid_required": "billing",
+    "account_cancelled": "billing",
+}
+
+
+class ProviderError(RuntimeError):
+    """A provider call failed; carries what the retry classifier needs."""
+
+    def __init__(self, message: str, provider: str = "upstream", kind: str = "unknown",
+                 status_code: Optional[int] = None, retry_after: Optional[datetime] = None):
+        super().__init__(message)
+        self.provider = provider
+        self.kind = kind
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+    @property
+    def transient(self) -> bool:
+        return self.kind in TRANSIENT_KINDS
+
+    def prefixed(self, context: str) -> "ProviderError":
+        """Same failure with `context: ` in front of the message."""
+        return ProviderError(f"{context}: {self}", self.provider, self.kind, self.status_code, self.retry_after)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "message": str(self),
+            "provider": self.provider,
+            "kind": self.kind,
+            "status_code": self.status_code,
+            "retry_after": self.retry_after.isoformat() if self.retry_after else None,
+        }
+
+    @classmethod
+    def from_dict(cls, info: Dict[str, Any], message: Optional[str] = None) -> "ProviderError":
+        retry_after = _parse_time(info.get("retry_after"))
+        if info.get("kind") == "circuit_open":
+            return CircuitOpenError(info.get("provider", "upstream"), info.get("code", ""),
+                                    info.get("retry_after") or "", message=message or info.get("message"))
+        return cls(message or info.get("message", ""), info.get("provider", "upstream"),
+                   info.get("kind", "unknown"), info.get("status_code"), retry_after)
+
+
+class CircuitOpenError(ProviderError):
+    """A call was refused because the provider's breaker is open."""
+
+    def __init__(self, provider: str, code: str, until_iso: str, message: Optional[str] = None):
+        super().__init__(
+            message or f"{provider} circuit open ({code}); retry after {until_iso}",
+            provider, "circuit_open", retry_after=_parse_time(until_iso),
+        )
+        self.code = code
+        self.until_iso = until_iso
+
+    def prefixed(self, context: str) -> "CircuitOpenError":
+        return CircuitOpenError(self.provider, self.code, self.until_iso, message=f"{context}: {self}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**super().to_dict(), "code": self.code}
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def parse_retry_after(headers) -> Optional[datetime]:
+    """Retry-After (delta seconds or HTTP date) as an absolute UTC time."""
+    raw = headers.get("retry-after") if headers is not None else None
+    if not raw:
+        return None
+    raw = str(raw).strip()
+    try:
+        return datetime.now(timezone.utc) + timedelta(seconds=float(raw))
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(raw).astimezone(timezone.utc)
+    except (TypeError, ValueError):
+        return None
+
+
+def kind_for_status(status: int) -> str:
+    if status in (401, 403):
+        return "auth"
+    if status == 402:
+        return "billing"
+    if status == 429:
+        return "rate_limit"
+    if status == 404:
+        return "not_found"
+    if status in (408, 409, 425):
+        return "network"
+    if status in (502, 503, 504, 529):
+        return "overloaded"
+    if status >= 500:
+        return "upstream"
+    if status >= 400:
+        return "validation"
+    return "unknown"
+
+
+def _provider_for_url(url) -> Optional[str]:
+    host = urlparse(str(url)).netloc
+    if host.endswith("fireflies.ai"):
+        return "fireflies"
+    if host.endswith("anthropic.com"):
+        return "anthropic"
+    if host == urlparse(NOTION_API_BASE).netloc:
+        return "notion"
+    return None
+
+
+def from_httpx(exc: httpx.HTTPError, provider: Optional[str] = None) -> ProviderError:
+    """Convert an httpx failure; the provider defaults to the one the request went to."""
+    try:
+        request_url = exc.request.url
+    except RuntimeError:
+        request_url = ""
+    provider = provider or _provider_for_url(request_url) or "upstream"
+    if isinstance(exc, httpx.HTTPStatusError):
+        response = exc.response
+        detail = ""
+        try:
+            body = response.json()
+            if isinstance(body, dict):
+                detail = str(body.get("error") or body.get("message") or "")
+        except ValueError:
+            detail = response.text[:300]
+        message = f"HTTP {response.status_code} from {request_url}" + (f": {detail}" if detail else "")
+        return ProviderError(message, provider, kind_for_status(response.status_code),
+                             response.status_code, parse_retry_after(response.headers))
+    return ProviderError(f"{type(exc).__name__}: {exc}", provider, "network")
+
+
+def from_anthropic(exc: _anthropic.APIError) -> ProviderError:
+    """Convert an Anthropic SDK error using its status code and error type."""
+    if isinstance(exc, _anthropic.APIStatusError):
+        body = exc.body if isinstance(exc.body, dict) else {}
+        error_type = (body.get("error") or {}).get("type", "") if isinstance(body.get("error"), dict) else ""
+        kind = kind_for_status(exc.status_code)
+        if error_type == "billing_error" or (
+            # Anthropic reports an empty balance as a 400 invalid_request_error
+            exc.status_code == 400 and "credit balance" in str(exc.message).lower()
+        ):
+            kind = "billing"
+        elif error_type == "overloaded_error":
+            kind = "overloaded"
+        return ProviderError(f"Anthropic API error: {exc.message}", "anthropic", kind,
+                             exc.status_code, parse_retry_after(exc.response.headers))
+    if isinstance(exc, _anthropic.APIConnectionError):
+        return ProviderError(f"Anthropic API connection error: {exc}", "anthropic", "network")
+    return ProviderError(f"Anthropic API error: {exc}", "anthropic")
+
+
+def from_graphql(errors: list, provider: str, context: str) -> ProviderError:
+    """Convert a GraphQL `errors` array (first error wins) using its extensions.code."""
+    first = errors[0] if errors and isinstance(errors[0], dict) else {}
+    extensions = first.get("extensions") or {}
+    code = str(extensions.get("code") or "").lower()
+    retry_after = None
+    raw_retry = (extensions.get("metadata") or {}).get("retryAfter")
+    if isinstance(raw_retry, (int, float)):
+        retry_after = datetime.fromtimestamp(raw_retry / 1000, tz=timezone.utc)
+    elif raw_retry:
+        retry_after = _parse_time(raw_retry)
+    status = extensions.get("status")
+    kind = _FIREFLIES_CODES.get(code) or (kind_for_status(status) if isinstance(status, int) else "unknown")
+    return ProviderError(f"{context}: {first.get('message', 'query failed')}", provider, kind,
+                         status if isinstance(status, int) else None, retry_after)
+
+
+def as_provider_error(exc: BaseException, provider: Optional[str] = None,
+                      context: Optional[str] = None) -> ProviderError:
+    """Typed view of any exception. Already-typed errors keep their provider and kind."""
+    if isinstance(exc, ProviderError):
+        error = exc
+    elif isinstance(exc, httpx.HTTPError):
+        error = from_httpx(exc, provider)
+    elif isinstance(exc, _anthropic.APIError):
+        error = from_anthropic(exc)
+    elif isinstance(exc, (TimeoutError, ConnectionError)):
+        error = ProviderError(f"{type(exc).__name__}: {exc}", provider or "upstream", "network")
+    else:
+        error = ProviderError(str(exc), provider or "upstream")
+    return error.prefixed(context) if context else error
+
+
+def most_severe(errors: Iterable[ProviderError]) -> Optional[ProviderError]:
+    """The error that should decide the outcome when several calls failed."""
+    errors = list(errors)
+    if not errors:
+        return None
+    return min(errors, key=lambda e: _SEVERITY.index(e.kind) if e.kind in _SEVERITY else len(_SEVERITY))
+
+
+def result_error(result: Dict[str, Any]) -> RuntimeError:
+    """Exception for a failed agent result: typed when the run recorded error_info."""
+    message = result.get("error") or "Unknown processing error"
+    info = result.get("error_info")
+    if info:
+        return ProviderError.from_dict(info, message)
+    return RuntimeError(message)
@@ -0,0 +1,326 @@
+"""
+Fireflies Client — Pooled, rate-aware Fireflies GraphQL access.
+
+Replaces the per-call httpx clients in main.py (one TCP/TLS handshake and one
+request per transcript). After an outage the retry worker used to hit
+Fireflies once per row; now:
+
+  - one keep-alive connection pool for every Fireflies request, closed on
+    shutdown via close()
+  - every request draws from rate_limiter.fireflies_bucket
+    (FIREFLIES_REQUESTS_PER_MINUTE) and passes the Fireflies circuit breaker
+  - fetch_transcript() calls for the same id while one is in flight share
+    that request
+  - ids requested within FIREFLIES_BATCH_WINDOW_MS are fetched together, up
+    to FIREFLIES_BATCH_SIZE per request, as aliased fields of one GraphQL
+    document (t0: transcript(id: $id0) { ... } t1: ...); each caller gets its
+    own transcript or its own error
+  - prefetch() reads transcripts ahead into a small bounded memo that
+    take_prefetched() hands out once; the retry worker uses it so a backlog
+    of N rows costs about N / FIREFLIES_BATCH_SIZE requests
+
+FIREFLIES_API_URL points the client at another endpoint, e.g. the stand-in
+server in benchmarks/fireflies_standin.py.
+"""
+
+import os
+import time
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import httpx
+
+from circuit_breaker import circuit_breakers
+from errors import ProviderError, from_httpx, from_graphql
+from rate_limiter import fireflies_bucket
+
+logger = logging.getLogger(__name__)
+
+FIREFLY_API_KEY = os.getenv("FIREFLY_API_KEY", "")
+FIREFLIES_API_URL = os.getenv("FIREFLIES_API_URL", "https://api.fireflies.ai/graphql")
+FIREFLIES_BATCH_SIZE = max(1, int(os.getenv("FIREFLIES_BATCH_SIZE", "10")))
+FIREFLIES_BATCH_WINDOW_MS = int(os.getenv("FIREFLIES_BATCH_WINDOW_MS", "50"))
+FIREFLIES_PREFETCH_MAX = int(os.getenv("FIREFLIES_PREFETCH_MAX", str(2 * FIREFLIES_BATCH_SIZE)))
+FIREFLIES_PREFETCH_TTL_SECONDS = int(os.getenv("FIREFLIES_PREFETCH_TTL_SECONDS", "600"))
+FIREFLIES_MAX_CONNECTIONS = int(os.getenv("FIREFLIES_MAX_CONNECTIONS", "4"))
+
+FIREFLIES_TRANSCRIPT_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+FIREFLIES_LIST_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+TRANSCRIPT_FIELDS = """
+fragment TranscriptFields on Transcript {
+  id
+  title
+  date
+  duration
+  organizer_email
+  participants
+  transcript_url
+  summary {
+    overview
+    shorthand_bullet
+    action_items
+    keywords
+  }
+  sentences {
+    speaker_name
+    text
+  }
+}
+"""
+
+LIST_QUERY = """
+query Transcripts($limit: Int, $skip: Int, $fromDate: DateTime) {
+  transcripts(limit: $limit, skip: $skip, fromDate: $fromDate) { id title date duration }
+}
+"""
+
+
+def build_batch_query(count: int) -> str:
+    """GraphQL document fetching `count` transcripts as aliases t0..t{count-1}."""
+    params = ", ".join(f"$id{i}: String!" for i in range(count))
+    fields = "\n".join(f"  t{i}: transcript(id: $id{i}) {{ ...TranscriptFields }}" for i in range(count))
+    return f"query Transcripts({params}) {{\n{fields}\n}}\n{TRANSCRIPT_FIELDS}"
+
+
+def _normalize(transcript: Dict[str, Any]) -> Dict[str, Any]:
+    raw_date = transcript.get("date")
+    if isinstance(raw_date, (int, float)):
+        transcript["date"] = datetime.fromtimestamp(raw_date / 1000, tz=timezone.utc).isoformat()
+    return transcript
+
+
+def _dated_before(transcript: Dict[str, Any], cutoff: datetime) -> bool:
+    raw_date = transcript.get("date")
+    if isinstance(raw_date, (int, float)):
+        return raw_date / 1000 < cutoff.timestamp()
+    try:
+        return datetime.fromisoformat(str(raw_date).replace("Z", "+00:00")) < cutoff
+    except ValueError:
+        return False
+
+
+class FirefliesClient:
+    """Shared Fireflies GraphQL client: pooled, rate-limited, coalescing and batching."""
+
+    def __init__(self, api_url: str = FIREFLIES_API_URL, api_key: str = FIREFLY_API_KEY):
+        self.api_url = api_url
+        self.api_key = api_key
+        self._client: Optional[httpx.AsyncClient] = None
+        # id → future of the request carrying it (queued or sent)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._queued: List[str] = []
+        # read-ahead ids no caller has asked for yet (memoized when they arrive)
+        self._unclaimed: set = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        # id → (fetched at, transcript) read ahead by prefetch()
+        self._prefetched: Dict[str, tuple] = {}
+        self.stats = {"requests": 0, "transcripts": 0, "coalesced": 0, "prefetch_hits": 0}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=FIREFLIES_TRANSCRIPT_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=FIREFLIES_MAX_CONNECTIONS,
+                    max_keepalive_connections=FIREFLIES_MAX_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _post(self, query: str, variables: Dict[str, Any], timeout: httpx.Timeout,
+                    context: str) -> Dict[str, Any]:
+        """One GraphQL request. Returns the decoded body; HTTP failures raise ProviderError."""
+        if not self.api_key:
+            raise ProviderError("FIREFLY_API_KEY is missing", "fireflies", "auth")
+        circuit_breakers.check("fireflies")
+        await fireflies_bucket.acquire(1)
+        self.stats["requests"] += 1
+        try:
+            resp = await self._get_client().post(
+                self.api_url,
+                json={"query": query, "variables": variables},
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {self.api_key}",
+                },
+                timeout=timeout,
+            )
+            resp.raise_for_status()
+        except httpx.HTTPError as e:
+            raise from_httpx(e, "fireflies").prefixed(context) from e
+        circuit_breakers.record_success("fireflies")
+        return resp.json()
+
+    # ── transcripts ──
+    async def fetch_transcript(self, transcript_id: str) -> Dict[str, Any]:
+        """One transcript, sharing a request with concurrent callers where possible."""
+        prefetched = self.take_prefetched(transcript_id)
+        if prefetched is not None:
+            return prefetched
+        return await asyncio.shield(self._enqueue(transcript_id))
+
+    async def fetch_transcripts(self, transcript_ids: Iterable[str]) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """Many transcripts in as few requests as the batch size allows. id → transcript or error."""
+        ids = list(dict.fromkeys(transcript_ids))
+        results = await asyncio.gather(*(self.fetch_transcript(i) for i in ids), return_exceptions=True)
+        return dict(zip(ids, results))
+
+    def _enqueue(self, transcript_id: str) -> asyncio.Future:
+        future = self._inflight.get(transcript_id)
+        if future is not None:
+            self.stats["coalesced"] += 1
+            self._unclaimed.discard(transcript_id)
+            return future
+        future = asyncio.get_running_loop().create_future()
+        # Retrieve unawaited prefetch errors so asyncio does not log them
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[transcript_id] = future
+        self._queued.append(transcript_id)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        return future
+
+    async def _flush_loop(self) -> None:
+        while self._queued:
+            await asyncio.sleep(FIREFLIES_BATCH_WINDOW_MS / 1000)
+            while self._queued:
+                batch, self._queued = self._queued[:FIREFLIES_BATCH_SIZE], self._queued[FIREFLIES_BATCH_SIZE:]
+                await self._send(batch)
+
+    async def _send(self, batch: List[str]) -> None:
+        try:
+            outcome = await self._fetch_batch(batch)
+        except Exception as e:
+            outcome = {transcript_id: e for transcript_id in batch}
+        for transcript_id in batch:
+            future = self._inflight.pop(transcript_id, None)
+            if future is None or future.done():
+                continue
+            result = outcome[transcript_id]
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _fetch_batch(self, batch: List[str]) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        context = "Fireflies transcript fetch failed"
+        data = await self._post(
+            build_batch_query(len(batch)),
+            {f"id{i}": transcript_id for i, transcript_id in enumerate(batch)},
+            FIREFLIES_TRANSCRIPT_TIMEOUT, context,
+        )
+        errors_by_alias: Dict[str, list] = {}
+        for error in data.get("errors") or []:
+            path = error.get("path") or []
+            errors_by_alias.setdefault(path[0] if path else None, []).append(error)
+        if None in errors_by_alias:
+            # Not tied to one transcript (quota, auth, malformed query): the whole request failed
+            raise from_graphql(errors_by_alias[None], "fireflies", context)
+
+        fields = data.get("data") or {}
+        outcome: Dict[str, Union[Dict[str, Any], Exception]] = {}
+        for i, transcript_id in enumerate(batch):
+            alias = f"t{i}"
+            if alias in errors_by_alias:
+                logger.warning(
+                    f"Fireflies transcript fetch returned GraphQL errors for {transcript_id}: {errors_by_alias[alias]}"
+                )
+                outcome[transcript_id] = from_graphql(errors_by_alias[alias], "fireflies", context)
+            elif not fields.get(alias):
+                outcome[transcript_id] = ProviderError("Fireflies transcript not found", "fireflies", "not_found")
+            else:
+                outcome[transcript_id] = _normalize(fields[alias])
+                self.stats["transcripts"] += 1
+        if len(batch) > 1:
+            logger.info(f"Fetched {len(batch)} Fireflies transcripts in one request")
+        return outcome
+
+    # ── read-ahead ──
+    def prefetch(self, transcript_ids: Iterable[str]) -> None:
+        """Start fetching transcripts that will be needed soon; failures are left to the real fetch."""
+        if circuit_breakers.get("fireflies") is not None:
+            # Never let read-ahead become an open breaker's half-open probe
+            return
+        self._expire_prefetched()
+        for transcript_id in transcript_ids:
+            if not transcript_id or transcript_id in self._prefetched or transcript_id in self._inflight:
+                continue
+            if len(self._prefetched) + len(self._queued) >= FIREFLIES_PREFETCH_MAX:
+                break
+            self._unclaimed.add(transcript_id)
+            self._enqueue(transcript_id).add_done_callback(
+                lambda f, transcript_id=transcript_id: self._store_prefetched(transcript_id, f)
+            )
+
+    def _store_prefetched(self, transcript_id: str, future: asyncio.Future) -> None:
+        if transcript_id not in self._unclaimed:
+            return
+        self._unclaimed.discard(transcript_id)
+        if not future.cancelled() and future.exception() is None:
+            self._prefetched[transcript_id] = (time.monotonic(), future.result())
+
+    def _expire_prefetched(self) -> None:
+        cutoff = time.monotonic() - FIREFLIES_PREFETCH_TTL_SECONDS
+        for transcript_id in [k for k, (ts, _) in self._prefetched.items() if ts < cutoff]:
+            del self._prefetched[transcript_id]
+
+    def is_pending(self, transcript_id: str) -> bool:
+        """True while the transcript is read ahead or on its way."""
+        return transcript_id in self._prefetched or transcript_id in self._inflight
+
+    def take_prefetched(self, transcript_id: str) -> Optional[Dict[str, Any]]:
+        """Hand out (and forget) a read-ahead transcript, if one arrived."""
+        entry = self._prefetched.pop(transcript_id, None)
+        if entry is None or entry[0] < time.monotonic() - FIREFLIES_PREFETCH_TTL_SECONDS:
+            return None
+        self.stats["prefetch_hits"] += 1
+        return entry[1]
+
+    def discard(self, transcript_ids: Iterable[str]) -> None:
+        for transcript_id in transcript_ids:
+            self._prefetched.pop(transcript_id, None)
+
+    # ── listing ──
+    async def list_transcripts(self, page_size: int = 50, max_pages: int = 4,
+                               from_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """List recent transcripts (id, title, date, duration), newest first, paginated.
+
+        With from_date only transcripts dated at or after it are returned, and
+        paging stops at the first page reaching past it.
+        """
+        variables: Dict[str, Any] = {"limit": page_size}
+        if from_date is not None:
+            variables["fromDate"] = from_date.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+        all_transcripts: List[Dict[str, Any]] = []
+        skip = 0
+        for _ in range(max_pages):
+            data = await self._post(LIST_QUERY, {**variables, "skip": skip}, FIREFLIES_LIST_TIMEOUT,
+                                    "Fireflies list failed")
+            if data.get("errors"):
+                raise from_graphql(data["errors"], "fireflies", "Fireflies list failed")
+            batch = (data.get("data") or {}).get("transcripts") or []
+            if from_date is not None:
+                in_range = [t for t in batch if not _dated_before(t, from_date)]
+                reached_end = len(in_range) < len(batch)
+                batch = in_range
+            else:
+                reached_end = False
+            all_transcripts.extend(batch)
+            if reached_end or len(batch) < page_size:
+                break
+            skip += page_size
+        return all_transcripts
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {**self.stats, "in_flight": len(self._inflight), "prefetched": len(self._prefetched)}
+
+
+fireflies_client = FirefliesClient()
@@ -0,0 +1,91 @@
+"""
+HTTP Client — One application-scoped connection pool for Notion bridge traffic.
+
+Every module (main, claude_agent, context_loader, output_validator,
+tools/notion_tools) used to open a fresh httpx.AsyncClient per call, paying a
+new TCP handshake for every tool call. They now share one pooled client:
+
+  - created lazily on first use (or eagerly on FastAPI startup) and closed on
+    shutdown via close_clients()
+  - keep-alive with bounded pool size (HTTP_MAX_CONNECTIONS /
+    HTTP_MAX_KEEPALIVE_CONNECTIONS), optional HTTP/2 when `h2` is installed
+  - every request passes the Notion circuit breaker (fails fast while it is
+    open) and then the Notion rate limiter hook from rate_limiter.py
+  - per-endpoint timeouts are the named httpx.Timeout constants below
+"""
+
+import os
+import logging
+import importlib.util
+from typing import Optional
+
+import httpx
+
+from rate_limiter import notion_request_hook
+from circuit_breaker import circuit_breakers
+
+logger = logging.getLogger(__name__)
+
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+HTTP_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
+NOTION_HTTP2 = os.getenv("NOTION_HTTP2", "false").lower() == "true"
+
+# Per-endpoint timeouts (read/write/pool); connect is always short so a dead
+# bridge fails fast instead of holding a pool slot for the full read timeout.
+NOTION_TIMEOUT = httpx.Timeout(30.0, connect=HTTP_CONNECT_TIMEOUT_SECONDS)
+CONTEXT_TIMEOUT = httpx.Timeout(30.0, connect=HTTP_CONNECT_TIMEOUT_SECONDS)
+REGISTER_TIMEOUT = httpx.Timeout(60.0, connect=HTTP_CONNECT_TIMEOUT_SECONDS)
+TRANSCRIPT_TIMEOUT = httpx.Timeout(120.0, connect=HTTP_CONNECT_TIMEOUT_SECONDS)
+
+_notion_client: Optional[httpx.AsyncClient] = None
+
+
+async def _notion_breaker_request_hook(request) -> None:
+    circuit_breakers.check("notion")
+
+
+async def _notion_breaker_response_hook(response) -> None:
+    # Any answer short of a 5xx/429 means the bridge and Notion are reachable again
+    if response.status_code < 500 and response.status_code != 429:
+        circuit_breakers.record_success("notion")
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_notion_client() -> httpx.AsyncClient:
+    """Shared pooled client for the Notion bridge (created on first use)."""
+    global _notion_client
+    if _notion_client is None or _notion_client.is_closed:
+        http2 = NOTION_HTTP2 and _http2_available()
+        if NOTION_HTTP2 and not http2:
+            logger.warning("NOTION_HTTP2=true but the 'h2' package is not installed — using HTTP/1.1")
+        _notion_client = httpx.AsyncClient(
+            http2=http2,
+            timeout=NOTION_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            event_hooks={
+                "request": [_notion_breaker_request_hook, notion_request_hook],
+                "response": [_notion_breaker_response_hook],
+            },
+        )
+        logger.info(
+            f"Notion bridge connection pool ready (max {HTTP_MAX_CONNECTIONS} connections, "
+            f"{HTTP_MAX_KEEPALIVE_CONNECTIONS} keep-alive, http2={http2})"
+        )
+    return _notion_client
+
+
+async def close_clients() -> None:
+    """Close the shared pool (FastAPI shutdown)."""
+    global _notion_client
+    if _notion_client is not None:
+        await _notion_client.aclose()
+        _notion_client = None
@@ -0,0 +1,67 @@
+"""
+Ingest Queue — Bounded priority queue in front of the meeting worker pool.
+
+/process-transcript enqueues here instead of spawning one background
+coroutine per webhook. The queue is bounded (INGEST_QUEUE_MAXSIZE), so a
+webhook burst gets an explicit 429 + Retry-After once it is full instead of
+piling up coroutines that each hold a whole transcript. Webhook deliveries
+that are rejected stay Pending in the Meeting Register and are picked up by
+the durable retry worker later, so nothing is lost.
+
+Ordering: lower priority value first, FIFO within the same priority.
+"""
+
+import asyncio
+import itertools
+from typing import Any, Dict, Optional, Tuple
+
+
+class IngestQueue:
+    """asyncio.PriorityQueue plus an index of queued meeting ids for position lookups."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=maxsize)
+        self._entries: Dict[str, Tuple[int, int]] = {}
+        self._counter = itertools.count()
+
+    def put_nowait(self, meeting_id: str, payload: Any, priority: int) -> int:
+        """Enqueue a meeting. Raises asyncio.QueueFull when at capacity. Returns the 1-based position."""
+        key = (priority, next(self._counter))
+        self._queue.put_nowait((key[0], key[1], meeting_id, payload))
+        self._entries[meeting_id] = key
+        return self.position(meeting_id)
+
+    async def get(self) -> Tuple[str, Any]:
+        """Wait for the next meeting in priority/FIFO order."""
+        _, _, meeting_id, payload = await self._queue.get()
+        self._queue.task_done()
+        self._entries.pop(meeting_id, None)
+        return meeting_id, payload
+
+    def drain_nowait(self) -> list:
+        """Remove and return every queued (meeting_id, payload) without waiting."""
+        drained = []
+        while not self._queue.empty():
+            _, _, meeting_id, payload = self._queue.get_nowait()
+            self._queue.task_done()
+            self._entries.pop(meeting_id, None)
+            drained.append((meeting_id, payload))
+        return drained
+
+    def __contains__(self, meeting_id: str) -> bool:
+        return meeting_id in self._entries
+
+    @property
+    def depth(self) -> int:
+        return len(self._entries)
+
+    def full(self) -> bool:
+        return self._queue.full()
+
+    def position(self, meeting_id: str) -> Optional[int]:
+        """1-based position of a queued meeting, or None when it is not queued."""
+        key = self._entries.get(meeting_id)
+        if key is None:
+            return None
+        return 1 + sum(1 for other in self._entries.values() if other < key)
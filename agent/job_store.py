@@ -0,0 +1,222 @@
+"""
+Job Store — Durable local record of every meeting job (SQLite, WAL mode).
+
+Replaces the in-memory processing_status dict. One row per meeting id holds
+the small, permanent facts (status, timestamps, error, created note, cost
+figures) in indexed columns, plus the bulky result payload (messages,
+validator log) as JSON that is dropped after JOB_RESULT_TTL_HOURS.
+
+Properties:
+  - /status lookups are a primary-key read; /cost-summary is a SQL aggregate
+  - memory stays flat: nothing is retained in the Python process
+  - survives restarts (point AGENT_DATA_DIR at a persistent volume); jobs
+    left queued/processing by a crash are marked "interrupted" on boot —
+    the Meeting Register row is still Pending, so the durable retry worker
+    finishes them
+
+The connection helper is shared by the other local stores (checkpoints,
+provider holds, register mirror) so the agent keeps a single database file.
+"""
+
+import os
+import json
+import sqlite3
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+AGENT_DATA_DIR = os.getenv("AGENT_DATA_DIR", "/tmp/agent-data")
+JOB_STORE_PATH = os.getenv("JOB_STORE_PATH", os.path.join(AGENT_DATA_DIR, "agent.sqlite3"))
+JOB_RESULT_TTL_HOURS = int(os.getenv("JOB_RESULT_TTL_HOURS", "72"))
+JOB_RETENTION_DAYS = int(os.getenv("JOB_RETENTION_DAYS", "365"))
+
+_connection: Optional[sqlite3.Connection] = None
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    meeting_id        TEXT PRIMARY KEY,
+    title             TEXT,
+    status            TEXT NOT NULL,
+    source            TEXT,
+    created_at        TEXT NOT NULL,
+    updated_at        TEXT NOT NULL,
+    completed_at      TEXT,
+    error             TEXT,
+    created_note_id   TEXT,
+    processing_method TEXT,
+    model_used        TEXT,
+    total_cost_usd    REAL,
+    cache_savings_usd REAL,
+    result_json       TEXT,
+    result_expires_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, updated_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_updated ON jobs(updated_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_completed ON jobs(completed_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_result_expiry ON jobs(result_expires_at) WHERE result_json IS NOT NULL;
+"""
+
+ACTIVE_STATUSES = ("queued", "processing")
+
+
+def get_connection() -> sqlite3.Connection:
+    """Process-wide SQLite connection (WAL, autocommit) shared by every local store."""
+    global _connection
+    if _connection is None:
+        directory = os.path.dirname(JOB_STORE_PATH)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(JOB_STORE_PATH, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        _connection = conn
+        logger.info(f"Local store opened at {JOB_STORE_PATH}")
+    return _connection
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobStore:
+    """Durable meeting job status, keyed by meeting id."""
+
+    def __init__(self, conn: Optional[sqlite3.Connection] = None):
+        self.conn = conn or get_connection()
+        self.conn.executescript(_SCHEMA)
+
+    def mark(self, meeting_id: str, status: str, title: Optional[str] = None,
+             source: Optional[str] = None, error: Optional[str] = None) -> None:
+        """Create or update a job's status (queued, processing, failed, interrupted...)."""
+        now = _now().isoformat()
+        self.conn.execute(
+            """
+            INSERT INTO jobs (meeting_id, title, status, source, created_at, updated_at, error)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(meeting_id) DO UPDATE SET
+                status = excluded.status,
+                title = COALESCE(excluded.title, jobs.title),
+                source = COALESCE(excluded.source, jobs.source),
+                updated_at = excluded.updated_at,
+                error = excluded.error
+            """,
+            (meeting_id, title, status, source, now, now, error),
+        )
+
+    def record_result(self, meeting_id: str, result: Dict[str, Any]) -> None:
+        """Store a finished run: summary columns permanently, the full payload until its TTL."""
+        now = _now()
+        cost = result.get("cost_analysis") or {}
+        status = "completed" if result.get("success") else "failed"
+        self.conn.execute(
+            """
+            INSERT INTO jobs (meeting_id, title, status, created_at, updated_at, completed_at, error,
+                              created_note_id, processing_method, model_used, total_cost_usd,
+                              cache_savings_usd, result_json, result_expires_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(meeting_id) DO UPDATE SET
+                title = COALESCE(excluded.title, jobs.title),
+                status = excluded.status,
+                updated_at = excluded.updated_at,
+                completed_at = excluded.completed_at,
+                error = excluded.error,
+                created_note_id = excluded.created_note_id,
+                processing_method = excluded.processing_method,
+                model_used = excluded.model_used,
+                total_cost_usd = excluded.total_cost_usd,
+                cache_savings_usd = excluded.cache_savings_usd,
+                result_json = excluded.result_json,
+                result_expires_at = excluded.result_expires_at
+            """,
+            (
+                meeting_id, result.get("title"), status, now.isoformat(), now.isoformat(), now.isoformat(),
+                result.get("error"), result.get("created_note_id"), result.get("processing_method"),
+                result.get("model_used"), cost.get("total_cost_usd"), cost.get("cache_savings_usd"),
+                json.dumps(result, default=str),
+                (now + timedelta(hours=JOB_RESULT_TTL_HOURS)).isoformat(),
+            ),
+        )
+
+    def get(self, meeting_id: str) -> Optional[Dict[str, Any]]:
+        """Return the job as the /status payload, or None if unknown."""
+        row = self.conn.execute("SELECT * FROM jobs WHERE meeting_id = ?", (meeting_id,)).fetchone()
+        if row is None:
+            return None
+        job = {
+            "status": row["status"],
+            "title": row["title"],
+            "updated_at": row["updated_at"],
+            "completed_at": row["completed_at"],
+            "created_note_id": row["created_note_id"],
+            "result": json.loads(row["result_json"]) if row["result_json"] else None,
+        }
+        if row["error"]:
+            job["error"] = row["error"]
+        if row["completed_at"] and not row["result_json"]:
+            job["result_evicted"] = True
+        return job
+
+    def get_status(self, meeting_id: str) -> Optional[str]:
+        row = self.conn.execute("SELECT status FROM jobs WHERE meeting_id = ?", (meeting_id,)).fetchone()
+        return row["status"] if row else None
+
+    def recover_interrupted(self) -> int:
+        """Mark jobs left queued/processing by a previous process as interrupted."""
+        cursor = self.conn.execute(
+            f"""
+            UPDATE jobs SET status = 'interrupted', updated_at = ?,
+                error = 'Agent restarted before this job finished; the durable retry worker will resume it'
+            WHERE status IN ({",".join("?" * len(ACTIVE_STATUSES))})
+            """,
+            (_now().isoformat(), *ACTIVE_STATUSES),
+        )
+        return cursor.rowcount
+
+    def evict_expired(self) -> Dict[str, int]:
+        """Drop result payloads past their TTL and job rows past the retention window."""
+        now = _now()
+        evicted = self.conn.execute(
+            "UPDATE jobs SET result_json = NULL WHERE result_json IS NOT NULL AND result_expires_at <= ?",
+            (now.isoformat(),),
+        ).rowcount
+        deleted = self.conn.execute(
+            "DELETE FROM jobs WHERE updated_at < ?",
+            ((now - timedelta(days=JOB_RETENTION_DAYS)).isoformat(),),
+        ).rowcount
+        return {"results_evicted": evicted, "jobs_deleted": deleted}
+
+    def cost_summary(self) -> Dict[str, Any]:
+        """Aggregate cost figures across all completed meetings."""
+        totals = self.conn.execute(
+            """
+            SELECT COUNT(*) AS n, COALESCE(SUM(total_cost_usd), 0) AS cost,
+                   COALESCE(SUM(cache_savings_usd), 0) AS savings
+            FROM jobs WHERE status = 'completed'
+            """
+        ).fetchone()
+        by_method = {"standard": 0, "two_pass": 0}
+        for row in self.conn.execute(
+            "SELECT COALESCE(processing_method, 'standard') AS method, COUNT(*) AS n "
+            "FROM jobs WHERE status = 'completed' GROUP BY method"
+        ):
+            by_method[row["method"]] = row["n"]
+        by_model = {}
+        for row in self.conn.execute(
+            "SELECT COALESCE(model_used, 'unknown') AS model, COUNT(*) AS n, COALESCE(SUM(total_cost_usd), 0) AS cost "
+            "FROM jobs WHERE status = 'completed' GROUP BY model"
+        ):
+            by_model[row["model"]] = {"count": row["n"], "cost": row["cost"]}
+
+        completed = totals["n"]
+        return {
+            "meetings_processed": completed,
+            "total_cost_usd": round(totals["cost"], 4),
+            "total_cache_savings_usd": round(totals["savings"], 4),
+            "average_cost_per_meeting": round(totals["cost"] / max(completed, 1), 4),
+            "by_processing_method": by_method,
+            "by_model": by_model,
+        }
@@ -1,9 +1,11 @@
 import os
-import time
+import asyncio
 import logging
-import anthropic as _anthropic
-from anthropic import Anthropic
-from typing import List, Dict, Tuple, Optional
+from anthropic import AsyncAnthropic
+from typing import List, Dict, Tuple, Optional, Union
+from rate_limiter import anthropic_budget
+from errors import ProviderError
+from compact_transcript import CompactTranscript
 
 logger = logging.getLogger(__name__)
 
@@ -29,51 +31,33 @@ def estimate_tokens(text: str) -> int:
     return len(text) // 4
 
 
-def chunk_transcript(sentences: List[Dict], max_tokens_per_chunk: int = MAX_TOKENS_PER_CHUNK) -> List[str]:
-    """Split transcript sentences into token-bounded chunks."""
-    chunks = []
-    current_lines = []
-    current_tokens = 0
-
-    for s in sentences:
-        speaker = s.get('speaker_name') or 'Speaker'
-        text = s.get('text', '')
-        line = f"**{speaker}**: {text}"
-        line_tokens = estimate_tokens(line)
-
-        if current_tokens + line_tokens > max_tokens_per_chunk and current_lines:
-            chunks.append('\n'.join(current_lines))
-            current_lines = []
-            current_tokens = 0
-
-        current_lines.append(line)
-        current_tokens += line_tokens
-
-    if current_lines:
-        chunks.append('\n'.join(current_lines))
-
-    return chunks
+def chunk_transcript(transcript: Union[CompactTranscript, List[Dict]],
+                     max_tokens_per_chunk: int = MAX_TOKENS_PER_CHUNK) -> List[str]:
+    """Split a transcript into token-bounded chunks (one slice of the rendered buffer per chunk)."""
+    if not isinstance(transcript, CompactTranscript):
+        transcript = CompactTranscript.from_sentences(transcript)
+    return transcript.chunks(max_tokens_per_chunk)
 
 
 _RETRY_DELAYS = [5, 15, 30, 60, 120]
 
 
-def _sync_call_with_retry(client, **kwargs):
-    """Sync retry wrapper for extraction calls."""
+async def _call_with_retry(client, **kwargs):
+    """Async retry wrapper for extraction calls."""
     for attempt, delay in enumerate(_RETRY_DELAYS):
         try:
-            return client.messages.create(**kwargs)
-        except (_anthropic.RateLimitError, _anthropic.InternalServerError, _anthropic.APIConnectionError) as e:
-            if attempt == len(_RETRY_DELAYS) - 1:
+            return await anthropic_budget.create(client, **kwargs)
+        except ProviderError as e:
+            if not e.transient or attempt == len(_RETRY_DELAYS) - 1:
                 raise
             logger.warning(
-                f"Claude API error ({type(e).__name__}), retrying in {delay}s "
+                f"Claude API error ({e.kind}, HTTP {e.status_code}), retrying in {delay}s "
                 f"(attempt {attempt + 1}/{len(_RETRY_DELAYS)})..."
             )
-            time.sleep(delay)
+            await asyncio.sleep(delay)
 
 
-def extract_from_chunk(client: Anthropic, chunk: str, chunk_num: int, total_chunks: int, context_brief: str = "") -> Tuple[str, dict]:
+async def extract_from_chunk(client: AsyncAnthropic, chunk: str, chunk_num: int, total_chunks: int, context_brief: str = "") -> Tuple[str, dict]:
     """Use Haiku to extract key info from a single transcript chunk.
 
     Returns (extracted_text, usage_dict).
@@ -95,7 +79,7 @@ def extract_from_chunk(client: Anthropic, chunk: str, chunk_num: int, total_chun
         system_prompt += f"\nADDITIONAL CONTEXT:\n{context_brief}\n"
     system_prompt += "\nExtract actionable information concisely and thoroughly. Preserve all names exactly."
 
-    response = _sync_call_with_retry(
+    response = await _call_with_retry(
         client,
         model=SONNET_MODEL,
         max_tokens=2048,
@@ -117,7 +101,8 @@ def extract_from_chunk(client: Anthropic, chunk: str, chunk_num: int, total_chun
     return response.content[0].text, usage
 
 
-def process_long_meeting(client: Anthropic, sentences: List[Dict], context_brief: str = "") -> dict:
+async def process_long_meeting(client: AsyncAnthropic, transcript: Union[CompactTranscript, List[Dict]],
+                               context_brief: str = "") -> dict:
     """Process a long meeting transcript using chunked Haiku extraction.
 
     Args:
@@ -129,14 +114,14 @@ def process_long_meeting(client: Anthropic, sentences: List[Dict], context_brief
       - num_chunks: how many chunks were processed
       - haiku_usage: aggregated token usage from extraction pass
     """
-    chunks = chunk_transcript(sentences)
+    chunks = chunk_transcript(transcript)
     logger.info(f"Split long transcript into {len(chunks)} chunks")
 
     extracted_sections = []
     total_usage = {"input_tokens": 0, "output_tokens": 0}
 
     for i, chunk in enumerate(chunks, 1):
-        extraction, usage = extract_from_chunk(client, chunk, i, len(chunks), context_brief)
+        extraction, usage = await extract_from_chunk(client, chunk, i, len(chunks), context_brief)
         extracted_sections.append(f"### Segment {i} of {len(chunks)}\n{extraction}")
         total_usage["input_tokens"] += usage["input_tokens"]
         total_usage["output_tokens"] += usage["output_tokens"]
@@ -1,13 +1,15 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, field_validator
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
 from datetime import datetime
 import asyncio
 import logging
 import os
 import re
+import random
+import time
 import traceback
 import httpx
 from datetime import timezone, timedelta
@@ -18,6 +20,26 @@ from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
 
 from claude_agent import process_meeting_transcript
+from context_loader import warm_notion_context
+from rate_limiter import limiter_snapshot, notion_bucket, AdaptiveConcurrency
+from http_client import close_clients, get_notion_client, NOTION_TIMEOUT, REGISTER_TIMEOUT, TRANSCRIPT_TIMEOUT
+from ingest_queue import IngestQueue
+from job_store import JobStore
+from checkpoint_store import checkpoint_store
+from circuit_breaker import circuit_breakers
+from errors import ProviderError, as_provider_error, result_error
+from single_flight import meeting_flights, meeting_lease, check_lease, LeaseHeldElsewhere, LEASE_ROW_SOURCE
+from register_mirror import register_mirror
+from retry_scheduler import retry_scheduler
+from register_patches import register_patches
+from fireflies_client import fireflies_client, FIREFLIES_BATCH_SIZE
+from transcript_cache import transcript_cache
+from transcript_append import transcript_appender
+from transcript_snapshot import SnapshotFormatError, decode_snapshot, is_compact, snapshot_body, without_attachments
+from compact_transcript import get_compact_transcript, discard_compact_transcript
+from transcript_spool import (
+    spool_sentences, spool_ndjson_stream, release_sentences, clear_orphaned_spools,
+)
 
 # Enhanced logging for Railway visibility
 log_level = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -57,6 +79,7 @@ class TranscriptSummary(BaseModel):
 class Sentence(BaseModel):
     speaker_name: Optional[str] = None
     text: str
+    start_time: Optional[float] = None
 
 
 class TranscriptData(BaseModel):
@@ -90,22 +113,154 @@ class ProcessingResult(BaseModel):
     summary: Optional[str] = None
 
 
-# In-memory processing status (use Redis/DB in production)
-processing_status: Dict[str, Any] = {}
+# Durable job status (SQLite, WAL) — survives restarts, bulky results expire
+JOB_STORE_MAINTENANCE_MINUTES = int(os.getenv("JOB_STORE_MAINTENANCE_MINUTES", "60"))
+job_store = JobStore()
+_job_store_maintenance_task: Optional[asyncio.Task] = None
 
-# Queue of meetings waiting to be processed
-_processing_queue: asyncio.Queue = None
-# Semaphore: only 1 meeting processed at a time to avoid Claude rate limits
+# Worker pool: how many meetings may run the agentic loop at once. Provider
+# budgets are enforced separately by the shared limiters in rate_limiter.py,
+# so this can be raised until the Anthropic/Notion buckets become the bottleneck.
+MAX_CONCURRENT_MEETINGS = max(1, int(os.getenv("MAX_CONCURRENT_MEETINGS", "3")))
 _processing_semaphore: asyncio.Semaphore = None
+_meetings_in_flight = 0
+
+# Bounded priority queue behind /process-transcript. When full, webhooks get
+# 429 + Retry-After; the Meeting Register row stays Pending for the retry worker.
+INGEST_QUEUE_MAXSIZE = max(1, int(os.getenv("INGEST_QUEUE_MAXSIZE", "25")))
+INGEST_DEFAULT_PRIORITY = int(os.getenv("INGEST_DEFAULT_PRIORITY", "5"))
+# Seed for the Retry-After estimate until real meeting durations are observed
+INGEST_EXPECTED_MEETING_SECONDS = int(os.getenv("INGEST_EXPECTED_MEETING_SECONDS", "300"))
+_ingest_queue: Optional[IngestQueue] = None
+_ingest_worker_tasks: List[asyncio.Task] = []
+_avg_meeting_seconds = float(INGEST_EXPECTED_MEETING_SECONDS)
+
+# Graceful drain: on shutdown (or POST /worker/drain) new work is refused with 503,
+# in-flight meetings stop at their next iteration boundary (after checkpointing),
+# and everything unfinished goes back to the durable queue with nextRetryAt=now.
+# POST /worker/resume restarts the workers after an operator drain.
+SHUTDOWN_DRAIN_SECONDS = int(os.getenv("SHUTDOWN_DRAIN_SECONDS", "60"))
+DRAIN_RETRY_AFTER_SECONDS = int(os.getenv("DRAIN_RETRY_AFTER_SECONDS", "60"))
+_drain_event: Optional[asyncio.Event] = None
+_drain_in_progress = False
+_active_runs: Dict[str, Optional[str]] = {}  # meeting id → Meeting Register row id (if known)
 
 
 def _get_semaphore():
     global _processing_semaphore
     if _processing_semaphore is None:
-        _processing_semaphore = asyncio.Semaphore(1)
+        _processing_semaphore = asyncio.Semaphore(MAX_CONCURRENT_MEETINGS)
     return _processing_semaphore
 
 
+def _get_drain_event() -> asyncio.Event:
+    global _drain_event
+    if _drain_event is None:
+        _drain_event = asyncio.Event()
+    return _drain_event
+
+
+def _is_draining() -> bool:
+    return _drain_event is not None and _drain_event.is_set()
+
+
+def _reject_if_draining() -> None:
+    if _is_draining():
+        raise HTTPException(
+            status_code=503,
+            detail="Agent is draining for shutdown; retry shortly",
+            headers={"Retry-After": str(DRAIN_RETRY_AFTER_SECONDS)},
+        )
+
+
+def _get_ingest_queue() -> IngestQueue:
+    global _ingest_queue
+    if _ingest_queue is None:
+        _ingest_queue = IngestQueue(INGEST_QUEUE_MAXSIZE)
+    return _ingest_queue
+
+
+def _estimate_queue_wait_seconds(ahead: int) -> int:
+    """Rough time until `ahead` queued meetings have drained through the worker pool."""
+    rounds = -(-max(ahead, 1) // MAX_CONCURRENT_MEETINGS)
+    return max(30, int(rounds * _avg_meeting_seconds))
+
+
+async def _run_in_worker_pool(transcript_data: dict, meeting_register_id: Optional[str] = None,
+                              resume: bool = False) -> dict:
+    """Run one meeting through the agent once a worker-pool slot is free."""
+    global _meetings_in_flight, _avg_meeting_seconds
+    sem = _get_semaphore()
+    if sem.locked():
+        logger.info(
+            f"Meeting {transcript_data.get('id')} waiting for a worker slot "
+            f"({MAX_CONCURRENT_MEETINGS} meeting(s) already processing)"
+        )
+    async with sem:
+        meeting_id = transcript_data.get("id")
+        drain_event = _get_drain_event()
+        if drain_event.is_set():
+            # Got a slot only after shutdown began — leave it to the durable queue
+            _active_runs.setdefault(meeting_id, meeting_register_id)
+            job_store.mark(meeting_id, "interrupted", error="Agent drained before this meeting started")
+            return {"success": False, "drained": True, "error": "Agent drained before this meeting started"}
+
+        _meetings_in_flight += 1
+        _active_runs[meeting_id] = meeting_register_id
+        started = asyncio.get_running_loop().time()
+        job_store.mark(meeting_id, "processing", title=transcript_data.get("title"),
+                       source="retry_worker" if meeting_register_id else "webhook")
+        result = None
+        try:
+            result = await process_meeting_transcript(
+                transcript_data, meeting_register_id=meeting_register_id, resume=resume,
+                stop_event=drain_event,
+            )
+            if result.get("drained"):
+                job_store.mark(meeting_id, "interrupted", error=result.get("error"))
+            else:
+                job_store.record_result(meeting_id, result)
+            return result
+        except Exception as e:
+            job_store.mark(meeting_id, "failed", error=str(e))
+            raise
+        finally:
+            _meetings_in_flight -= 1
+            # Drained runs stay registered so the shutdown drain hands them back to the durable queue
+            if not drain_event.is_set():
+                _active_runs.pop(meeting_id, None)
+            if result is not None and not result.get("drained"):
+                elapsed = asyncio.get_running_loop().time() - started
+                _avg_meeting_seconds = 0.8 * _avg_meeting_seconds + 0.2 * elapsed
+
+
+async def _process_meeting_once(transcript_data: dict, meeting_register_id: Optional[str] = None,
+                                meeting_id: Optional[str] = None, resume: bool = False) -> Tuple[dict, bool]:
+    """
+    Single-flight entry point shared by the webhook queue, the retry worker and the sync endpoint.
+    Returns (result, shared); shared=True means this caller attached to a run already in flight.
+    Raises LeaseHeldElsewhere when another replica holds the meeting's processing lease.
+    resume=True continues from the meeting's agent-loop checkpoint, if one exists.
+    """
+    meeting_id = meeting_id or transcript_data.get("id")
+
+    async def _run() -> dict:
+        async with meeting_lease(meeting_id):
+            return await _run_in_worker_pool(transcript_data, meeting_register_id=meeting_register_id, resume=resume)
+
+    return await meeting_flights.do(meeting_id, _run)
+
+
+async def _ingest_worker_loop(worker_index: int):
+    """Pull meetings off the ingest queue in priority/FIFO order."""
+    queue = _get_ingest_queue()
+    logger.info(f"Ingest worker {worker_index} started")
+    while True:
+        meeting_id, transcript_data = await queue.get()
+        logger.info(f"Ingest worker {worker_index} picked up meeting {meeting_id} ({queue.depth} still queued)")
+        await process_transcript_background(transcript_data)
+
+
 @app.get("/")
 async def root():
     return {"status": "ok", "service": "claude-meeting-agent"}
@@ -113,39 +268,105 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "claude-meeting-agent"}
+    return {"status": "healthy", "service": "claude-meeting-agent", "draining": _is_draining()}
 
 
-@app.post("/process-transcript", response_model=ProcessingResult)
-async def process_transcript(transcript: TranscriptData, background_tasks: BackgroundTasks):
-    """
-    Process a meeting transcript asynchronously.
-    Returns immediately and processes in background.
-    """
-    meeting_id = transcript.id
+def _spool_transcript(transcript: TranscriptData) -> dict:
+    """Convert a validated request body into a transcript dict whose sentences live on disk."""
+    transcript_data = transcript.model_dump(exclude={"sentences"})
+    transcript_data["sentences"] = spool_sentences(
+        transcript.id, (s.model_dump() for s in transcript.sentences or [])
+    )
+    return transcript_data
+
+
+def _enqueue_transcript(transcript_data: dict, priority: Optional[int]) -> ProcessingResult:
+    """Put a spooled transcript on the ingest queue, or raise 409/429."""
+    meeting_id = transcript_data["id"]
+    queue = _get_ingest_queue()
 
-    # Check if already processing
-    if meeting_id in processing_status and processing_status[meeting_id].get("status") == "processing":
-        raise HTTPException(status_code=409, detail="Meeting is already being processed")
+    # Check if already queued or processing
+    if meeting_id in queue or job_store.get_status(meeting_id) == "processing":
+        release_sentences(transcript_data)
+        raise HTTPException(status_code=409, detail="Meeting is already queued or being processed")
 
-    # Mark as processing
-    processing_status[meeting_id] = {"status": "processing", "result": None}
+    try:
+        position = queue.put_nowait(
+            meeting_id,
+            transcript_data,
+            INGEST_DEFAULT_PRIORITY if priority is None else priority,
+        )
+    except asyncio.QueueFull:
+        release_sentences(transcript_data)
+        retry_after = _estimate_queue_wait_seconds(queue.depth)
+        logger.warning(f"Ingest queue full ({queue.depth}/{INGEST_QUEUE_MAXSIZE}) — rejecting meeting {meeting_id}")
+        raise HTTPException(
+            status_code=429,
+            detail=f"Ingest queue is full ({queue.depth} meetings waiting); retry later",
+            headers={"Retry-After": str(retry_after)},
+        )
 
-    # Process in background
-    background_tasks.add_task(process_transcript_background, transcript.model_dump())
+    job_store.mark(meeting_id, "queued", title=transcript_data.get("title"), source="webhook")
+    logger.info(
+        f"Meeting {meeting_id} queued at position {position} ({queue.depth}/{INGEST_QUEUE_MAXSIZE}), "
+        f"{len(transcript_data.get('sentences') or [])} sentences spooled"
+    )
 
     return ProcessingResult(
         meeting_id=meeting_id,
-        title=transcript.title,
+        title=transcript_data.get("title"),
         success=True,
-        summary="Processing started in background"
+        summary=f"Queued for background processing (position {position})"
     )
 
 
+@app.post("/process-transcript", response_model=ProcessingResult)
+async def process_transcript(transcript: TranscriptData, priority: Optional[int] = None):
+    """
+    Queue a meeting transcript for asynchronous processing.
+    Returns immediately; lower `priority` values are processed first (FIFO within a priority).
+    Responds 429 with Retry-After when the ingest queue is full.
+    The whole JSON body is parsed before the sentences are spooled, so ingest memory grows
+    with the transcript; /process-transcript/stream is the memory-bounded variant.
+    """
+    _reject_if_draining()
+    return _enqueue_transcript(_spool_transcript(transcript), priority)
+
+
+@app.post("/process-transcript/stream", response_model=ProcessingResult)
+async def process_transcript_stream(request: Request, priority: Optional[int] = None):
+    """
+    Streaming variant of /process-transcript for long meetings (Content-Type: application/x-ndjson).
+    Line 1 is the transcript metadata (TranscriptData without sentences); every following line is
+    one sentence. Sentences are spooled to disk as they arrive, so memory stays bounded.
+    """
+    _reject_if_draining()
+    try:
+        header, sentences = await spool_ndjson_stream(request.stream())
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid NDJSON transcript: {e}")
+    try:
+        metadata = TranscriptData.model_validate(header)
+    except Exception as e:
+        sentences.close(delete=True)
+        raise HTTPException(status_code=422, detail=f"Invalid transcript metadata: {e}")
+    transcript_data = metadata.model_dump(exclude={"sentences"})
+    transcript_data["sentences"] = sentences
+    return _enqueue_transcript(transcript_data, priority)
+
+
 NOTION_API_BASE = os.getenv("NOTION_API_BASE", "http://127.0.0.1:8080")
-FIREFLY_API_KEY = os.getenv("FIREFLY_API_KEY", "")
 ENABLE_DURABLE_RETRY_WORKER = os.getenv("ENABLE_DURABLE_RETRY_WORKER", "true").lower() == "true"
 RETRY_POLL_SECONDS = int(os.getenv("RETRY_POLL_SECONDS", "20"))
+# Longest the retry worker sleeps when nothing is due; it otherwise wakes exactly at
+# the next nextRetryAt, or immediately on a webhook / operator retry.
+RETRY_RESYNC_SECONDS = int(os.getenv("RETRY_RESYNC_SECONDS", "300"))
+# Due rows claimed and processed at once per replica (Claude runs are still capped by MAX_CONCURRENT_MEETINGS)
+RETRY_ROW_CONCURRENCY = max(1, int(os.getenv("RETRY_ROW_CONCURRENCY", str(MAX_CONCURRENT_MEETINGS))))
+# Rows deferred behind a provider hold are released one slot apart (plus jitter) instead of all at
+# `until`; after a hold the retry window restarts at one row and widens as rows succeed (AIMD).
+OUTAGE_RELEASE_INTERVAL_SECONDS = float(os.getenv("OUTAGE_RELEASE_INTERVAL_SECONDS", "15"))
+retry_concurrency = AdaptiveConcurrency("retry-rows", RETRY_ROW_CONCURRENCY)
 RATE_LIMIT_COOLDOWN_MINUTES = int(os.getenv("RATE_LIMIT_COOLDOWN_MINUTES", "15"))
 BILLING_COOLDOWN_MINUTES = int(os.getenv("BILLING_COOLDOWN_MINUTES", "360"))
 AUTH_COOLDOWN_MINUTES = int(os.getenv("AUTH_COOLDOWN_MINUTES", "180"))
@@ -166,78 +387,120 @@ ENABLE_AUTO_BACKFILL = os.getenv("ENABLE_AUTO_BACKFILL", "true").lower() == "tru
 AUTO_BACKFILL_INTERVAL_HOURS = int(os.getenv("AUTO_BACKFILL_INTERVAL_HOURS", "24"))
 AUTO_BACKFILL_LOOKBACK_DAYS = int(os.getenv("AUTO_BACKFILL_LOOKBACK_DAYS", "14"))
 AUTO_BACKFILL_INITIAL_DELAY_SECONDS = int(os.getenv("AUTO_BACKFILL_INITIAL_DELAY_SECONDS", "600"))
+# Re-list this far behind the last pass's newest meeting: Fireflies lists a transcript
+# only once it has been processed, which can be hours after the meeting started
+AUTO_BACKFILL_OVERLAP_HOURS = int(os.getenv("AUTO_BACKFILL_OVERLAP_HOURS", "24"))
+BACKFILL_HIGH_WATER_KEY = "backfill_high_water"
+AUTO_BACKFILL_BATCH_SIZE = max(1, int(os.getenv("AUTO_BACKFILL_BATCH_SIZE", "25")))
+AUTO_BACKFILL_CONCURRENCY = max(1, int(os.getenv("AUTO_BACKFILL_CONCURRENCY", "4")))
+# Notion calls per bridge upsert: find by external id, then create or update
+BACKFILL_UPSERT_NOTION_CALLS = 2
+_backfill_batch_supported = True
+# Background snapshot stores (register row id -> task); awaited briefly on shutdown
+_write_through_tasks: Dict[str, asyncio.Task] = {}
+# Background transcript appends (note id -> task); resumable, so shutdown only waits briefly
+_transcript_append_tasks: Dict[str, asyncio.Task] = {}
+# Retry rows whose transcript loads ahead of their turn while earlier rows are in the agent loop
+RETRY_PIPELINE_DEPTH = max(0, int(os.getenv("RETRY_PIPELINE_DEPTH", "1")))
+_retry_transcript_prefetches: Dict[str, asyncio.Task] = {}
 
 _retry_worker_task: Optional[asyncio.Task] = None
 _auto_backfill_task: Optional[asyncio.Task] = None
-_provider_outages: Dict[str, Dict[str, Any]] = {}
 
 
 async def _append_transcript_to_note(note_id: str, transcript_data: dict):
-    """After agent completes, store the raw transcript as a child page in the meeting note."""
-    sentences = transcript_data.get("sentences", [])
-    if not sentences:
+    """After agent completes, store the raw transcript in the meeting note, page by page (resumable)."""
+    compact = get_compact_transcript(transcript_data)
+    if not compact:
         logger.info("No sentences to append — skipping transcript storage")
         return
+    meeting_id = transcript_data.get("id")
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{NOTION_API_BASE}/api/notes/{note_id}/transcript",
-                json={
-                    "sentences": [
-                        {
-                            "speaker_name": s.get("speaker_name"),
-                            "start_time": s.get("start_time"),
-                            "text": s.get("text", ""),
-                        }
-                        for s in sentences
-                    ],
-                    "transcript_url": transcript_data.get("transcript_url"),
-                },
-                timeout=120.0,
-            )
-            data = resp.json()
-            if data.get("success"):
-                logger.info(f"Transcript appended: {data.get('blocks_written')} blocks → child page {data.get('child_page_id')}")
-            else:
-                logger.warning(f"Transcript append returned: {data}")
+        if meeting_id and not transcript_cache.cached_ids([meeting_id]):
+            # Keep a local copy so the resume sweep can finish the append after a restart
+            await transcript_cache.put(meeting_id, transcript_data)
+        await transcript_appender.append(note_id, compact, transcript_data.get("transcript_url"), meeting_id)
     except Exception as e:
-        logger.warning(f"Transcript append failed (non-critical): {e}")
+        logger.warning(f"Transcript append for note {note_id} stopped: {e} — acknowledged pages are kept and "
+                       f"the rest is resumed by job store maintenance")
 
 
-async def process_transcript_background(transcript_data: dict):
-    """Background task to process transcript — queued so only 1 runs at a time."""
-    meeting_id = transcript_data["id"]
-    sem = _get_semaphore()
+def _schedule_transcript_append(note_id: str, transcript_data: dict, release: bool = False) -> None:
+    """
+    Append the transcript off the meeting's critical path. With release=True the task owns the
+    transcript and frees its compact rendering and spool file when it finishes.
+    """
+    def _release() -> None:
+        if release:
+            discard_compact_transcript(transcript_data)
+            release_sentences(transcript_data)
 
-    queue_position = sem._value  # 0 = will wait, 1 = runs immediately
-    if queue_position == 0:
-        logger.info(f"Meeting {meeting_id} queued — another meeting is processing")
+    if note_id in _transcript_append_tasks:
+        _release()
+        return
 
-    async with sem:
+    async def _run() -> None:
         try:
-            logger.info(f"Starting processing for meeting: {meeting_id} - {transcript_data.get('title')}")
-            result = await process_meeting_transcript(transcript_data)
-
-            processing_status[meeting_id] = {
-                "status": "completed",
-                "result": result
-            }
-            logger.info(f"Completed processing for meeting: {meeting_id}")
-
-            # Auto-append raw transcript as child page inside the meeting note
-            note_id = result.get("created_note_id")
-            if note_id:
-                logger.info(f"Appending transcript to note {note_id}...")
-                await _append_transcript_to_note(note_id, transcript_data)
-            else:
-                logger.warning("No created_note_id in result — transcript not appended")
+            await _append_transcript_to_note(note_id, transcript_data)
+        finally:
+            _release()
 
-        except Exception as e:
-            logger.error(f"Error processing meeting {meeting_id}: {e}")
-            processing_status[meeting_id] = {
-                "status": "failed",
-                "error": str(e)
-            }
+    task = asyncio.create_task(_run())
+    _transcript_append_tasks[note_id] = task
+    task.add_done_callback(lambda _: _transcript_append_tasks.pop(note_id, None))
+
+
+async def _resume_transcript_appends() -> int:
+    """Restart unfinished transcript appends (failed, or cut off by a restart) from their last acknowledged page."""
+    resumed = 0
+    for record in transcript_appender.unfinished():
+        note_id = record["note_id"]
+        if note_id in _transcript_append_tasks:
+            continue
+        transcript = await transcript_cache.get(record["meeting_id"]) if record["meeting_id"] else None
+        if not transcript:
+            transcript_appender.abandon(note_id, "no local transcript copy to resume from")
+            logger.warning(f"Transcript append for note {note_id} cannot resume: no local transcript copy")
+            continue
+        _schedule_transcript_append(note_id, transcript)
+        resumed += 1
+    return resumed
+
+
+async def process_transcript_background(transcript_data: dict):
+    """Background task to process transcript — runs once a worker-pool slot is free."""
+    meeting_id = transcript_data["id"]
+    append_scheduled = False
+    try:
+        logger.info(f"Starting processing for meeting: {meeting_id} - {transcript_data.get('title')}")
+        result, shared = await _process_meeting_once(transcript_data)
+        if shared:
+            logger.info(f"Meeting {meeting_id} was already processing elsewhere in this agent — reused its result")
+            return
+        if result.get("drained"):
+            logger.info(f"Meeting {meeting_id} stopped for shutdown drain; the durable retry worker will finish it")
+            return
+        logger.info(f"Completed processing for meeting: {meeting_id}")
+
+        # Auto-append raw transcript as child page inside the meeting note, in the background;
+        # the append task releases the transcript when it is done
+        note_id = result.get("created_note_id")
+        if note_id:
+            logger.info(f"Appending transcript to note {note_id} in the background...")
+            _schedule_transcript_append(note_id, transcript_data, release=True)
+            append_scheduled = True
+        else:
+            logger.warning("No created_note_id in result — transcript not appended")
+
+    except LeaseHeldElsewhere as e:
+        logger.info(str(e))
+        job_store.mark(meeting_id, "duplicate", error=str(e))
+    except Exception as e:
+        logger.error(f"Error processing meeting {meeting_id}: {e}")
+    finally:
+        if not append_scheduled:
+            discard_compact_transcript(transcript_data)
+            release_sentences(transcript_data)
 
 
 def _now_iso() -> str:
@@ -246,7 +509,7 @@ def _now_iso() -> str:
 
 
 def _detect_provider(error_text: str) -> str:
-    """Best-effort provider detection for retry classification and service holds."""
+    """Best-effort provider detection for untyped errors (see _classify_error_text)."""
     text = (error_text or "").lower()
     if any(marker in text for marker in ["fireflies", "graphql", "transcript fetch", "transcript not found", "firefly_api_key"]):
         return "fireflies"
@@ -297,45 +560,34 @@ def _extract_retry_after_iso(error_text: str) -> Optional[str]:
 
 
 def _get_active_provider_outage() -> Optional[Dict[str, Any]]:
-    """Return the current provider-wide outage hold, if any, and purge expired holds."""
-    now_dt = datetime.now(timezone.utc)
-    expired = [
-        provider for provider, state in _provider_outages.items()
-        if state["until_dt"] <= now_dt
-    ]
-    for provider in expired:
-        del _provider_outages[provider]
-
-    if not _provider_outages:
-        return None
-
+    """Return the circuit breaker currently holding work back (open, or half-open with its probe out), if any."""
     # Any active outage blocks processing because all meetings need the same upstream services.
-    return max(_provider_outages.values(), key=lambda state: state["until_dt"])
+    return circuit_breakers.blocking()
 
 
 def _clear_provider_outages() -> List[str]:
-    """Clear in-memory provider holds after credits are restored or operator intervention."""
-    cleared = list(_provider_outages.keys())
-    _provider_outages.clear()
-    return cleared
-
-
-def _register_provider_outage(classification: Dict[str, Any], error_text: str, next_retry_at: Optional[str]) -> Dict[str, Any]:
-    """Pause the worker for provider-wide outages like credits/auth/rate limits."""
-    provider = classification.get("provider", "upstream")
-    until_iso = next_retry_at or _compute_next_retry_iso(0)
-    until_dt = datetime.fromisoformat(until_iso.replace("Z", "+00:00"))
-    state = {
-        "provider": provider,
-        "code": classification["code"],
-        "message": error_text,
-        "until_iso": until_dt.astimezone(timezone.utc).isoformat(),
-        "until_dt": until_dt.astimezone(timezone.utc),
-    }
-    existing = _provider_outages.get(provider)
-    if not existing or existing["until_dt"] < state["until_dt"]:
-        _provider_outages[provider] = state
-    return _provider_outages[provider]
+    """Close every provider breaker after credits are restored or operator intervention."""
+    return circuit_breakers.reset()
+
+
+def _register_provider_outage(classification: Dict[str, Any], error_text: str) -> Dict[str, Any]:
+    """Trip the provider's circuit breaker for provider-wide outages like credits/auth/rate limits."""
+    if classification.get("breaker_refusal"):
+        # The breaker refused the call itself; that is not a new failure
+        state = circuit_breakers.get(classification.get("provider", "upstream"))
+        if state is not None:
+            return state
+    retry_after = classification.get("next_retry_at")
+    state = circuit_breakers.trip(
+        classification.get("provider", "upstream"),
+        classification["code"],
+        error_text,
+        retry_after=datetime.fromisoformat(retry_after.replace("Z", "+00:00")) if retry_after else None,
+        max_open_seconds=classification.get("cooldown_minutes", RATE_LIMIT_COOLDOWN_MINUTES) * 60,
+    )
+    # Probe the provider with a single row once the hold ends
+    retry_concurrency.probe()
+    return state
 
 
 def _build_hold_message(classification: Dict[str, Any], error_text: str, next_retry_at: Optional[str]) -> str:
@@ -353,16 +605,136 @@ def _build_hold_message(classification: Dict[str, Any], error_text: str, next_re
     )
 
 
-def _classify_processing_error(error_text: str) -> Dict[str, Any]:
+def _classify_processing_error(error: Union[BaseException, str]) -> Dict[str, Any]:
     """
     Classify failures into retryable vs terminal.
     Non-technical explanation:
     - Retryable means "try again later" (network, temporary limits, credit/top-up situations).
     - Terminal means "needs human/config fix" (bad payload/schema/validation).
+
+    Typed ProviderErrors (and raw httpx errors, converted here) are classified by
+    their provider and kind. Plain exceptions and stored error strings fall back
+    to scanning the text.
+    """
+    if isinstance(error, httpx.HTTPError):
+        error = as_provider_error(error)
+    if isinstance(error, ProviderError):
+        return _classify_provider_error(error)
+    return _classify_error_text(str(error) if error is not None else "")
+
+
+def _classify_provider_error(error: ProviderError) -> Dict[str, Any]:
+    provider = error.provider
+    retry_after_iso = error.retry_after.isoformat() if error.retry_after else None
+    if error.kind == "circuit_open":
+        # Refused by an open circuit breaker — the call never left; wait out the breaker's window
+        return {
+            "retryable": True,
+            "code": error.code,
+            "provider": provider,
+            "next_retry_at": retry_after_iso,
+            "count_retry": False,
+            "outage_scope": "provider",
+            "breaker_refusal": True,
+        }
+    if error.kind == "billing":
+        return {
+            "retryable": True,
+            "code": _provider_code(provider, "AWAITING_CREDITS"),
+            "provider": provider,
+            "cooldown_minutes": BILLING_COOLDOWN_MINUTES,
+            "next_retry_at": retry_after_iso,
+            "count_retry": False,
+            "outage_scope": "provider",
+        }
+    if error.kind == "auth":
+        return {
+            "retryable": True,
+            "code": _provider_code(provider, "AUTH_BLOCKED"),
+            "provider": provider,
+            "cooldown_minutes": AUTH_COOLDOWN_MINUTES,
+            "count_retry": False,
+            "outage_scope": "provider",
+        }
+    if error.kind == "rate_limit":
+        return _classify_rate_limit(provider, retry_after_iso)
+    if error.status_code == 529:
+        # Anthropic's overloaded status: the provider as a whole is shedding load
+        return {
+            "retryable": True,
+            "code": _provider_code(provider, "OVERLOADED"),
+            "provider": provider,
+            "cooldown_minutes": RATE_LIMIT_COOLDOWN_MINUTES,
+            "next_retry_at": retry_after_iso,
+            "count_retry": False,
+            "outage_scope": "provider",
+        }
+    if error.kind in ("network", "overloaded") and provider != "upstream" and circuit_breakers.record_failure(provider):
+        # Failing call after call with no success in between: treat the dependency as down
+        return {
+            "retryable": True,
+            "code": _provider_code(provider, "UNAVAILABLE"),
+            "provider": provider,
+            "cooldown_minutes": RATE_LIMIT_COOLDOWN_MINUTES,
+            "next_retry_at": retry_after_iso,
+            "count_retry": False,
+            "outage_scope": "provider",
+        }
+    if error.transient:
+        return {
+            "retryable": True,
+            "code": _provider_code(provider, "RETRYABLE_UPSTREAM_LIMIT"),
+            "provider": provider,
+            "next_retry_at": retry_after_iso,
+            "count_retry": True,
+        }
+    if error.kind in ("validation", "not_found"):
+        return {
+            "retryable": False,
+            "code": _provider_code(provider, "TERMINAL_VALIDATION"),
+            "provider": provider,
+            "count_retry": True,
+        }
+    # Typed but unrecognised (e.g. a bridge answer without an id): the provider is
+    # known, only the kind has to come from the message
+    return _classify_error_text(str(error), None if provider == "upstream" else provider)
+
+
+def _classify_rate_limit(provider: str, retry_after_iso: Optional[str]) -> Dict[str, Any]:
+    """
+    A single 429 is an ordinary retry (after the provider's retry-after, if any); only a
+    sustained limit (BREAKER_RATE_LIMIT_TRIPS in a row, no success between) trips the breaker.
     """
+    classification = {
+        "retryable": True,
+        "code": _provider_code(provider, "RATE_LIMITED"),
+        "provider": provider,
+        "cooldown_minutes": RATE_LIMIT_COOLDOWN_MINUTES,
+        "next_retry_at": retry_after_iso,
+        "count_retry": False,
+    }
+    if circuit_breakers.record_rate_limit(provider):
+        classification["outage_scope"] = "provider"
+    return classification
+
+
+def _classify_error_text(error_text: str, provider: Optional[str] = None) -> Dict[str, Any]:
+    """Marker-based classification for untyped failures and stored error strings."""
     text = (error_text or "").lower()
-    provider = _detect_provider(error_text)
     retry_after_iso = _extract_retry_after_iso(error_text)
+    breaker_match = re.search(r"(\w+) circuit open \((\w+)\)", error_text or "")
+    if breaker_match:
+        # Refused by an open circuit breaker — the call never left; wait out the breaker's window
+        return {
+            "retryable": True,
+            "code": breaker_match.group(2),
+            "provider": breaker_match.group(1),
+            "next_retry_at": retry_after_iso,
+            "count_retry": False,
+            "outage_scope": "provider",
+            "breaker_refusal": True,
+        }
+    provider = provider or _detect_provider(error_text)
     billing_markers = [
         "credit balance", "credits expired", "insufficient credits",
         "insufficient_quota", "quota exceeded", "quota", "billing", "payment required",
@@ -400,15 +772,7 @@ def _classify_processing_error(error_text: str) -> Dict[str, Any]:
         }
     # Add specific rate limit detection
     if "too many requests" in text or "retry after" in text:
-        return {
-            "retryable": True,
-            "code": _provider_code(provider, "RATE_LIMITED"),
-            "provider": provider,
-            "cooldown_minutes": RATE_LIMIT_COOLDOWN_MINUTES,
-            "next_retry_at": retry_after_iso,
-            "count_retry": False,
-            "outage_scope": "provider",
-        }
+        return _classify_rate_limit(provider, retry_after_iso)
     if any(marker in text for marker in retryable_markers):
         return {
             "retryable": True,
@@ -438,138 +802,47 @@ def _compute_next_retry_iso(retry_count: int) -> str:
     return next_dt.isoformat()
 
 
-async def _fetch_meeting_register_rows() -> List[Dict[str, Any]]:
-    """Load Meeting Register rows via the bridge API."""
-    try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{NOTION_API_BASE}/api/meeting-register", timeout=60.0)
-            resp.raise_for_status()
-            return resp.json() or []
-    except Exception as e:
-        raise RuntimeError(f"Notion meeting register fetch failed: {e}") from e
-
-
 async def _patch_meeting_register(row_id: str, payload: Dict[str, Any]) -> None:
-    """Patch a single Meeting Register row with queue state updates."""
-    try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.patch(
-                f"{NOTION_API_BASE}/api/meeting-register/{row_id}",
-                json=payload,
-                timeout=60.0,
-            )
-            resp.raise_for_status()
-    except Exception as e:
-        raise RuntimeError(f"Notion meeting register patch failed for {row_id}: {e}") from e
-
-
-async def _fetch_fireflies_transcript(external_meeting_id: str) -> Dict[str, Any]:
-    """Fetch transcript directly from Fireflies for durable retry worker."""
-    if not FIREFLY_API_KEY:
-        raise RuntimeError("FIREFLY_API_KEY is missing")
-    query = """
-    query Transcript($transcriptId: String!) {
-      transcript(id: $transcriptId) {
-        id
-        title
-        date
-        duration
-        organizer_email
-        participants
-        transcript_url
-        summary {
-          overview
-          shorthand_bullet
-          action_items
-          keywords
-        }
-        sentences {
-          speaker_name
-          text
-        }
-      }
-    }
-    """
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            "https://api.fireflies.ai/graphql",
-            json={"query": query, "variables": {"transcriptId": external_meeting_id}},
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {FIREFLY_API_KEY}",
-            },
-            timeout=120.0,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-    if data.get("errors"):
-        error_message = data["errors"][0].get("message", "Fireflies query failed")
-        logger.warning(
-            f"Fireflies transcript fetch returned GraphQL errors for {external_meeting_id}: {data['errors']}"
-        )
-        raise RuntimeError(f"Fireflies transcript fetch failed: {error_message}")
-    transcript = (data.get("data") or {}).get("transcript")
-    if not transcript:
-        raise RuntimeError("Fireflies transcript not found")
-    raw_date = transcript.get("date")
-    if isinstance(raw_date, (int, float)):
-        transcript["date"] = datetime.fromtimestamp(raw_date / 1000, tz=timezone.utc).isoformat()
-    return transcript
+    """Patch a single Meeting Register row with queue state updates (coalesced and batched)."""
+    await register_patches.patch(row_id, payload)
+    register_mirror.apply_patch(row_id, payload)
 
 
-async def _list_fireflies_transcripts(page_size: int = 50, max_pages: int = 4) -> List[Dict[str, Any]]:
-    """List recent Fireflies transcripts (id, title, date, duration), paginated."""
-    if not FIREFLY_API_KEY:
-        raise RuntimeError("FIREFLY_API_KEY is missing")
-    query = """
-    query Transcripts($limit: Int, $skip: Int) {
-      transcripts(limit: $limit, skip: $skip) { id title date duration }
-    }
-    """
-    all_transcripts: List[Dict[str, Any]] = []
-    skip = 0
-    async with httpx.AsyncClient() as client:
-        for _ in range(max_pages):
-            resp = await client.post(
-                "https://api.fireflies.ai/graphql",
-                json={"query": query, "variables": {"limit": page_size, "skip": skip}},
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {FIREFLY_API_KEY}",
-                },
-                timeout=60.0,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            if data.get("errors"):
-                err = data["errors"][0]
-                raise RuntimeError(f"Fireflies list failed: {err.get('message', 'unknown')}")
-            batch = (data.get("data") or {}).get("transcripts") or []
-            if not batch:
-                break
-            all_transcripts.extend(batch)
-            if len(batch) < page_size:
-                break
-            skip += page_size
-    return all_transcripts
+async def _patch_meeting_register_many(updates: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Optional[str]]:
+    """Patch many rows at once. Returns row id → error text for the rows that failed."""
+    outcome = await register_patches.patch_many(updates)
+    for row_id, payload in updates:
+        if outcome.get(row_id) is None:
+            register_mirror.apply_patch(row_id, payload)
+    failed = {row_id: error for row_id, error in outcome.items() if error}
+    for error in failed.values():
+        logger.warning(error)
+    return failed
 
 
-def _coerce_iso_date(raw: Any) -> Optional[str]:
-    """Return YYYY-MM-DD for a Fireflies date value (ms epoch or ISO string)."""
+def _coerce_datetime(raw: Any) -> Optional[datetime]:
+    """Return an aware UTC datetime for a Fireflies date value (ms epoch or ISO string)."""
     if raw is None:
         return None
     try:
         if isinstance(raw, (int, float)):
-            return datetime.fromtimestamp(raw / 1000, tz=timezone.utc).date().isoformat()
-        return datetime.fromisoformat(str(raw).replace("Z", "+00:00")).date().isoformat()
+            return datetime.fromtimestamp(raw / 1000, tz=timezone.utc)
+        parsed = datetime.fromisoformat(str(raw).replace("Z", "+00:00"))
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
     except Exception:
         return None
 
 
-async def _queue_meeting_for_backfill(transcript: Dict[str, Any]) -> None:
-    """Queue a missing Fireflies meeting via the upsert endpoint."""
+def _coerce_iso_date(raw: Any) -> Optional[str]:
+    """Return YYYY-MM-DD for a Fireflies date value (ms epoch or ISO string)."""
+    parsed = _coerce_datetime(raw)
+    return parsed.date().isoformat() if parsed else None
+
+
+def _backfill_payload(transcript: Dict[str, Any]) -> Dict[str, Any]:
+    """Upsert body that queues a missing Fireflies meeting."""
     meeting_date = _coerce_iso_date(transcript.get("date")) or datetime.now(timezone.utc).date().isoformat()
-    payload = {
+    return {
         "externalMeetingId": transcript["id"],
         "meetingFormat": "Virtual",
         "processingStatus": "Pending",
@@ -582,59 +855,184 @@ async def _queue_meeting_for_backfill(transcript: Dict[str, Any]) -> None:
             "meetingDate": meeting_date,
         },
     }
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            f"{NOTION_API_BASE}/api/meeting-register/upsert-by-external",
-            json=payload,
-            timeout=30.0,
-        )
-        resp.raise_for_status()
 
 
-async def _run_auto_backfill_pass() -> Dict[str, int]:
+def _mirror_backfilled_row(payload: Dict[str, Any], result: Dict[str, Any]) -> None:
+    """Record a queued row locally so the retry worker schedules it without waiting for the next sync."""
+    if not result.get("id"):
+        return
+    fields = {k: v for k, v in payload.items() if k != "createOnlyFields"}
+    if result.get("created"):
+        fields.update(payload.get("createOnlyFields") or {})
+    register_mirror.add_row({"id": result["id"], **fields})
+
+
+async def _queue_meeting_for_backfill(transcript: Dict[str, Any]) -> None:
+    """Queue a missing Fireflies meeting via the upsert endpoint."""
+    payload = _backfill_payload(transcript)
+    # The request hook takes one token; the bridge's find-then-write makes the other call(s)
+    await notion_bucket.acquire(BACKFILL_UPSERT_NOTION_CALLS - 1)
+    client = get_notion_client()
+    resp = await client.post(
+        f"{NOTION_API_BASE}/api/meeting-register/upsert-by-external",
+        json=payload,
+        timeout=NOTION_TIMEOUT,
+    )
+    resp.raise_for_status()
+    _mirror_backfilled_row(payload, resp.json() or {})
+
+
+async def _queue_backfill_batch(transcripts: List[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+    """One bridge call upserting several meetings. Returns transcript id → error text (None when queued)."""
+    global _backfill_batch_supported
+    payloads = [_backfill_payload(t) for t in transcripts]
+    # The request hook takes one token; the bridge makes the rest. acquire() is capped at the
+    # bucket's capacity, so the excess is debited (later callers wait for it, as in register_patches)
+    cost = BACKFILL_UPSERT_NOTION_CALLS * len(payloads) - 1
+    notion_bucket.debit(cost - await notion_bucket.acquire(cost))
+    client = get_notion_client()
+    resp = await client.post(
+        f"{NOTION_API_BASE}/api/meeting-register/upsert-by-external/batch",
+        json={"items": payloads},
+        timeout=REGISTER_TIMEOUT,
+    )
+    if resp.status_code == 404:
+        logger.info("Bridge has no batch upsert endpoint; queueing backfill meetings individually")
+        _backfill_batch_supported = False
+        notion_bucket.debit(-cost)  # the bridge made no upserts
+        # Runs inside the caller's chunk slot, so one upsert at a time here
+        return await _queue_backfill_individually(transcripts, concurrency=1)
+    resp.raise_for_status()
+    outcome: Dict[str, Optional[str]] = {}
+    for payload, item in zip(payloads, resp.json().get("results") or []):
+        if item.get("success"):
+            _mirror_backfilled_row(payload, item)
+            outcome[payload["externalMeetingId"]] = None
+        else:
+            outcome[payload["externalMeetingId"]] = item.get("error") or "unknown error"
+    for payload in payloads:
+        outcome.setdefault(payload["externalMeetingId"], "missing from batch response")
+    return outcome
+
+
+async def _queue_backfill_individually(transcripts: List[Dict[str, Any]],
+                                       concurrency: int = AUTO_BACKFILL_CONCURRENCY) -> Dict[str, Optional[str]]:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(transcript: Dict[str, Any]) -> Optional[str]:
+        async with sem:
+            try:
+                await _queue_meeting_for_backfill(transcript)
+                return None
+            except Exception as e:
+                return str(as_provider_error(e, "notion"))
+
+    errors = await asyncio.gather(*(_one(t) for t in transcripts))
+    return {t["id"]: error for t, error in zip(transcripts, errors)}
+
+
+async def _queue_meetings_for_backfill(transcripts: List[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+    """
+    Queue many missing meetings concurrently: AUTO_BACKFILL_BATCH_SIZE per bridge call
+    (individual upserts on bridges without the batch endpoint), AUTO_BACKFILL_CONCURRENCY
+    calls in flight either way. Returns transcript id → error text (None when queued).
+    """
+    if not transcripts:
+        return {}
+    if not _backfill_batch_supported or len(transcripts) == 1:
+        return await _queue_backfill_individually(transcripts)
+
+    sem = asyncio.Semaphore(AUTO_BACKFILL_CONCURRENCY)
+
+    async def _chunk(chunk: List[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+        async with sem:
+            try:
+                return await _queue_backfill_batch(chunk)
+            except Exception as e:
+                error = str(as_provider_error(e, "notion"))
+                return {t["id"]: error for t in chunk}
+
+    chunks = [transcripts[i:i + AUTO_BACKFILL_BATCH_SIZE] for i in range(0, len(transcripts), AUTO_BACKFILL_BATCH_SIZE)]
+    outcome: Dict[str, Optional[str]] = {}
+    for result in await asyncio.gather(*(_chunk(chunk) for chunk in chunks)):
+        outcome.update(result)
+    return outcome
+
+
+async def _run_auto_backfill_pass() -> Dict[str, Any]:
     """Find Fireflies meetings missing from Notion and queue them.
 
     Skips Fireflies meetings whose date already has any Notion row, so manual
     entries are never duplicated. Only true gaps (typically: webhooks lost
     during a Fireflies outage) are backfilled.
-    """
-    cutoff_dt = datetime.now(timezone.utc) - timedelta(days=AUTO_BACKFILL_LOOKBACK_DAYS)
-    transcripts = await _list_fireflies_transcripts()
 
-    rows = await _fetch_meeting_register_rows()
-    existing_ext_ids = {(r.get("externalMeetingId") or "").strip() for r in rows if r.get("externalMeetingId")}
-    existing_dates = {(r.get("meetingDate") or "")[:10] for r in rows if r.get("meetingDate")}
+    Incremental: Fireflies is only asked for transcripts dated after the
+    previous pass's high-water mark (less AUTO_BACKFILL_OVERLAP_HOURS for
+    transcripts that finish processing late), never past the lookback cutoff,
+    and ids/dates are checked against the register mirror's indexes.
+    """
+    now_dt = datetime.now(timezone.utc)
+    cutoff_dt = now_dt - timedelta(days=AUTO_BACKFILL_LOOKBACK_DAYS)
+    from_dt = cutoff_dt
+    high_water = register_mirror.get_state(BACKFILL_HIGH_WATER_KEY)
+    if high_water:
+        from_dt = max(cutoff_dt, datetime.fromisoformat(high_water) - timedelta(hours=AUTO_BACKFILL_OVERLAP_HOURS))
+    transcripts = await fireflies_client.list_transcripts(from_date=from_dt)
+
+    await register_mirror.refresh()
+    dates = {t.get("id"): _coerce_iso_date(t.get("date")) for t in transcripts}
+    existing_ext_ids = register_mirror.known_external_ids(dates)
+    existing_dates = register_mirror.dates_with_rows(dates.values())
 
-    queued = 0
     skipped_existing_id = 0
     skipped_existing_date = 0
     skipped_too_old = 0
-    failed = 0
+    newest_seen: Optional[datetime] = None
+    oldest_failed: Optional[datetime] = None
+    missing: List[Dict[str, Any]] = []
     for t in transcripts:
-        iso_date = _coerce_iso_date(t.get("date"))
+        iso_date = dates.get(t.get("id"))
         if iso_date and datetime.fromisoformat(iso_date).replace(tzinfo=timezone.utc) < cutoff_dt:
             skipped_too_old += 1
             continue
+        meeting_dt = _coerce_datetime(t.get("date"))
+        if meeting_dt and (newest_seen is None or meeting_dt > newest_seen):
+            newest_seen = meeting_dt
         if t.get("id") in existing_ext_ids:
             skipped_existing_id += 1
             continue
         if iso_date and iso_date in existing_dates:
             skipped_existing_date += 1
             continue
-        try:
-            await _queue_meeting_for_backfill(t)
-            queued += 1
-            logger.info(f"Auto-backfill queued {t.get('id')} ({iso_date}) {t.get('title')}")
-        except Exception as e:
-            failed += 1
-            logger.warning(f"Auto-backfill failed for {t.get('id')}: {e}")
+        missing.append(t)
+
+    outcome = await _queue_meetings_for_backfill(missing)
+    for t in missing:
+        error = outcome.get(t["id"])
+        if error is None:
+            logger.info(f"Auto-backfill queued {t.get('id')} ({dates.get(t['id'])}) {t.get('title')}")
+            continue
+        logger.warning(f"Auto-backfill failed for {t.get('id')}: {error}")
+        meeting_dt = _coerce_datetime(t.get("date"))
+        if meeting_dt and (oldest_failed is None or meeting_dt < oldest_failed):
+            oldest_failed = meeting_dt
+    failed = sum(1 for error in outcome.values() if error)
+
+    # Advance the mark to the newest meeting seen, but not past one that failed to queue
+    # (the overlap window brings it back next pass)
+    new_mark = min(d for d in (newest_seen, oldest_failed) if d) if newest_seen or oldest_failed else None
+    if new_mark and (not high_water or new_mark > datetime.fromisoformat(high_water)):
+        register_mirror.set_state(BACKFILL_HIGH_WATER_KEY, new_mark.isoformat())
     return {
-        "queued": queued,
+        "queued": len(outcome) - failed,
         "skipped_existing_id": skipped_existing_id,
         "skipped_existing_date": skipped_existing_date,
         "skipped_too_old": skipped_too_old,
         "failed": failed,
         "total_seen": len(transcripts),
+        "from_date": from_dt.isoformat(),
+        "high_water": register_mirror.get_state(BACKFILL_HIGH_WATER_KEY),
+        "outcomes": {tid: "queued" if error is None else f"failed: {error}" for tid, error in outcome.items()},
     }
 
 
@@ -664,42 +1062,145 @@ async def _auto_backfill_loop():
 async def _fetch_cached_transcript(row_id: str) -> Optional[Dict[str, Any]]:
     """Load a cached transcript snapshot from the Meeting Register row if available."""
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{NOTION_API_BASE}/api/meeting-register/{row_id}/transcript-cache",
-                timeout=60.0,
-            )
-            if resp.status_code == 404:
-                return None
-            resp.raise_for_status()
-            payload = resp.json() or {}
-            transcript = payload.get("transcript")
-            if transcript:
-                logger.info(
-                    f"Loaded cached transcript snapshot for meeting register {row_id} "
-                    f"({len(transcript.get('sentences', []))} sentences)"
-                )
-            return transcript
+        client = get_notion_client()
+        resp = await client.get(
+            f"{NOTION_API_BASE}/api/meeting-register/{row_id}/transcript-cache",
+            timeout=REGISTER_TIMEOUT,
+        )
+        if resp.status_code == 404:
+            return None
+        resp.raise_for_status()
+        payload = resp.json() or {}
+        snapshot = payload.get("transcript")
     except Exception as e:
-        raise RuntimeError(f"Transcript cache lookup failed for {row_id}: {e}") from e
+        raise as_provider_error(e, "notion", f"Transcript cache lookup failed for {row_id}") from e
+    if not snapshot:
+        return None
+    try:
+        transcript = await asyncio.to_thread(decode_snapshot, snapshot)
+    except SnapshotFormatError as e:
+        # Written by a newer agent or damaged; Fireflies is still the source of truth
+        logger.warning(f"Ignoring transcript snapshot for meeting register {row_id}: {e}")
+        return None
+    logger.info(
+        f"Loaded cached transcript snapshot for meeting register {row_id} "
+        f"({len(transcript.get('sentences', []))} sentences"
+        f"{', compact v' + str(snapshot.get('version')) if is_compact(snapshot) else ''})"
+    )
+    return transcript
 
 
 async def _store_cached_transcript(row_id: str, transcript: Dict[str, Any]) -> None:
     """Persist a transcript snapshot on the Meeting Register row for future autonomous retries."""
+    # The loop may attach _compact_transcript while the thread encodes, so copy it here first
+    body = await asyncio.to_thread(snapshot_body, without_attachments(transcript))
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{NOTION_API_BASE}/api/meeting-register/{row_id}/transcript-cache",
-                json=transcript,
-                timeout=120.0,
-            )
-            resp.raise_for_status()
+        client = get_notion_client()
+        resp = await client.post(
+            f"{NOTION_API_BASE}/api/meeting-register/{row_id}/transcript-cache",
+            json=body,
+            timeout=TRANSCRIPT_TIMEOUT,
+        )
+        resp.raise_for_status()
+    except Exception as e:
+        raise as_provider_error(e, "notion", f"Transcript cache store failed for {row_id}") from e
+
+
+async def _write_through_transcript(row_id: str, external_id: str, transcript: Dict[str, Any],
+                                    digest: str) -> None:
+    try:
+        await _store_cached_transcript(row_id, transcript)
+        transcript_cache.mark_remote_stored(external_id, digest)
+        logger.info(f"Stored transcript snapshot for meeting {row_id} (background write-through)")
+    except Exception as e:
+        logger.warning(
+            f"Transcript snapshot write-through failed for meeting {row_id}; "
+            f"other replicas may still need Fireflies. Error: {e}"
+        )
+
+
+def _schedule_write_through(row_id: str, external_id: str, transcript: Dict[str, Any], digest: str) -> None:
+    """Store the snapshot on the register row off the critical path (one in flight per row)."""
+    if row_id in _write_through_tasks:
+        return
+    task = asyncio.create_task(_write_through_transcript(row_id, external_id, transcript, digest))
+    _write_through_tasks[row_id] = task
+    task.add_done_callback(lambda _: _write_through_tasks.pop(row_id, None))
+
+
+async def _load_retry_transcript(row_id: str, external_id: str) -> Dict[str, Any]:
+    """The transcript for a retry row: the pipelined prefetch's result (success or failure), or a fresh load."""
+    prefetch = _retry_transcript_prefetches.pop(row_id, None)
+    if prefetch is not None:
+        transcript = await prefetch
+        logger.info(f"Using pipelined transcript prefetch for meeting {row_id}")
+        return transcript
+    return await _fetch_retry_transcript(row_id, external_id)
+
+
+def _prefetch_retry_row(row: Dict[str, Any]) -> bool:
+    """
+    Start loading a queued row's transcript while earlier rows run; False when the row would not
+    use it (no external id, or the idempotency gate will skip it).
+    """
+    row_id = row["id"]
+    external_id = row.get("externalMeetingId")
+    if not external_id or row_id in _retry_transcript_prefetches:
+        return False
+    if row.get("processedAt") and row.get("createdNoteId") and not row.get("forceRerun"):
+        return False
+    task = asyncio.create_task(_fetch_retry_transcript(row_id, external_id))
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    _retry_transcript_prefetches[row_id] = task
+    logger.info(f"Pipelining transcript load for queued meeting {row_id}")
+    return True
+
+
+async def _fetch_retry_transcript(row_id: str, external_id: str) -> Dict[str, Any]:
+    """
+    Load a retry row's transcript, cheapest source first: the local transcript cache, a
+    Fireflies read-ahead, the Meeting Register snapshot, then Fireflies. Whatever arrives
+    over the network is cached locally; content the snapshot lacks is written through to
+    it in the background.
+    """
+    transcript = await transcript_cache.get(external_id)
+    if transcript:
+        logger.info(f"Using local transcript cache for meeting {row_id}; no transcript transfer")
+        fireflies_client.discard([external_id])
+        digest = transcript_cache.unstored_digest(external_id)
+        if digest:
+            # An earlier write-through failed or never ran
+            _schedule_write_through(row_id, external_id, transcript, digest)
+        return transcript
+
+    # A transcript the worker read ahead (batched with the rows after this one) saves the
+    # Notion snapshot read; otherwise the snapshot, then Fireflies itself
+    transcript = fireflies_client.take_prefetched(external_id)
+    remote_stored = False
+    if transcript:
+        logger.info(f"Using read-ahead Fireflies transcript for meeting {row_id}")
+    else:
+        transcript = await _fetch_cached_transcript(row_id)
+        if transcript:
+            logger.info(f"Using cached transcript snapshot for meeting {row_id}; Fireflies fetch skipped")
+            remote_stored = True
+        else:
+            logger.info(f"No cached transcript snapshot for meeting {row_id}; fetching from Fireflies")
+            transcript = await fireflies_client.fetch_transcript(external_id)
+    digest = ""
+    try:
+        digest = await transcript_cache.put(external_id, transcript, remote_stored=remote_stored)
     except Exception as e:
-        raise RuntimeError(f"Transcript cache store failed for {row_id}: {e}") from e
+        logger.warning(f"Local transcript cache store failed for meeting {row_id}: {e}")
+    if not remote_stored:
+        _schedule_write_through(row_id, external_id, transcript, digest)
+    return transcript
 
 
 def _is_due_for_retry(row: Dict[str, Any], now_dt: datetime) -> bool:
     """Check if the row should be attempted right now."""
+    if row.get("retrySource") == LEASE_ROW_SOURCE:
+        return False
     status = (row.get("processingStatus") or "").strip()
     if status not in {"Pending", "Failed", "Processing"}:
         return False
@@ -729,7 +1230,7 @@ def _is_stale_unprocessed_row(row: Dict[str, Any], now_dt: datetime) -> bool:
     """
     if row.get("processedAt"):
         return False
-    if not row.get("externalMeetingId"):
+    if not row.get("externalMeetingId") or row.get("retrySource") == LEASE_ROW_SOURCE:
         return False
 
     status = (row.get("processingStatus") or "").strip()
@@ -750,30 +1251,64 @@ def _is_stale_unprocessed_row(row: Dict[str, Any], now_dt: datetime) -> bool:
     return age_hours >= STALE_REQUEUE_HOURS
 
 
-async def _pause_row_for_outage(row: Dict[str, Any], outage: Dict[str, Any]) -> None:
-    """Move due rows behind the active provider hold without consuming retry attempts."""
-    if (
-        row.get("nextRetryAt") == outage["until_iso"]
-        and row.get("lastErrorCode") == outage["code"]
-    ):
-        return
+def _next_release_time(outage: Dict[str, Any]) -> datetime:
+    """Hand out the next jittered release slot after a hold so deferred rows come back spread out."""
+    slot = outage.get("release_slots", 0)
+    outage["release_slots"] = slot + 1
+    circuit_breakers.save_release_slots(outage["provider"])
+    offset = (slot + random.random()) * OUTAGE_RELEASE_INTERVAL_SECONDS
+    return outage["until_dt"] + timedelta(seconds=offset)
+
 
+async def _pause_row_for_outage(row: Dict[str, Any], outage: Dict[str, Any]) -> datetime:
+    """Move a due row behind the active provider hold without consuming retry attempts. Returns its release time."""
+    if row.get("lastErrorCode") == outage["code"] and row.get("nextRetryAt"):
+        try:
+            current = datetime.fromisoformat(row["nextRetryAt"].replace("Z", "+00:00"))
+            if current >= outage["until_dt"]:
+                return current
+        except ValueError:
+            pass
+
+    release_dt = _next_release_time(outage)
+    release_iso = release_dt.isoformat()
     await _patch_meeting_register(row["id"], {
         "processingStatus": "Pending",
-        "nextRetryAt": outage["until_iso"],
+        "nextRetryAt": release_iso,
         "lastErrorCode": outage["code"],
         "lastErrorMessage": _build_hold_message(
             {"provider": outage["provider"]},
             outage["message"],
-            outage["until_iso"],
+            release_iso,
         ),
         "retrySource": f"{outage['provider']}_service_hold",
     })
+    return release_dt
 
 
 async def _process_retry_row(row: Dict[str, Any]) -> None:
     """
-    Process one queued row end-to-end.
+    Claim a queued row and process it end-to-end.
+    The claim is the meeting's register lease (owner + expiry, renewed while the row runs), so
+    another replica that picks up the same due row skips it, and a crashed replica's claim lapses.
+    """
+    row_id = row["id"]
+    try:
+        async with meeting_lease(row.get("externalMeetingId")):
+            await _process_claimed_retry_row(row)
+    except LeaseHeldElsewhere as e:
+        # The owning replica updates the row when it finishes; nothing to record here.
+        # Look again once its lease would have expired, in case it died mid-run.
+        logger.info(f"Skipping retry row {row_id}: {e}")
+        try:
+            retry_scheduler.schedule(row_id, datetime.fromisoformat(e.expires_at.replace("Z", "+00:00")).timestamp())
+        except (AttributeError, ValueError):
+            pass
+
+
+async def _process_claimed_retry_row(row: Dict[str, Any]) -> None:
+    """
+    Process one claimed row end-to-end.
     Prevents duplicate writes by skipping if already completed unless force rerun is enabled.
     """
     row_id = row["id"]
@@ -815,28 +1350,23 @@ async def _process_retry_row(row: Dict[str, Any]) -> None:
 
     try:
         if not external_id:
-            # Phrased to match terminal_markers ("missing required") so this
-            # classifies as terminal rather than RETRYABLE_UNKNOWN — a row with
-            # no external ID will never succeed on its own and needs operator fix.
-            raise RuntimeError("Missing required external meeting id")
-        transcript = await _fetch_cached_transcript(row_id)
-        if transcript:
-            logger.info(f"Using cached transcript snapshot for meeting {row_id}; Fireflies fetch skipped")
-        else:
-            logger.info(f"No cached transcript snapshot for meeting {row_id}; fetching from Fireflies")
-            transcript = await _fetch_fireflies_transcript(external_id)
-            try:
-                await _store_cached_transcript(row_id, transcript)
-                logger.info(f"Stored transcript snapshot for meeting {row_id} after Fireflies fallback fetch")
-            except Exception as cache_error:
-                logger.warning(
-                    f"Transcript cache store failed for meeting {row_id}; "
-                    f"future retries may still need Fireflies. Error: {cache_error}"
-                )
-        result = await process_meeting_transcript(transcript, meeting_register_id=row_id)
+            # Terminal (validation) rather than RETRYABLE_UNKNOWN — a row with no
+            # external ID will never succeed on its own and needs operator fix.
+            raise ProviderError("Missing required external meeting id", "upstream", "validation")
+        transcript = await _load_retry_transcript(row_id, external_id)
+        # Force rerun starts over; ordinary retries pick up from the last checkpointed iteration
+        result, _ = await _process_meeting_once(
+            transcript, meeting_register_id=row_id, meeting_id=external_id, resume=not force_rerun
+        )
+        if result.get("drained"):
+            # The shutdown drain hands the row back with nextRetryAt=now; resumes from its checkpoint
+            logger.info(f"Retry row {row_id} stopped for shutdown drain")
+            return
         if not result.get("success"):
-            raise RuntimeError(result.get("error") or "Unknown processing error")
+            raise result_error(result)
 
+        retry_concurrency.record_success()
+        check_lease()
         await _patch_meeting_register(row_id, {
             "processingStatus": "Completed",
             "processedAt": _now_iso(),
@@ -847,19 +1377,20 @@ async def _process_retry_row(row: Dict[str, Any]) -> None:
             "retryCount": retry_count,
             "forceRerun": False,
         })
+        if result.get("created_note_id"):
+            _schedule_transcript_append(result["created_note_id"], transcript)
+    except LeaseHeldElsewhere:
+        # Lost the lease mid-run: the replica that took it over updates the row
+        raise
     except Exception as e:
         error_text = str(e)
-        classification = _classify_processing_error(error_text)
+        classification = _classify_processing_error(e)
 
         retry_increment = 1 if classification.get("count_retry", True) else 0
         next_retry = classification.get("next_retry_at")
         if classification.get("outage_scope") == "provider":
-            if not next_retry:
-                cooldown_minutes = classification.get("cooldown_minutes", RATE_LIMIT_COOLDOWN_MINUTES)
-                next_retry_dt = datetime.now(timezone.utc) + timedelta(minutes=cooldown_minutes)
-                next_retry = next_retry_dt.isoformat()
-            outage = _register_provider_outage(classification, error_text, next_retry)
-            next_retry = outage["until_iso"]
+            outage = _register_provider_outage(classification, error_text)
+            next_retry = _next_release_time(outage).isoformat()
             hold_message = _build_hold_message(classification, error_text, next_retry)
             logger.warning(
                 f"{_provider_label(classification.get('provider', 'upstream'))} outage detected for meeting {row_id}. "
@@ -886,10 +1417,80 @@ async def _process_retry_row(row: Dict[str, Any]) -> None:
         })
 
 
+async def _process_retry_rows(rows: List[Dict[str, Any]]) -> None:
+    """
+    Process due rows within the adaptive retry window (at most RETRY_ROW_CONCURRENCY at once),
+    loading up to RETRY_PIPELINE_DEPTH queued rows' transcripts ahead of their turn;
+    re-raise the first failure after all finish.
+    """
+    external_ids = [row.get("externalMeetingId") for row in rows]
+    # Rows with a local transcript copy need no Fireflies read-ahead
+    cached_ids = transcript_cache.cached_ids(external_ids)
+    read_ahead_ids = [None if external_id in cached_ids else external_id for external_id in external_ids]
+
+    waiting = list(range(len(rows)))  # rows that have not taken a retry slot yet
+
+    def _pipeline() -> None:
+        # Load the next queued rows' transcripts now, so a row's own turn starts straight
+        # at the agent loop. The Notion context is warmed alongside, and again as each run
+        # finishes (a run that creates issues or aliases invalidates it)
+        prefetched = sum(1 for i in waiting if rows[i]["id"] in _retry_transcript_prefetches)
+        started = False
+        for i in waiting:
+            if prefetched >= RETRY_PIPELINE_DEPTH:
+                break
+            if rows[i]["id"] not in _retry_transcript_prefetches and _prefetch_retry_row(rows[i]):
+                prefetched += 1
+                started = True
+        if started:
+            warm_notion_context()
+
+    async def _one(index: int, row: Dict[str, Any]) -> None:
+        async with retry_concurrency.slot():
+            waiting.remove(index)
+            if _is_draining():
+                # Popped from the scheduler but never started; keep it due for after /worker/resume
+                retry_scheduler.schedule(row["id"], time.time())
+                return
+            active_outage = _get_active_provider_outage()
+            if active_outage:
+                release_dt = await _pause_row_for_outage(row, active_outage)
+                retry_scheduler.schedule(row["id"], release_dt.timestamp())
+                return
+            external_id = read_ahead_ids[index]
+            if len(rows) > 1 and external_id and not fireflies_client.is_pending(external_id):
+                # Read this row's transcript and the next rows' ahead in one batched Fireflies request
+                fireflies_client.prefetch(read_ahead_ids[index:index + FIREFLIES_BATCH_SIZE])
+            _pipeline()
+            await _process_retry_row(row)
+            if waiting:
+                warm_notion_context()
+
+    try:
+        results = await asyncio.gather(*(_one(i, row) for i, row in enumerate(rows)), return_exceptions=True)
+    finally:
+        fireflies_client.discard(external_ids)
+        for index in waiting:
+            # Cancelled (shutdown drain) before taking a retry slot; still due
+            retry_scheduler.schedule(rows[index]["id"], time.time())
+        for row in rows:
+            # Rows that never reached their load (drain, outage hold, lease held elsewhere)
+            leftover = _retry_transcript_prefetches.pop(row["id"], None)
+            if leftover is not None:
+                leftover.cancel()
+    # A row cancelled mid-drain is handed back by the drain; only real failures count here
+    errors = [r for r in results if isinstance(r, Exception)]
+    if errors:
+        raise errors[0]
+
+
 async def _retry_worker_loop():
     """Background durable retry worker."""
     logger.info("Durable retry worker started")
-    while True:
+    # After a failed cycle, rows popped from the scheduler may not have been handled;
+    # a full resync rebuilds the schedule from the register.
+    resync_full = False
+    while not _is_draining():
         try:
             active_outage = _get_active_provider_outage()
             if active_outage and active_outage["provider"] == "notion":
@@ -900,25 +1501,35 @@ async def _retry_worker_loop():
                 await asyncio.sleep(RETRY_POLL_SECONDS)
                 continue
 
-            rows = await _fetch_meeting_register_rows()
+            await register_mirror.refresh(force_full=resync_full)
+            resync_full = False
             now_dt = datetime.now(timezone.utc)
 
-            # Self-heal stale/unprocessed rows first.
-            stale_rows = [row for row in rows if _is_stale_unprocessed_row(row, now_dt)]
-            for row in stale_rows:
-                await _patch_meeting_register(row["id"], {
-                    "processingStatus": "Pending",
-                    "nextRetryAt": _now_iso(),
-                    "retrySource": "stale_auto_requeue",
-                })
-            if stale_rows:
-                logger.info(f"Retry worker auto-requeued {len(stale_rows)} stale meeting(s)")
-
-            # Refresh list after stale updates so selection reflects latest state.
+            # Self-heal stale/unprocessed rows first. The mirror's indexes narrow the
+            # candidates; the predicates below still make the final call.
+            stale_cutoff = now_dt - timedelta(hours=STALE_REQUEUE_HOURS)
+            stale_rows = [
+                row for row in register_mirror.stale_candidates(stale_cutoff)
+                if _is_stale_unprocessed_row(row, now_dt)
+            ]
             if stale_rows:
-                rows = await _fetch_meeting_register_rows()
-
-            due_rows = [row for row in rows if _is_due_for_retry(row, now_dt)]
+                failed = await _patch_meeting_register_many([
+                    (row["id"], {
+                        "processingStatus": "Pending",
+                        "nextRetryAt": _now_iso(),
+                        "retrySource": "stale_auto_requeue",
+                    })
+                    for row in stale_rows
+                ])
+                logger.info(f"Retry worker auto-requeued {len(stale_rows) - len(failed)} stale meeting(s)")
+
+            # The scheduler hands back exactly the rows whose nextRetryAt has passed
+            # (stale requeues were scheduled by _patch_meeting_register above).
+            due_ids = retry_scheduler.pop_due(now_dt.timestamp())
+            due_rows = [
+                row for row in map(register_mirror.get, due_ids)
+                if row is not None and _is_due_for_retry(row, now_dt)
+            ]
             if due_rows:
                 logger.info(f"Retry worker found {len(due_rows)} due meeting(s)")
             active_outage = _get_active_provider_outage()
@@ -927,98 +1538,111 @@ async def _retry_worker_loop():
                     f"Deferring {len(due_rows)} due meeting(s) while {_provider_label(active_outage['provider'])} "
                     f"is paused until {active_outage['until_iso']}"
                 )
-                for row in due_rows:
-                    await _pause_row_for_outage(row, active_outage)
-                await asyncio.sleep(RETRY_POLL_SECONDS)
-                continue
-            for row in due_rows:
-                active_outage = _get_active_provider_outage()
-                if active_outage:
-                    await _pause_row_for_outage(row, active_outage)
-                    continue
-                await _process_retry_row(row)
+                release_times = await asyncio.gather(*(_pause_row_for_outage(row, active_outage) for row in due_rows))
+                for row, release_dt in zip(due_rows, release_times):
+                    retry_scheduler.schedule(row["id"], release_dt.timestamp())
+                due_rows = []
+            await _process_retry_rows(due_rows)
         except Exception as loop_error:
+            resync_full = True
             error_text = str(loop_error)
-            classification = _classify_processing_error(error_text)
+            classification = _classify_processing_error(loop_error)
             if classification.get("outage_scope") == "provider":
-                next_retry = classification.get("next_retry_at")
-                if not next_retry:
-                    cooldown_minutes = classification.get("cooldown_minutes", RATE_LIMIT_COOLDOWN_MINUTES)
-                    next_retry = (datetime.now(timezone.utc) + timedelta(minutes=cooldown_minutes)).isoformat()
-                outage = _register_provider_outage(classification, error_text, next_retry)
+                outage = _register_provider_outage(classification, error_text)
                 logger.error(
                     f"Retry worker loop paused by {_provider_label(outage['provider'])} outage until "
                     f"{outage['until_iso']}: {error_text}"
                 )
             else:
                 logger.error(f"Retry worker loop error: {loop_error}")
-        await asyncio.sleep(RETRY_POLL_SECONDS)
+            await asyncio.sleep(RETRY_POLL_SECONDS)
+            continue
+        # Sleep until the next row is due, a webhook/operator retry wakes us, or the resync interval
+        await retry_scheduler.wait(RETRY_RESYNC_SECONDS)
+    logger.info("Durable retry worker stopped (draining)")
 
 
 @app.get("/status/{meeting_id}")
 async def get_processing_status(meeting_id: str):
     """Check the processing status of a meeting."""
-    if meeting_id not in processing_status:
+    status = job_store.get(meeting_id)
+    if status is None:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
-    return processing_status[meeting_id]
+    queue = _get_ingest_queue()
+    position = queue.position(meeting_id)
+    if position is not None:
+        return {
+            **status,
+            "queue_position": position,
+            "queue_depth": queue.depth,
+            "estimated_wait_seconds": _estimate_queue_wait_seconds(position),
+        }
+    return status
 
 
 @app.post("/worker/retry-pending-now")
 async def retry_pending_now():
     """Operator endpoint: force all pending rows to retry immediately."""
     cleared_outages = _clear_provider_outages()
-    rows = await _fetch_meeting_register_rows()
-    updated = 0
-    for row in rows:
-        status = (row.get("processingStatus") or "").strip()
-        if status in {"Pending", "Failed"}:
-            await _patch_meeting_register(row["id"], {"nextRetryAt": _now_iso(), "processingStatus": "Pending"})
-            updated += 1
-    return {"success": True, "updated": updated, "clearedOutages": cleared_outages}
+    await register_mirror.refresh()
+    rows = register_mirror.rows_with_status(("Pending", "Failed"))
+    failed = await _patch_meeting_register_many(
+        [(row["id"], {"nextRetryAt": _now_iso(), "processingStatus": "Pending"}) for row in rows]
+    )
+    retry_scheduler.wake()
+    return {
+        "success": not failed,
+        "updated": len(rows) - len(failed),
+        "failed": failed,
+        "clearedOutages": cleared_outages,
+    }
 
 
 @app.get("/worker/outages")
 async def get_worker_outages():
     """Show active provider holds so operators can see why retries are paused."""
-    active = _get_active_provider_outage()
-    if not active:
-        return {"active": []}
-    return {"active": [{
-        "provider": active["provider"],
-        "code": active["code"],
-        "until": active["until_iso"],
-        "message": active["message"],
-    }]}
+    return {"active": circuit_breakers.snapshot()}
 
 
 @app.post("/worker/retry-meeting/{external_meeting_id}")
 async def retry_one_meeting(external_meeting_id: str):
     """Operator endpoint: retry one specific meeting by external meeting id."""
-    async with httpx.AsyncClient() as client:
-        lookup = await client.get(f"{NOTION_API_BASE}/api/meeting-register/by-external/{external_meeting_id}", timeout=30.0)
+    client = get_notion_client()
+    lookup = await client.get(f"{NOTION_API_BASE}/api/meeting-register/by-external/{external_meeting_id}", timeout=NOTION_TIMEOUT)
     if lookup.status_code == 404:
         raise HTTPException(status_code=404, detail="Meeting register row not found")
     lookup.raise_for_status()
     row_id = lookup.json()["id"]
+    register_mirror.add_row(lookup.json())
     await _patch_meeting_register(row_id, {"nextRetryAt": _now_iso(), "processingStatus": "Pending"})
+    retry_scheduler.wake()
     return {"success": True, "id": row_id}
 
 
+@app.post("/worker/wake")
+async def wake_retry_worker():
+    """Webhook hook: new register rows are waiting — run a retry cycle now instead of at the next deadline."""
+    retry_scheduler.wake()
+    return {"success": True, **retry_scheduler.snapshot()}
+
+
 @app.post("/worker/force-rerun/{external_meeting_id}")
 async def force_rerun_meeting(external_meeting_id: str):
     """Operator endpoint: explicit force rerun (bypasses strict idempotency guard once)."""
-    async with httpx.AsyncClient() as client:
-        lookup = await client.get(f"{NOTION_API_BASE}/api/meeting-register/by-external/{external_meeting_id}", timeout=30.0)
+    client = get_notion_client()
+    lookup = await client.get(f"{NOTION_API_BASE}/api/meeting-register/by-external/{external_meeting_id}", timeout=NOTION_TIMEOUT)
     if lookup.status_code == 404:
         raise HTTPException(status_code=404, detail="Meeting register row not found")
     lookup.raise_for_status()
     row_id = lookup.json()["id"]
+    register_mirror.add_row(lookup.json())
     await _patch_meeting_register(row_id, {
         "forceRerun": True,
         "nextRetryAt": _now_iso(),
         "processingStatus": "Pending",
     })
+    retry_scheduler.wake()
     return {"success": True, "id": row_id}
 
 
@@ -1029,8 +1653,10 @@ async def process_transcript_sync(transcript: TranscriptData):
     Waits for completion before returning.
     Use for testing or when immediate response is needed.
     """
+    _reject_if_draining()
+    transcript_data = _spool_transcript(transcript)
     try:
-        result = await process_meeting_transcript(transcript.model_dump())
+        result, _ = await _process_meeting_once(transcript_data)
 
         return ProcessingResult(
             meeting_id=transcript.id,
@@ -1039,66 +1665,207 @@ async def process_transcript_sync(transcript: TranscriptData):
             error=result.get("error"),
             summary=result.get("summary", f"Processed {len(result.get('messages', []))} messages")
         )
+    except LeaseHeldElsewhere as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        discard_compact_transcript(transcript_data)
+        release_sentences(transcript_data)
+
+
+@app.get("/worker/limits")
+async def get_worker_limits():
+    """Show worker-pool usage, ingest queue depth and the remaining provider rate-limit budgets."""
+    return {
+        "max_concurrent_meetings": MAX_CONCURRENT_MEETINGS,
+        "meetings_in_flight": _meetings_in_flight,
+        "single_flight_meetings": meeting_flights.snapshot(),
+        "register_mirror": register_mirror.snapshot(),
+        "retry_schedule": retry_scheduler.snapshot(),
+        "register_patches": register_patches.snapshot(),
+        "fireflies_client": fireflies_client.snapshot(),
+        "transcript_cache": transcript_cache.snapshot(),
+        "transcript_appends": {**transcript_appender.snapshot(), "in_flight": len(_transcript_append_tasks)},
+        "retry_concurrency": retry_concurrency.snapshot(),
+        "ingest_queue_depth": _get_ingest_queue().depth,
+        "ingest_queue_maxsize": INGEST_QUEUE_MAXSIZE,
+        "limiters": limiter_snapshot(),
+    }
 
 
 @app.get("/cost-summary")
 async def get_cost_summary():
     """Aggregate cost summary across all processed meetings."""
-    completed = [
-        entry["result"] for entry in processing_status.values()
-        if entry.get("status") == "completed" and entry.get("result")
-    ]
+    return job_store.cost_summary()
 
-    total_cost = 0.0
-    total_cache_savings = 0.0
-    by_method = {"standard": 0, "two_pass": 0}
-    by_model = {}
 
-    for result in completed:
-        cost = result.get("cost_analysis", {})
-        total_cost += cost.get("total_cost_usd", 0)
-        total_cache_savings += cost.get("cache_savings_usd", 0)
-
-        method = result.get("processing_method", "standard")
-        by_method[method] = by_method.get(method, 0) + 1
-
-        model = result.get("model_used", "unknown")
-        if model not in by_model:
-            by_model[model] = {"count": 0, "cost": 0.0}
-        by_model[model]["count"] += 1
-        by_model[model]["cost"] += cost.get("total_cost_usd", 0)
-
-    return {
-        "meetings_processed": len(completed),
-        "total_cost_usd": round(total_cost, 4),
-        "total_cache_savings_usd": round(total_cache_savings, 4),
-        "average_cost_per_meeting": round(total_cost / max(len(completed), 1), 4),
-        "by_processing_method": by_method,
-        "by_model": by_model,
-    }
+async def _job_store_maintenance_loop():
+    """Periodically evict expired result payloads and abandoned checkpoints so the local store stays small."""
+    while True:
+        try:
+            stats = job_store.evict_expired()
+            stats["checkpoints_deleted"] = checkpoint_store.evict_expired()
+            stats["transcript_appends_resumed"] = await _resume_transcript_appends()
+            if any(stats.values()):
+                logger.info(f"Job store maintenance: {stats}")
+        except Exception as e:
+            logger.warning(f"Job store maintenance failed: {e}")
+        await asyncio.sleep(JOB_STORE_MAINTENANCE_MINUTES * 60)
+
+
+def _start_workers() -> None:
+    """Start the ingest workers and the durable retry loop (on boot, and again after a drain)."""
+    global _retry_worker_task
+    _ingest_worker_tasks[:] = [task for task in _ingest_worker_tasks if not task.done()]
+    if not _ingest_worker_tasks:
+        for index in range(MAX_CONCURRENT_MEETINGS):
+            _ingest_worker_tasks.append(asyncio.create_task(_ingest_worker_loop(index + 1)))
+        logger.info(f"{MAX_CONCURRENT_MEETINGS} ingest worker(s) started (queue max {INGEST_QUEUE_MAXSIZE})")
+    if ENABLE_DURABLE_RETRY_WORKER and (_retry_worker_task is None or _retry_worker_task.done()):
+        _retry_worker_task = asyncio.create_task(_retry_worker_loop())
+        logger.info("Durable retry worker enabled")
 
 
 @app.on_event("startup")
 async def start_retry_worker():
-    """Start durable retry loop and auto-backfill loop on server boot (feature-flagged)."""
-    global _retry_worker_task, _auto_backfill_task
-    if ENABLE_DURABLE_RETRY_WORKER and _retry_worker_task is None:
-        _retry_worker_task = asyncio.create_task(_retry_worker_loop())
-        logger.info("Durable retry worker enabled")
+    """Start ingest workers, durable retry loop and auto-backfill loop on server boot (feature-flagged)."""
+    global _retry_worker_task, _auto_backfill_task, _job_store_maintenance_task
+    get_notion_client()
+    orphaned = clear_orphaned_spools()
+    if orphaned:
+        logger.info(f"Removed {orphaned} orphaned transcript spool file(s)")
+    interrupted = job_store.recover_interrupted()
+    if interrupted:
+        logger.warning(f"{interrupted} job(s) were interrupted by the previous shutdown; the retry worker will resume them")
+    if _job_store_maintenance_task is None:
+        _job_store_maintenance_task = asyncio.create_task(_job_store_maintenance_loop())
+    _start_workers()
     if ENABLE_AUTO_BACKFILL and _auto_backfill_task is None:
         _auto_backfill_task = asyncio.create_task(_auto_backfill_loop())
         logger.info("Auto-backfill loop enabled")
 
 
+async def _hand_back_to_durable_queue(meeting_id: str, row_id: Optional[str]) -> bool:
+    """Mark an unfinished meeting Pending with nextRetryAt=now so the next process picks it up at once."""
+    try:
+        if not row_id:
+            client = get_notion_client()
+            lookup = await client.get(
+                f"{NOTION_API_BASE}/api/meeting-register/by-external/{meeting_id}", timeout=NOTION_TIMEOUT
+            )
+            if lookup.status_code == 404:
+                logger.warning(f"Drain: no Meeting Register row for {meeting_id}; it needs a webhook redelivery")
+                return False
+            lookup.raise_for_status()
+            row_id = lookup.json()["id"]
+        await _patch_meeting_register(row_id, {
+            "processingStatus": "Pending",
+            "nextRetryAt": _now_iso(),
+            "retrySource": "shutdown_drain",
+        })
+        return True
+    except Exception as e:
+        logger.error(f"Drain: could not hand meeting {meeting_id} back to the durable queue: {e}")
+        return False
+
+
+async def _drain(deadline_seconds: int) -> Dict[str, Any]:
+    """
+    Stop taking work, let in-flight meetings stop at their next checkpoint (up to the
+    deadline), then hand every unfinished meeting back to the durable queue.
+    """
+    global _drain_in_progress
+    drain_event = _get_drain_event()
+    if drain_event.is_set():
+        return {"already_draining": True}
+    drain_event.set()
+    _drain_in_progress = True
+    try:
+        return await _drain_runs(deadline_seconds)
+    finally:
+        _drain_in_progress = False
+
+
+async def _drain_runs(deadline_seconds: int) -> Dict[str, Any]:
+    logger.warning(f"Draining: refusing new work, waiting up to {deadline_seconds}s for {len(_active_runs)} run(s)")
+
+    unfinished: Dict[str, Optional[str]] = {}
+    for meeting_id, transcript_data in _get_ingest_queue().drain_nowait():
+        release_sentences(transcript_data)
+        job_store.mark(meeting_id, "interrupted", error="Agent drained before this meeting started")
+        unfinished[meeting_id] = None
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + deadline_seconds
+    while _meetings_in_flight and loop.time() < deadline:
+        await asyncio.sleep(0.5)
+
+    workers = [task for task in [*_ingest_worker_tasks, _retry_worker_task] if task and not task.done()]
+    for task in workers:
+        task.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+    for meeting_id, row_id in _active_runs.items():
+        if job_store.get_status(meeting_id) != "completed":
+            unfinished[meeting_id] = row_id or unfinished.get(meeting_id)
+    _active_runs.clear()
+    for meeting_id in unfinished:
+        if job_store.get_status(meeting_id) == "processing":
+            job_store.mark(meeting_id, "interrupted", error="Agent shut down mid-run; resumes from its last checkpoint")
+
+    handed_back = await asyncio.gather(
+        *(_hand_back_to_durable_queue(meeting_id, row_id) for meeting_id, row_id in unfinished.items())
+    )
+    summary = {"unfinished": len(unfinished), "handed_back": sum(handed_back)}
+    logger.warning(f"Drain complete: {summary}")
+    return summary
+
+
+@app.post("/worker/drain")
+async def drain_worker():
+    """
+    Operator endpoint: drain ahead of a deploy (refuse new work, hand unfinished meetings back).
+    The ingest and retry workers stay stopped until POST /worker/resume or a restart.
+    """
+    return await _drain(SHUTDOWN_DRAIN_SECONDS)
+
+
+@app.post("/worker/resume")
+async def resume_worker():
+    """Operator endpoint: undo /worker/drain (accept work again and restart the workers)."""
+    if not _is_draining():
+        return {"resumed": False, "detail": "Agent is not draining"}
+    if _drain_in_progress:
+        raise HTTPException(status_code=409, detail="Drain still in progress; retry once it completes")
+    _get_drain_event().clear()
+    _start_workers()
+    logger.warning("Resumed after drain: accepting work again")
+    return {"resumed": True}
+
+
 @app.on_event("shutdown")
 async def stop_retry_worker():
-    """Stop background loops on shutdown."""
-    global _retry_worker_task, _auto_backfill_task
-    if _retry_worker_task:
-        _retry_worker_task.cancel()
-        _retry_worker_task = None
+    """Drain in-flight meetings, then stop background loops on shutdown."""
+    global _retry_worker_task, _auto_backfill_task, _job_store_maintenance_task
     if _auto_backfill_task:
         _auto_backfill_task.cancel()
         _auto_backfill_task = None
+    await _drain(SHUTDOWN_DRAIN_SECONDS)
+    if _job_store_maintenance_task:
+        _job_store_maintenance_task.cancel()
+        _job_store_maintenance_task = None
+    for task in _ingest_worker_tasks:
+        task.cancel()
+    _ingest_worker_tasks.clear()
+    if _retry_worker_task:
+        _retry_worker_task.cancel()
+        _retry_worker_task = None
+    background = [*_write_through_tasks.values(), *_transcript_append_tasks.values()]
+    if background:
+        _, unfinished = await asyncio.wait(background, timeout=10)
+        for task in unfinished:
+            # Appends keep their acknowledged pages and resume on the next boot
+            task.cancel()
+    await close_clients()
+    await fireflies_client.close()
@@ -2,7 +2,7 @@
 Output Validator — Two-phase validation layer that cross-checks every
 agent output against LIVE Notion data before writing.
 
-Phase 1 (Deterministic): Fetches fresh data from /api/context, builds
+Phase 1 (Deterministic): Loads /api/context (via context_loader's cache), builds
   ID lookup maps, validates every ID exists, checks status/select values,
   fixes date formats. Zero LLM cost — pure programmatic checks.
 
@@ -17,15 +17,16 @@ Architecture:
 import os
 import re
 import json
-import httpx
+import asyncio
 import logging
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from typing import Optional
+from rate_limiter import anthropic_budget
+from context_loader import fetch_notion_context
 
 logger = logging.getLogger(__name__)
 
 SONNET_MODEL = os.getenv("CLAUDE_MODEL", "claude-sonnet-4-20250514")
-NOTION_API_BASE = os.getenv("NOTION_API_BASE", "http://127.0.0.1:3000")
 
 # ─── Valid values for each status/select field (from deep schema audit) ────
 VALID_VALUES = {
@@ -59,7 +60,7 @@ class OutputValidator:
     """Two-phase output validation: deterministic checks + Sonnet semantic review."""
 
     def __init__(self):
-        self.client = Anthropic()
+        self.client = AsyncAnthropic()
         self.total_tokens = {"input": 0, "output": 0}
         self.total_corrections = 0
         self.total_phase1_corrections = 0
@@ -67,19 +68,20 @@ class OutputValidator:
         self.validation_log = []
         self._context_cache = None
         self._context_ids = None
+        # A turn's tool calls are validated concurrently; the first one loads the context
+        self._context_lock = asyncio.Lock()
 
     async def _load_live_context(self):
-        """Fetch fresh context from Notion API and build ID lookup sets."""
+        """Load the Notion context (shared with the prompt) and build ID lookup sets."""
         if self._context_cache is not None:
             return
+        async with self._context_lock:
+            if self._context_cache is None:
+                await self._build_context_ids()
 
-        logger.info("  Validator: Fetching live Notion data...")
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{NOTION_API_BASE}/api/context", timeout=30.0)
-            resp.raise_for_status()
-            self._context_cache = resp.json()
-
-        ctx = self._context_cache
+    async def _build_context_ids(self):
+        logger.info("  Validator: Loading live Notion data...")
+        ctx = await fetch_notion_context()
         self._context_ids = {
             "people_ids": {p["id"] for p in ctx.get("people", [])},
             "people_names": {p["name"].lower().strip(): p["id"] for p in ctx.get("people", [])},
@@ -90,6 +92,7 @@ class OutputValidator:
             "rock_ids": {r["id"] for r in ctx.get("rocks", [])},
             "cycle_ids": {c["id"] for c in ctx.get("planningCycles", [])},
         }
+        self._context_cache = ctx
 
         ppl = len(self._context_ids["people_ids"])
         proj = len(self._context_ids["project_ids"])
@@ -301,7 +304,8 @@ Return ONLY valid JSON:
 If no corrections needed, return original payload with empty corrections array."""
 
         try:
-            response = self.client.messages.create(
+            response = await anthropic_budget.create(
+                self.client,
                 model=SONNET_MODEL,
                 max_tokens=4096,
                 system="You are a data quality checker for Fuel Core Solutions. Fix factual errors. Return ONLY JSON.",
@@ -394,6 +398,26 @@ If no corrections needed, return original payload with empty corrections array."
             "passed": True,
         }
 
+    def export_state(self) -> dict:
+        """Running totals, for the agent-loop checkpoint."""
+        return {
+            "total_tokens": self.total_tokens,
+            "total_corrections": self.total_corrections,
+            "phase1_corrections": self.total_phase1_corrections,
+            "phase2_corrections": self.total_phase2_corrections,
+            "validation_log": self.validation_log,
+        }
+
+    def restore_state(self, state: dict) -> None:
+        """Continue the totals of a checkpointed run."""
+        if not state:
+            return
+        self.total_tokens = dict(state.get("total_tokens") or self.total_tokens)
+        self.total_corrections = state.get("total_corrections", 0)
+        self.total_phase1_corrections = state.get("phase1_corrections", 0)
+        self.total_phase2_corrections = state.get("phase2_corrections", 0)
+        self.validation_log = list(state.get("validation_log") or [])
+
     def get_summary(self):
         """Return a summary of all validations performed."""
         return {
@@ -0,0 +1,277 @@
+"""
+Rate Limiter — Token-bucket limiters for the upstream provider budgets.
+
+Anthropic enforces per-minute budgets on requests, input tokens and output
+tokens; the Notion bridge is bounded by Notion's ~3 requests/second. Every
+meeting worker draws from the same process-wide buckets, so raising
+MAX_CONCURRENT_MEETINGS scales throughput up to the provider limits instead
+of past them.
+
+Anthropic accounting:
+  reserve()  — before a call: 1 request + estimated input tokens + an output
+               reservation (output length is unknown until the call returns)
+  settle()   — after a call: the estimate is replaced by the real usage, so
+               long answers borrow from the next minute and short ones refund
+  release()  — when the call failed: token reservations are refunded, the
+               request slot is not (Anthropic still counted it)
+
+Fireflies requests (fireflies_client) draw from their own per-minute bucket.
+
+A rate of 0 disables a bucket.
+
+AdaptiveConcurrency is the complementary control for work whose real limit is
+unknown (the retry worker after a provider hold): an AIMD window that grows by
+one slot per round of successes and halves on overload.
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+import anthropic as _anthropic
+
+from circuit_breaker import circuit_breakers
+from errors import from_anthropic
+
+logger = logging.getLogger(__name__)
+
+ANTHROPIC_REQUESTS_PER_MINUTE = int(os.getenv("ANTHROPIC_REQUESTS_PER_MINUTE", "1000"))
+ANTHROPIC_INPUT_TOKENS_PER_MINUTE = int(os.getenv("ANTHROPIC_INPUT_TOKENS_PER_MINUTE", "450000"))
+ANTHROPIC_OUTPUT_TOKENS_PER_MINUTE = int(os.getenv("ANTHROPIC_OUTPUT_TOKENS_PER_MINUTE", "90000"))
+# Output tokens reserved up-front per call, reconciled with real usage afterwards
+ANTHROPIC_OUTPUT_RESERVE_TOKENS = int(os.getenv("ANTHROPIC_OUTPUT_RESERVE_TOKENS", "2048"))
+NOTION_REQUESTS_PER_SECOND = float(os.getenv("NOTION_REQUESTS_PER_SECOND", "3"))
+# Fireflies API quota (Business plan: 60/minute); bursts are kept small so a
+# sliding-window count on their side never sees more than the quota
+FIREFLIES_REQUESTS_PER_MINUTE = float(os.getenv("FIREFLIES_REQUESTS_PER_MINUTE", "50"))
+FIREFLIES_BURST = float(os.getenv("FIREFLIES_BURST", "5"))
+
+
+class TokenBucket:
+    """Async token bucket. Waiters are served in FIFO order."""
+
+    def __init__(self, name: str, capacity: float, refill_per_second: float):
+        self.name = name
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.capacity > 0 and self.refill_per_second > 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Wait until `amount` tokens are available and take them. Returns the amount taken."""
+        if not self.enabled or amount <= 0:
+            return 0.0
+        # A single request larger than the whole bucket would otherwise wait forever
+        amount = min(float(amount), self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return amount
+                wait = (amount - self._tokens) / self.refill_per_second
+                if wait > 1:
+                    logger.info(f"Rate limiter [{self.name}]: waiting {wait:.1f}s for {amount:.0f} tokens")
+                await asyncio.sleep(wait)
+
+    def debit(self, amount: float) -> None:
+        """Adjust the balance after the fact. Negative amounts refund; the balance may go below zero."""
+        if not self.enabled or not amount:
+            return
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens - amount)
+
+    def snapshot(self) -> dict:
+        if not self.enabled:
+            return {"enabled": False}
+        self._refill()
+        return {
+            "enabled": True,
+            "available": round(self._tokens, 1),
+            "capacity": self.capacity,
+            "refill_per_second": round(self.refill_per_second, 3),
+        }
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency window: +1 slot per window's worth of successes, halved on overload."""
+
+    def __init__(self, name: str, maximum: int, minimum: int = 1):
+        self.name = name
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.limit = float(self.maximum)
+        self.in_flight = 0
+        self._cond = None
+
+    def _get_cond(self) -> asyncio.Condition:
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one slot of the current window while the block runs."""
+        cond = self._get_cond()
+        async with cond:
+            await cond.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            async with cond:
+                self.in_flight -= 1
+                cond.notify_all()
+
+    def _set_limit(self, limit: float) -> None:
+        previous = int(self.limit)
+        self.limit = min(float(self.maximum), max(float(self.minimum), limit))
+        if int(self.limit) != previous:
+            logger.info(f"Adaptive concurrency [{self.name}]: {previous} → {int(self.limit)}")
+        if int(self.limit) > previous and self._cond is not None:
+            asyncio.get_running_loop().create_task(self._wake_waiters())
+
+    async def _wake_waiters(self) -> None:
+        async with self._get_cond():
+            self._get_cond().notify_all()
+
+    def record_success(self) -> None:
+        self._set_limit(self.limit + 1.0 / max(int(self.limit), 1))
+
+    def record_overload(self) -> None:
+        self._set_limit(self.limit / 2)
+
+    def probe(self) -> None:
+        """Drop to the minimum window; successes widen it again."""
+        self._set_limit(self.minimum)
+
+    def snapshot(self) -> dict:
+        return {"limit": int(self.limit), "maximum": self.maximum, "in_flight": self.in_flight}
+
+
+def _per_minute_bucket(name: str, per_minute: int) -> TokenBucket:
+    return TokenBucket(name, capacity=per_minute, refill_per_second=per_minute / 60.0)
+
+
+def estimate_request_tokens(kwargs: dict) -> int:
+    """Cheap input-token estimate for a messages.create call (1 token ≈ 4 chars)."""
+    chars = 0
+    for key in ("system", "messages", "tools"):
+        value = kwargs.get(key)
+        if not value:
+            continue
+        if isinstance(value, str):
+            chars += len(value)
+        else:
+            chars += len(json.dumps(value, default=str))
+    return chars // 4
+
+
+class AnthropicBudget:
+    """Shared request / input-token / output-token budget for every Claude call."""
+
+    def __init__(self, requests_per_minute: int, input_tokens_per_minute: int,
+                 output_tokens_per_minute: int, output_reserve: int):
+        self.requests = _per_minute_bucket("anthropic-requests", requests_per_minute)
+        self.input_tokens = _per_minute_bucket("anthropic-input-tokens", input_tokens_per_minute)
+        self.output_tokens = _per_minute_bucket("anthropic-output-tokens", output_tokens_per_minute)
+        self.output_reserve = output_reserve
+
+    async def reserve(self, kwargs: dict) -> dict:
+        """Block until the call fits in the budget. Returns the reservation to settle later."""
+        max_tokens = int(kwargs.get("max_tokens") or self.output_reserve)
+        reservation = {"input": 0.0, "output": 0.0}
+        await self.requests.acquire(1)
+        reservation["input"] = await self.input_tokens.acquire(estimate_request_tokens(kwargs))
+        reservation["output"] = await self.output_tokens.acquire(min(max_tokens, self.output_reserve))
+        return reservation
+
+    def settle(self, reservation: dict, usage) -> None:
+        """Replace the reservation with the real usage reported by the API."""
+        if usage is None:
+            self.release(reservation)
+            return
+        # Cache reads do not count against the input-token rate limit
+        actual_input = (getattr(usage, "input_tokens", 0) or 0) + (getattr(usage, "cache_creation_input_tokens", 0) or 0)
+        actual_output = getattr(usage, "output_tokens", 0) or 0
+        self.input_tokens.debit(actual_input - reservation["input"])
+        self.output_tokens.debit(actual_output - reservation["output"])
+
+    def release(self, reservation: dict) -> None:
+        """Refund the token reservation of a call that did not complete."""
+        self.input_tokens.debit(-reservation["input"])
+        self.output_tokens.debit(-reservation["output"])
+
+    async def create(self, client, **kwargs):
+        """Rate-limited, breaker-guarded `await client.messages.create(**kwargs)`.
+
+        SDK errors are re-raised as typed ProviderErrors (provider "anthropic").
+        """
+        circuit_breakers.check("anthropic")
+        reservation = await self.reserve(kwargs)
+        try:
+            response = await client.messages.create(**kwargs)
+        except _anthropic.APIError as e:
+            self.release(reservation)
+            raise from_anthropic(e) from e
+        except Exception:
+            self.release(reservation)
+            raise
+        self.settle(reservation, getattr(response, "usage", None))
+        circuit_breakers.record_success("anthropic")
+        return response
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": self.requests.snapshot(),
+            "input_tokens": self.input_tokens.snapshot(),
+            "output_tokens": self.output_tokens.snapshot(),
+        }
+
+
+anthropic_budget = AnthropicBudget(
+    ANTHROPIC_REQUESTS_PER_MINUTE,
+    ANTHROPIC_INPUT_TOKENS_PER_MINUTE,
+    ANTHROPIC_OUTPUT_TOKENS_PER_MINUTE,
+    ANTHROPIC_OUTPUT_RESERVE_TOKENS,
+)
+
+notion_bucket = TokenBucket(
+    "notion",
+    capacity=max(NOTION_REQUESTS_PER_SECOND, 1.0) if NOTION_REQUESTS_PER_SECOND > 0 else 0,
+    refill_per_second=NOTION_REQUESTS_PER_SECOND,
+)
+
+
+fireflies_bucket = TokenBucket(
+    "fireflies",
+    capacity=max(min(FIREFLIES_BURST, FIREFLIES_REQUESTS_PER_MINUTE), 1.0) if FIREFLIES_REQUESTS_PER_MINUTE > 0 else 0,
+    refill_per_second=FIREFLIES_REQUESTS_PER_MINUTE / 60,
+)
+
+
+async def notion_request_hook(request) -> None:
+    """httpx request event hook: hold each Notion bridge request until the bucket allows it."""
+    await notion_bucket.acquire(1)
+
+
+def limiter_snapshot() -> dict:
+    """Current state of every limiter, for the /worker/limits endpoint."""
+    return {
+        "anthropic": anthropic_budget.snapshot(),
+        "notion": notion_bucket.snapshot(),
+        "fireflies": fireflies_bucket.snapshot(),
+    }
@@ -0,0 +1,301 @@
+"""
+Register Mirror — Local, indexed copy of the Notion Meeting Register (SQLite).
+
+The durable retry worker used to download the whole Meeting Register through
+the bridge on every poll (twice after stale requeues) and filter it in
+Python. It now reads a mirror kept in the shared job store database:
+
+  - delta sync: GET /api/meeting-register?editedSince=<cursor> returns only
+    rows edited since the newest lastEditedTime already mirrored (Notion
+    timestamps are minute-granular, so the cursor minute is re-read)
+  - a full resync every REGISTER_FULL_SYNC_HOURS catches deleted/archived
+    rows, which a last-edited delta cannot see
+  - our own PATCHes are applied to the mirror in place (apply_patch), so the
+    worker sees them without another fetch
+  - every row change is forwarded to the retry scheduler, which keeps the
+    worker asleep until the next nextRetryAt; stale candidates come from an
+    indexed query. The original Python predicates still make the final call.
+    The schedule lives in memory, so on startup it is rebuilt from the
+    persisted rows before the first (possibly delta) refresh
+  - the auto-backfill checks Fireflies ids and dates against the indexed
+    columns (known_external_ids / dates_with_rows) and keeps its high-water
+    mark in mirror_state
+"""
+
+import os
+import json
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from job_store import get_connection
+from http_client import get_notion_client, REGISTER_TIMEOUT
+from retry_scheduler import retry_scheduler
+from errors import as_provider_error
+
+logger = logging.getLogger(__name__)
+
+NOTION_API_BASE = os.getenv("NOTION_API_BASE", "http://127.0.0.1:8080")
+REGISTER_FULL_SYNC_HOURS = float(os.getenv("REGISTER_FULL_SYNC_HOURS", "6"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS register_rows (
+    id                  TEXT PRIMARY KEY,
+    external_meeting_id TEXT,
+    processing_status   TEXT,
+    next_retry_at       TEXT,
+    force_rerun         INTEGER NOT NULL DEFAULT 0,
+    processed_at        TEXT,
+    stale_reference     TEXT,
+    meeting_date        TEXT,
+    last_edited_time    TEXT,
+    row_json            TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_register_status_retry ON register_rows(processing_status, next_retry_at);
+CREATE INDEX IF NOT EXISTS idx_register_external ON register_rows(external_meeting_id);
+CREATE INDEX IF NOT EXISTS idx_register_meeting_date ON register_rows(meeting_date);
+CREATE TABLE IF NOT EXISTS mirror_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Statuses the retry worker can act on (see main._is_due_for_retry / _is_stale_unprocessed_row)
+_DUE_STATUSES = ("Pending", "Processing")
+_STALE_STATUSES = ("Pending", "Processing", "Not started", "Speaker Review")
+
+
+def _normalize_ts(value: Optional[str]) -> Optional[str]:
+    """UTC ISO string so SQL comparisons match datetime comparisons; None if missing/unparseable."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).isoformat()
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class RegisterMirror:
+    """Indexed local mirror of Meeting Register rows, refreshed by delta sync."""
+
+    def __init__(self, conn=None):
+        self.conn = conn or get_connection()
+        self.conn.executescript(_SCHEMA)
+        self._seed_schedule()
+
+    # ── state ──
+    def get_state(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM mirror_state WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def set_state(self, key: str, value: Optional[str]) -> None:
+        self.conn.execute(
+            "INSERT INTO mirror_state (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def _seed_schedule(self) -> None:
+        """Rebuild the in-memory retry schedule from the persisted rows (the first refresh may be a delta)."""
+        rows = self.conn.execute(
+            f"""
+            SELECT id, processing_status, next_retry_at, force_rerun FROM register_rows
+            WHERE processing_status IN ({",".join("?" * len(_DUE_STATUSES))})
+               OR (processing_status = 'Failed' AND force_rerun = 1)
+            """,
+            _DUE_STATUSES,
+        ).fetchall()
+        for row in rows:
+            self._schedule(row["id"], row["processing_status"], row["next_retry_at"], bool(row["force_rerun"]))
+        if rows:
+            logger.info(f"Register mirror: scheduled {len(rows)} persisted row(s) for retry")
+
+    # ── writes ──
+    @staticmethod
+    def _schedule(row_id: str, status: str, next_retry_at: Optional[str], force_rerun: bool) -> None:
+        if status in _DUE_STATUSES or (status == "Failed" and force_rerun):
+            due_ts = datetime.fromisoformat(next_retry_at).timestamp() if next_retry_at else 0.0
+            retry_scheduler.schedule(row_id, due_ts)
+        else:
+            retry_scheduler.cancel(row_id)
+
+    def _upsert_many(self, rows: Iterable[Dict[str, Any]]) -> int:
+        params = []
+        for row in rows:
+            status = (row.get("processingStatus") or "").strip()
+            next_retry_at = _normalize_ts(row.get("nextRetryAt"))
+            self._schedule(row["id"], status, next_retry_at, bool(row.get("forceRerun")))
+            params.append((
+                row["id"],
+                (row.get("externalMeetingId") or "").strip() or None,
+                status,
+                next_retry_at,
+                1 if row.get("forceRerun") else 0,
+                row.get("processedAt") or None,
+                # Same precedence as _is_stale_unprocessed_row's reference timestamp
+                _normalize_ts(row.get("lastAttemptAt") or row.get("nextRetryAt") or row.get("meetingDate")),
+                (row.get("meetingDate") or "")[:10] or None,
+                row.get("lastEditedTime"),
+                json.dumps(row, default=str),
+            ))
+        self.conn.executemany(
+            """
+            INSERT INTO register_rows (id, external_meeting_id, processing_status, next_retry_at, force_rerun,
+                                       processed_at, stale_reference, meeting_date, last_edited_time, row_json)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                external_meeting_id = excluded.external_meeting_id,
+                processing_status = excluded.processing_status,
+                next_retry_at = excluded.next_retry_at,
+                force_rerun = excluded.force_rerun,
+                processed_at = excluded.processed_at,
+                stale_reference = excluded.stale_reference,
+                meeting_date = excluded.meeting_date,
+                last_edited_time = COALESCE(excluded.last_edited_time, register_rows.last_edited_time),
+                row_json = excluded.row_json
+            """,
+            params,
+        )
+        return len(params)
+
+    def apply_patch(self, row_id: str, payload: Dict[str, Any]) -> None:
+        """Reflect a successful bridge PATCH in the mirror without re-fetching."""
+        existing = self.get(row_id)
+        if existing is None:
+            return
+        existing.update(payload)
+        self._upsert_many([existing])
+
+    def add_row(self, row: Dict[str, Any]) -> None:
+        """Record a row we just created or upserted through the bridge."""
+        if row.get("id"):
+            existing = self.get(row["id"]) or {}
+            existing.update(row)
+            self._upsert_many([existing])
+
+    # ── sync ──
+    async def _fetch(self, edited_since: Optional[str] = None) -> List[Dict[str, Any]]:
+        try:
+            client = get_notion_client()
+            resp = await client.get(
+                f"{NOTION_API_BASE}/api/meeting-register",
+                params={"editedSince": edited_since} if edited_since else None,
+                timeout=REGISTER_TIMEOUT,
+            )
+            resp.raise_for_status()
+            return resp.json() or []
+        except Exception as e:
+            raise as_provider_error(e, "notion", "Notion meeting register fetch failed") from e
+
+    async def refresh(self, force_full: bool = False) -> Dict[str, Any]:
+        """Pull changes since the last sync (or everything, when a full resync is due)."""
+        cursor = self.get_state("cursor")
+        last_full = self.get_state("last_full_sync")
+        full_due = (
+            force_full or not cursor or not last_full
+            or _now() - datetime.fromisoformat(last_full) >= timedelta(hours=REGISTER_FULL_SYNC_HOURS)
+        )
+
+        started = _now().isoformat()
+        rows = await self._fetch(None if full_due else cursor)
+        with self.conn:
+            self.conn.execute("BEGIN")
+            if full_due:
+                self.conn.execute("DELETE FROM register_rows")
+                retry_scheduler.clear()
+            self._upsert_many(rows)
+            newest = max((r.get("lastEditedTime") or "" for r in rows), default="")
+            if newest and (not cursor or newest > cursor):
+                cursor = newest
+            self.set_state("cursor", cursor or started)
+            if full_due:
+                self.set_state("last_full_sync", started)
+
+        if full_due:
+            logger.info(f"Register mirror: full sync loaded {len(rows)} row(s)")
+        elif rows:
+            logger.info(f"Register mirror: delta sync applied {len(rows)} changed row(s)")
+        return {"full": full_due, "rows": len(rows), "cursor": cursor}
+
+    # ── reads ──
+    @staticmethod
+    def _rows(cursor) -> List[Dict[str, Any]]:
+        return [json.loads(r["row_json"]) for r in cursor]
+
+    def get(self, row_id: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT row_json FROM register_rows WHERE id = ?", (row_id,)).fetchone()
+        return json.loads(row["row_json"]) if row else None
+
+    def get_by_external(self, external_meeting_id: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute(
+            "SELECT row_json FROM register_rows WHERE external_meeting_id = ? LIMIT 1", (external_meeting_id,)
+        ).fetchone()
+        return json.loads(row["row_json"]) if row else None
+
+    def stale_candidates(self, cutoff_dt: datetime) -> List[Dict[str, Any]]:
+        """Unprocessed rows whose last activity is older than the cutoff."""
+        return self._rows(self.conn.execute(
+            f"""
+            SELECT row_json FROM register_rows
+            WHERE processing_status IN ({",".join("?" * len(_STALE_STATUSES))})
+              AND processed_at IS NULL AND external_meeting_id IS NOT NULL
+              AND (stale_reference IS NULL OR stale_reference <= ?)
+            """,
+            (*_STALE_STATUSES, cutoff_dt.astimezone(timezone.utc).isoformat()),
+        ))
+
+    def rows_with_status(self, statuses: Iterable[str]) -> List[Dict[str, Any]]:
+        statuses = tuple(statuses)
+        return self._rows(self.conn.execute(
+            f"SELECT row_json FROM register_rows WHERE processing_status IN ({','.join('?' * len(statuses))})",
+            statuses,
+        ))
+
+    def known_external_ids(self, external_ids: Iterable[str]) -> Set[str]:
+        """The subset of external meeting ids that already have a register row."""
+        return self._in_column("external_meeting_id", external_ids)
+
+    def dates_with_rows(self, dates: Iterable[str]) -> Set[str]:
+        """The subset of YYYY-MM-DD dates that already have at least one register row."""
+        return self._in_column("meeting_date", dates)
+
+    def _in_column(self, column: str, values: Iterable[str]) -> Set[str]:
+        values = list({v for v in values if v})
+        found: Set[str] = set()
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(values), 500):
+            chunk = values[start:start + 500]
+            found.update(
+                r[0] for r in self.conn.execute(
+                    f"SELECT DISTINCT {column} FROM register_rows WHERE {column} IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+            )
+        return found
+
+    def all_rows(self) -> List[Dict[str, Any]]:
+        return self._rows(self.conn.execute("SELECT row_json FROM register_rows"))
+
+    def snapshot(self) -> Dict[str, Any]:
+        counts = {
+            r["processing_status"] or "(none)": r["n"]
+            for r in self.conn.execute(
+                "SELECT processing_status, COUNT(*) AS n FROM register_rows GROUP BY processing_status"
+            )
+        }
+        return {
+            "rows": sum(counts.values()),
+            "by_status": counts,
+            "cursor": self.get_state("cursor"),
+            "last_full_sync": self.get_state("last_full_sync"),
+        }
+
+
+register_mirror = RegisterMirror()
@@ -0,0 +1,153 @@
+"""
+Register Patches — Coalesced, batched Meeting Register updates.
+
+Every queue-state write (_patch_meeting_register) goes through one batcher:
+
+  - updates are collected for REGISTER_PATCH_WINDOW_MS; several updates to the
+    same row merge into one (later fields win, exactly as sequential PATCHes
+    would leave the row)
+  - a batch of up to REGISTER_PATCH_BATCH_SIZE rows is sent as one
+    POST /api/meeting-register/batch-update; the bridge applies it with
+    bounded concurrency and answers per row
+  - bridges without the batch endpoint get the rows as individual PATCHes,
+    REGISTER_PATCH_CONCURRENCY at a time
+  - each caller gets its own row's outcome: one failed row does not fail the
+    others in its batch, as a typed ProviderError built from the bridge's
+    per-row status ("Notion meeting register patch failed for <id>: ...")
+
+The Notion token bucket is debited for the rows a batch carries, so batching
+saves round trips without exceeding the Notion budget.
+"""
+
+import os
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from http_client import get_notion_client, REGISTER_TIMEOUT
+from rate_limiter import notion_bucket
+from errors import ProviderError, as_provider_error, kind_for_status
+
+logger = logging.getLogger(__name__)
+
+NOTION_API_BASE = os.getenv("NOTION_API_BASE", "http://127.0.0.1:8080")
+REGISTER_PATCH_WINDOW_MS = int(os.getenv("REGISTER_PATCH_WINDOW_MS", "25"))
+REGISTER_PATCH_BATCH_SIZE = max(1, int(os.getenv("REGISTER_PATCH_BATCH_SIZE", "25")))
+REGISTER_PATCH_CONCURRENCY = max(1, int(os.getenv("REGISTER_PATCH_CONCURRENCY", "3")))
+
+
+class RegisterPatchBatcher:
+    """Collects per-row patches and flushes them in coalesced batches."""
+
+    def __init__(self):
+        # row id → (merged payload, futures of every caller waiting on it)
+        self._pending: Dict[str, Tuple[Dict[str, Any], List[asyncio.Future]]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._batch_supported = True
+        self.stats = {"submitted": 0, "sent": 0, "batches": 0, "failed": 0}
+
+    async def patch(self, row_id: str, payload: Dict[str, Any]) -> None:
+        """Queue a patch for one row and wait until it (merged with any others) is applied."""
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.get(row_id)
+        if pending is None:
+            self._pending[row_id] = (dict(payload), [future])
+        else:
+            pending[0].update(payload)
+            pending[1].append(future)
+        self.stats["submitted"] += 1
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        await future
+
+    async def patch_many(self, updates: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, Optional[str]]:
+        """Apply many row patches concurrently. Returns row id → error text (None when applied)."""
+        updates = list(updates)
+        results = await asyncio.gather(
+            *(self.patch(row_id, payload) for row_id, payload in updates), return_exceptions=True
+        )
+        outcome: Dict[str, Optional[str]] = {}
+        for (row_id, _), result in zip(updates, results):
+            outcome[row_id] = str(result) if isinstance(result, BaseException) else outcome.get(row_id)
+        return outcome
+
+    async def _flush_loop(self) -> None:
+        while self._pending:
+            await asyncio.sleep(REGISTER_PATCH_WINDOW_MS / 1000)
+            while self._pending:
+                batch = []
+                for row_id in list(self._pending)[:REGISTER_PATCH_BATCH_SIZE]:
+                    batch.append((row_id, *self._pending.pop(row_id)))
+                await self._send(batch)
+
+    async def _send(self, batch: List[Tuple[str, Dict[str, Any], List[asyncio.Future]]]) -> None:
+        errors: Dict[str, ProviderError] = {}
+        try:
+            if self._batch_supported and len(batch) > 1:
+                errors = await self._send_batch(batch)
+            else:
+                errors = await self._send_individually(batch)
+        except Exception as e:
+            error = as_provider_error(e, "notion")
+            errors = {row_id: error for row_id, _, _ in batch}
+
+        self.stats["batches"] += 1
+        self.stats["sent"] += len(batch)
+        for row_id, _, futures in batch:
+            error = errors.get(row_id)
+            if error:
+                self.stats["failed"] += 1
+            for future in futures:
+                if future.done():
+                    continue
+                if error:
+                    future.set_exception(error.prefixed(f"Notion meeting register patch failed for {row_id}"))
+                else:
+                    future.set_result(None)
+
+    async def _send_batch(self, batch) -> Dict[str, ProviderError]:
+        client = get_notion_client()
+        resp = await client.post(
+            f"{NOTION_API_BASE}/api/meeting-register/batch-update",
+            json={"updates": [{"id": row_id, "fields": payload} for row_id, payload, _ in batch]},
+            timeout=REGISTER_TIMEOUT,
+        )
+        if resp.status_code == 404:
+            logger.info("Bridge has no meeting-register batch endpoint; patching rows individually")
+            self._batch_supported = False
+            return await self._send_individually(batch)
+        resp.raise_for_status()
+        # The request hook took one token; the bridge made one Notion call per row
+        notion_bucket.debit(len(batch) - 1)
+        return {
+            item["id"]: ProviderError(
+                item.get("error") or "unknown error", "notion",
+                kind_for_status(item["status"]) if item.get("status") else "unknown", item.get("status"),
+            )
+            for item in resp.json().get("results", [])
+            if not item.get("success")
+        }
+
+    async def _send_individually(self, batch) -> Dict[str, ProviderError]:
+        client = get_notion_client()
+        sem = asyncio.Semaphore(REGISTER_PATCH_CONCURRENCY)
+
+        async def _one(row_id: str, payload: Dict[str, Any]) -> Optional[ProviderError]:
+            async with sem:
+                try:
+                    resp = await client.patch(
+                        f"{NOTION_API_BASE}/api/meeting-register/{row_id}", json=payload, timeout=REGISTER_TIMEOUT
+                    )
+                    resp.raise_for_status()
+                    return None
+                except Exception as e:
+                    return as_provider_error(e, "notion")
+
+        results = await asyncio.gather(*(_one(row_id, payload) for row_id, payload, _ in batch))
+        return {row_id: error for (row_id, _, _), error in zip(batch, results) if error}
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {**self.stats, "pending_rows": len(self._pending), "batch_endpoint": self._batch_supported}
+
+
+register_patches = RegisterPatchBatcher()
@@ -0,0 +1,124 @@
+"""
+Retry Scheduler — Deadline-driven wake-ups for the durable retry worker.
+
+Instead of waking every RETRY_POLL_SECONDS to scan for due rows, the worker
+sleeps until the earliest nextRetryAt it knows about:
+
+  - a min-heap of (due timestamp, row id); rescheduling a row pushes a new
+    entry and the old one is skipped lazily when it reaches the top
+  - the register mirror schedules/cancels rows as it sees them change
+    (delta syncs and our own patches), so the heap always reflects the mirror
+  - wake() — called by the webhook hook and the operator retry endpoints —
+    ends the current sleep immediately (or the next one, if the worker is
+    busy); scheduling a row earlier than the current deadline does the same
+  - the sleep is capped at RETRY_RESYNC_SECONDS so edits made directly in
+    Notion and stale-row checks are still picked up while nothing is due
+"""
+
+import time
+import heapq
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RetryScheduler:
+    """Min-heap of row due times with an awaitable 'sleep until next due'."""
+
+    def __init__(self, clock=time.time):
+        self._clock = clock
+        self._heap: List[Tuple[float, str]] = []
+        self._due: Dict[str, float] = {}
+        self._event: Optional[asyncio.Event] = None
+        # Deadline of the wait() in progress; None while the worker is busy (it
+        # re-reads the heap before its next wait, so no wake-up is needed then)
+        self._deadline: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def _get_event(self) -> asyncio.Event:
+        if self._event is None:
+            self._event = asyncio.Event()
+        return self._event
+
+    def schedule(self, key: str, due_ts: float) -> None:
+        """(Re)schedule `key` to become due at epoch seconds `due_ts`."""
+        if self._due.get(key) == due_ts:
+            return
+        self._due[key] = due_ts
+        heapq.heappush(self._heap, (due_ts, key))
+        # Drop superseded entries once they dominate the heap
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._heap = [(ts, k) for k, ts in self._due.items()]
+            heapq.heapify(self._heap)
+        if self._deadline is not None and due_ts < self._deadline:
+            self.wake()
+
+    def cancel(self, key: str) -> None:
+        self._due.pop(key, None)
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._due.clear()
+
+    def _prune(self) -> None:
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> Optional[float]:
+        self._prune()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now_ts: Optional[float] = None) -> List[str]:
+        """Remove and return every key due at or before now, earliest first."""
+        now_ts = self._clock() if now_ts is None else now_ts
+        keys = []
+        while True:
+            self._prune()
+            if not self._heap or self._heap[0][0] > now_ts:
+                return keys
+            _, key = heapq.heappop(self._heap)
+            del self._due[key]
+            keys.append(key)
+
+    def wake(self) -> None:
+        """End the current (or next) wait() immediately."""
+        self._get_event().set()
+
+    async def wait(self, max_seconds: float) -> bool:
+        """Sleep until the next row is due, wake() is called, or max_seconds pass.
+
+        Returns True when woken early by wake()/an earlier schedule().
+        """
+        event = self._get_event()
+        now = self._clock()
+        next_due = self.next_due()
+        self._deadline = now + max_seconds if next_due is None else min(next_due, now + max_seconds)
+        try:
+            if event.is_set():
+                return True
+            timeout = max(self._deadline - now, 0.0)
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+                return True
+            except asyncio.TimeoutError:
+                return False
+        finally:
+            event.clear()
+            self._deadline = None
+
+    def snapshot(self) -> Dict[str, object]:
+        next_due = self.next_due()
+        return {
+            "scheduled": len(self._due),
+            "next_due_at": (
+                datetime.fromtimestamp(next_due, timezone.utc).isoformat() if next_due is not None else None
+            ),
+        }
+
+
+retry_scheduler = RetryScheduler()
@@ -0,0 +1,266 @@
+"""
+Single Flight — At most one processing run per meeting, across every entry point.
+
+The webhook queue, the durable retry worker (including operator retry /
+force-rerun, which are picked up through it) and /process-transcript-sync all
+funnel through one SingleFlight keyed on the external (Fireflies) meeting id:
+
+  - in-process: a second caller for a meeting that is already running does not
+    start another Claude run; it awaits the in-flight run and gets its result
+  - across replicas: the owning run holds a lease on the Meeting Register row
+    ("Lease Owner" / "Lease Expires At" via the bridge), renewed while it runs.
+    A replica that finds a live lease held by someone else raises
+    LeaseHeldElsewhere instead of processing. If a renewal finds the lease
+    taken over, the running block is told through check_lease(), which the
+    agent calls before every Notion write (LeaseLost), and the lease is not
+    released on exit
+
+The retry worker takes the same lease to claim a due register row before it
+touches it, so replicas can share one register: each due row is processed by
+whichever replica claims it first, and a crashed replica's claim lapses after
+MEETING_LEASE_SECONDS. A meeting_lease() block for a meeting this process
+already holds (or is claiming) shares that lease: nested blocks in the same
+task directly, other tasks once the pending claim has settled. The lease is
+released when the last of them exits.
+
+The bridge claims a lease with a token write that it re-reads after
+LEASE_SETTLE_MS, so two replicas racing for the same row cannot both win. A
+meeting that has no register row yet gets a lock row (retrySource
+"meeting_lease") created by the claim, which the retry worker ignores.
+
+Leases fail open: if the bridge cannot be reached (or predates the lease
+endpoints) the run proceeds under the in-process guard only.
+"""
+
+import os
+import random
+import socket
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from http_client import get_notion_client, NOTION_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+NOTION_API_BASE = os.getenv("NOTION_API_BASE", "http://127.0.0.1:8080")
+ENABLE_MEETING_LEASES = os.getenv("ENABLE_MEETING_LEASES", "true").lower() == "true"
+MEETING_LEASE_SECONDS = int(os.getenv("MEETING_LEASE_SECONDS", "900"))
+LEASE_CLAIM_ATTEMPTS = max(1, int(os.getenv("LEASE_CLAIM_ATTEMPTS", "3")))
+# retrySource of the lock rows the bridge creates for meetings without a register row
+LEASE_ROW_SOURCE = "meeting_lease"
+# Identifies this replica as a lease owner
+REPLICA_ID = (
+    os.getenv("REPLICA_ID")
+    or os.getenv("RAILWAY_REPLICA_ID")
+    or f"{socket.gethostname()}:{os.getpid()}"
+)
+
+
+class LeaseHeldElsewhere(RuntimeError):
+    """Another replica is already processing this meeting."""
+
+    def __init__(self, meeting_id: str, owner: Optional[str], expires_at: Optional[str]):
+        self.meeting_id = meeting_id
+        self.owner = owner
+        self.expires_at = expires_at
+        super().__init__(f"Meeting {meeting_id} is being processed by replica {owner} (lease until {expires_at})")
+
+
+class FlightCancelled(RuntimeError):
+    """The in-flight run a caller attached to was cancelled (e.g. by a shutdown drain)."""
+
+
+class LeaseLost(LeaseHeldElsewhere):
+    """This replica's lease was taken over by another replica while the meeting was running."""
+
+    def __init__(self, meeting_id: str, owner: Optional[str], expires_at: Optional[str]):
+        super().__init__(meeting_id, owner, expires_at)
+        self.args = (f"Lost processing lease for meeting {meeting_id} to replica {owner}; stopping before the next write",)
+
+
+class _LeaseState:
+    """The lease one meeting_lease() block (and the blocks sharing it) runs under."""
+
+    def __init__(self, meeting_id: str):
+        self.meeting_id = meeting_id
+        self.lost: Optional[Dict[str, Any]] = None  # the lease that replaced ours
+        # Resolves once the owning block's claim settles (LeaseHeldElsewhere if it failed)
+        self.acquired: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.acquired.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self.sharers = 0  # other blocks currently running under this lease
+        self.idle = asyncio.Event()  # set whenever sharers drops to zero
+        self.idle.set()
+
+
+_current_lease: ContextVar[Optional[_LeaseState]] = ContextVar("current_lease", default=None)
+
+
+def check_lease() -> None:
+    """Raise LeaseLost if the meeting lease this code runs under was taken over by another replica."""
+    state = _current_lease.get()
+    if state is not None and state.lost is not None:
+        raise LeaseLost(state.meeting_id, state.lost.get("owner"), state.lost.get("expiresAt"))
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key onto one in-flight coroutine."""
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._calls
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Run fn() unless a call for `key` is already running. Returns (result, shared)."""
+        existing = self._calls.get(key)
+        if existing is not None:
+            logger.info(f"Meeting {key} is already processing — attaching to the in-flight run")
+            try:
+                return await asyncio.shield(existing), True
+            except asyncio.CancelledError:
+                # The leader was cancelled, not this caller: report it as an ordinary failure
+                if existing.cancelled() and not asyncio.current_task().cancelling():
+                    raise FlightCancelled(f"The in-flight run for meeting {key} was cancelled") from None
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark the outcome as retrieved so an unshared failure does not log "exception never retrieved"
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            self._calls.pop(key, None)
+
+    def snapshot(self) -> list:
+        return sorted(self._calls)
+
+
+async def _acquire_lease(meeting_id: str) -> Optional[Dict[str, Any]]:
+    lease = None
+    for attempt in range(LEASE_CLAIM_ATTEMPTS):
+        if attempt:
+            await asyncio.sleep(random.uniform(0.5, 2.0))
+        lease = await _claim_lease(meeting_id)
+        # No owner means the bridge could not settle the claim (a competing write, or a slow one); try again
+        if lease is None or lease.get("acquired") or lease.get("owner"):
+            return lease
+    return lease
+
+
+async def _claim_lease(meeting_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        client = get_notion_client()
+        resp = await client.post(
+            f"{NOTION_API_BASE}/api/meeting-register/by-external/{meeting_id}/lease",
+            json={"owner": REPLICA_ID, "ttlSeconds": MEETING_LEASE_SECONDS},
+            timeout=NOTION_TIMEOUT,
+        )
+        resp.raise_for_status()
+        return resp.json()
+    except Exception as e:
+        logger.warning(f"Lease acquire failed for meeting {meeting_id}; continuing with local guard only: {e}")
+        return None
+
+
+async def _release_lease(meeting_id: str) -> None:
+    try:
+        client = get_notion_client()
+        resp = await client.delete(
+            f"{NOTION_API_BASE}/api/meeting-register/by-external/{meeting_id}/lease",
+            params={"owner": REPLICA_ID},
+            timeout=NOTION_TIMEOUT,
+        )
+        resp.raise_for_status()
+    except Exception as e:
+        logger.warning(f"Lease release failed for meeting {meeting_id} (it will expire on its own): {e}")
+
+
+async def _renew_lease_loop(state: _LeaseState) -> None:
+    while True:
+        await asyncio.sleep(max(MEETING_LEASE_SECONDS // 3, 5))
+        lease = await _acquire_lease(state.meeting_id)
+        if lease is not None and not lease.get("acquired"):
+            logger.error(f"Lost processing lease for meeting {state.meeting_id} to replica {lease.get('owner')}")
+            state.lost = lease
+            return
+
+
+# meeting id → the lease held (or being claimed) by a meeting_lease() block in this process
+_lease_states: Dict[str, _LeaseState] = {}
+
+
+@asynccontextmanager
+async def meeting_lease(meeting_id: Optional[str]):
+    """Hold the cross-replica processing lease for a meeting while the block runs."""
+    if not ENABLE_MEETING_LEASES or not meeting_id:
+        yield
+        return
+
+    current = _current_lease.get()
+    state = current if current is not None and current.meeting_id == meeting_id else _lease_states.get(meeting_id)
+    if state is not None:
+        if state is not current:
+            # Another task's block is claiming or holding the lease: wait for its claim to settle
+            await asyncio.shield(state.acquired)
+        state.sharers += 1
+        state.idle.clear()
+        token = _current_lease.set(state)
+        try:
+            check_lease()
+            yield
+        finally:
+            _current_lease.reset(token)
+            state.sharers -= 1
+            if state.sharers == 0:
+                state.idle.set()
+        return
+
+    state = _lease_states[meeting_id] = _LeaseState(meeting_id)
+    try:
+        lease = await _acquire_lease(meeting_id)
+        if lease is not None and not lease.get("acquired"):
+            raise LeaseHeldElsewhere(meeting_id, lease.get("owner"), lease.get("expiresAt"))
+    except BaseException as e:
+        _lease_states.pop(meeting_id, None)
+        # Blocks waiting on this claim fail with it rather than inheriting a cancellation
+        state.acquired.set_exception(e if isinstance(e, Exception) else FlightCancelled(
+            f"The lease claim for meeting {meeting_id} was cancelled"))
+        raise
+    state.acquired.set_result(None)
+    holds_lease = lease is not None and lease.get("id") is not None
+
+    renew_task = asyncio.create_task(_renew_lease_loop(state)) if holds_lease else None
+    token = _current_lease.set(state)
+    try:
+        yield
+    finally:
+        _current_lease.reset(token)
+        try:
+            # Sharing blocks that outlive this one keep the lease (and its renewal) until they exit
+            while state.sharers:
+                await state.idle.wait()
+        finally:
+            if renew_task is not None:
+                renew_task.cancel()
+            _lease_states.pop(meeting_id, None)
+        if holds_lease and state.lost is None:
+            await _release_lease(meeting_id)
+        elif state.lost is not None:
+            logger.warning(f"Not releasing the lease for meeting {meeting_id}: it belongs to replica {state.lost.get('owner')}")
+
+
+meeting_flights = SingleFlight()
@@ -1,7 +1,7 @@
 from claude_agent_sdk import tool
 from typing import Any
-import httpx
 import os
+from http_client import get_notion_client, NOTION_TIMEOUT
 
 NOTION_API_BASE = os.getenv("NOTION_API_BASE", "http://localhost:3000")
 
@@ -13,9 +13,9 @@ NOTION_API_BASE = os.getenv("NOTION_API_BASE", "http://localhost:3000")
 )
 async def get_projects(args: dict[str, Any]) -> dict[str, Any]:
     """Fetch all projects from Notion database."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{NOTION_API_BASE}/api/projects", timeout=30.0)
-        projects = response.json()
+    client = get_notion_client()
+    response = await client.get(f"{NOTION_API_BASE}/api/projects", timeout=NOTION_TIMEOUT)
+    projects = response.json()
 
     if not projects:
         return {
@@ -51,21 +51,21 @@ async def get_projects(args: dict[str, Any]) -> dict[str, Any]:
 )
 async def create_meeting_note(args: dict[str, Any]) -> dict[str, Any]:
     """Create a meeting note in Notion."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{NOTION_API_BASE}/api/notes",
-            json={
-                "title": args.get("title"),
-                "date": args.get("date"),
-                "duration_seconds": args.get("duration_seconds"),
-                "overview": args.get("overview"),
-                "action_items": args.get("action_items", []),
-                "key_points": args.get("key_points", []),
-                "project_id": args.get("project_id")
-            },
-            timeout=30.0
-        )
-        result = response.json()
+    client = get_notion_client()
+    response = await client.post(
+        f"{NOTION_API_BASE}/api/notes",
+        json={
+            "title": args.get("title"),
+            "date": args.get("date"),
+            "duration_seconds": args.get("duration_seconds"),
+            "overview": args.get("overview"),
+            "action_items": args.get("action_items", []),
+            "key_points": args.get("key_points", []),
+            "project_id": args.get("project_id")
+        },
+        timeout=NOTION_TIMEOUT
+    )
+    result = response.json()
 
     return {
         "content": [{
@@ -89,20 +89,20 @@ async def create_meeting_note(args: dict[str, Any]) -> dict[str, Any]:
 )
 async def create_task(args: dict[str, Any]) -> dict[str, Any]:
     """Create a task in Notion."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{NOTION_API_BASE}/api/tasks",
-            json={
-                "name": args.get("name"),
-                "description": args.get("description"),
-                "priority": args.get("priority", "Medium"),
-                "dueDate": args.get("due_date"),
-                "status": args.get("status", "To Do"),
-                "projectId": args.get("project_id")
-            },
-            timeout=30.0
-        )
-        result = response.json()
+    client = get_notion_client()
+    response = await client.post(
+        f"{NOTION_API_BASE}/api/tasks",
+        json={
+            "name": args.get("name"),
+            "description": args.get("description"),
+            "priority": args.get("priority", "Medium"),
+            "dueDate": args.get("due_date"),
+            "status": args.get("status", "To Do"),
+            "projectId": args.get("project_id")
+        },
+        timeout=NOTION_TIMEOUT
+    )
+    result = response.json()
 
     return {
         "content": [{
@@ -126,21 +126,21 @@ async def create_task(args: dict[str, Any]) -> dict[str, Any]:
 )
 async def create_subtask(args: dict[str, Any]) -> dict[str, Any]:
     """Create a subtask linked to a parent task."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{NOTION_API_BASE}/api/tasks",
-            json={
-                "name": args.get("name"),
-                "description": args.get("description"),
-                "priority": args.get("priority", "Medium"),
-                "dueDate": args.get("due_date"),
-                "status": "To Do",
-                "parentTaskId": args.get("parent_task_id"),
-                "projectId": args.get("project_id")
-            },
-            timeout=30.0
-        )
-        result = response.json()
+    client = get_notion_client()
+    response = await client.post(
+        f"{NOTION_API_BASE}/api/tasks",
+        json={
+            "name": args.get("name"),
+            "description": args.get("description"),
+            "priority": args.get("priority", "Medium"),
+            "dueDate": args.get("due_date"),
+            "status": "To Do",
+            "parentTaskId": args.get("parent_task_id"),
+            "projectId": args.get("project_id")
+        },
+        timeout=NOTION_TIMEOUT
+    )
+    result = response.json()
 
     return {
         "content": [{
@@ -161,17 +161,17 @@ async def create_subtask(args: dict[str, Any]) -> dict[str, Any]:
 )
 async def create_project(args: dict[str, Any]) -> dict[str, Any]:
     """Create a new project in Notion."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{NOTION_API_BASE}/api/projects",
-            json={
-                "name": args.get("name"),
-                "description": args.get("description"),
-                "status": args.get("status", "Planned")
-            },
-            timeout=30.0
-        )
-        result = response.json()
+    client = get_notion_client()
+    response = await client.post(
+        f"{NOTION_API_BASE}/api/projects",
+        json={
+            "name": args.get("name"),
+            "description": args.get("description"),
+            "status": args.get("status", "Planned")
+        },
+        timeout=NOTION_TIMEOUT
+    )
+    result = response.json()
 
     return {
         "content": [{
@@ -0,0 +1,237 @@
+"""
+Transcript Append — Paged, concurrent, resumable transcript pages for meeting notes.
+
+The raw transcript used to go to the meeting note as one request carrying
+every sentence (POST /api/notes/{id}/transcript, 120s timeout). Long meetings
+timed out, the failure was logged as "non-critical", and the note was left
+without a transcript. Appends now go page by page:
+
+  - the transcript is split into pages of TRANSCRIPT_APPEND_PAGE_SENTENCES;
+    POST /api/notes/{id}/transcript/pages creates the "Full Transcript" child
+    page with one toggle heading per page ("Part 2 of 9 · 14:05")
+  - each page's sentences are written under its heading with
+    PUT /api/notes/{id}/transcript/parts/{part_id}, up to
+    TRANSCRIPT_APPEND_CONCURRENCY at once; a retried or resumed page asks the
+    bridge to clear the part first, so it never duplicates lines
+  - progress (child page, part ids, acknowledged pages) is kept in the shared
+    job store, keyed by note id; a later run (the same task's retry round, or
+    main's resume sweep after a restart) sends only the pages not yet
+    acknowledged (main keeps a local transcript copy for this in
+    transcript_cache; without one the append is marked abandoned)
+  - transient failures are retried for up to TRANSCRIPT_APPEND_ROUNDS rounds
+    within a run; a note gives up after TRANSCRIPT_APPEND_MAX_RUNS runs
+
+main schedules appends as background tasks, so the next queued meeting does
+not wait for them.
+"""
+
+import os
+import json
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from job_store import get_connection
+from http_client import get_notion_client, NOTION_TIMEOUT, TRANSCRIPT_TIMEOUT
+from rate_limiter import notion_bucket
+from compact_transcript import CompactTranscript
+from errors import ProviderError, as_provider_error
+
+logger = logging.getLogger(__name__)
+
+NOTION_API_BASE = os.getenv("NOTION_API_BASE", "http://127.0.0.1:8080")
+TRANSCRIPT_APPEND_PAGE_SENTENCES = max(1, int(os.getenv("TRANSCRIPT_APPEND_PAGE_SENTENCES", "1000")))
+TRANSCRIPT_APPEND_CONCURRENCY = max(1, int(os.getenv("TRANSCRIPT_APPEND_CONCURRENCY", "3")))
+TRANSCRIPT_APPEND_ROUNDS = max(1, int(os.getenv("TRANSCRIPT_APPEND_ROUNDS", "3")))
+TRANSCRIPT_APPEND_RETRY_SECONDS = float(os.getenv("TRANSCRIPT_APPEND_RETRY_SECONDS", "10"))
+TRANSCRIPT_APPEND_MAX_RUNS = max(1, int(os.getenv("TRANSCRIPT_APPEND_MAX_RUNS", "5")))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcript_appends (
+    note_id       TEXT PRIMARY KEY,
+    meeting_id    TEXT,
+    status        TEXT NOT NULL,
+    page_size     INTEGER NOT NULL,
+    total_pages   INTEGER NOT NULL,
+    child_page_id TEXT,
+    part_ids      TEXT,
+    acked         TEXT NOT NULL DEFAULT '[]',
+    runs          INTEGER NOT NULL DEFAULT 0,
+    last_error    TEXT,
+    updated_at    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transcript_appends_status ON transcript_appends(status);
+"""
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _clock(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return ""
+    minutes, secs = divmod(int(seconds), 60)
+    return f"{minutes:02d}:{secs:02d}"
+
+
+class TranscriptAppender:
+    """Writes a meeting's transcript into its note page by page, remembering acknowledged pages."""
+
+    def __init__(self, conn=None):
+        self.conn = conn or get_connection()
+        self.conn.executescript(_SCHEMA)
+
+    # ── progress ──
+    def get(self, note_id: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT * FROM transcript_appends WHERE note_id = ?", (note_id,)).fetchone()
+        if row is None:
+            return None
+        record = dict(row)
+        record["part_ids"] = json.loads(record["part_ids"]) if record["part_ids"] else None
+        record["acked"] = set(json.loads(record["acked"]))
+        return record
+
+    def _start_record(self, note_id: str, meeting_id: Optional[str], total_pages: int) -> Dict[str, Any]:
+        self.conn.execute(
+            """
+            INSERT INTO transcript_appends (note_id, meeting_id, status, page_size, total_pages, updated_at)
+            VALUES (?, ?, 'pending', ?, ?, ?)
+            ON CONFLICT(note_id) DO UPDATE SET
+                meeting_id = excluded.meeting_id, status = 'pending', page_size = excluded.page_size,
+                total_pages = excluded.total_pages, child_page_id = NULL, part_ids = NULL, acked = '[]',
+                last_error = NULL, updated_at = excluded.updated_at
+            """,
+            (note_id, meeting_id, TRANSCRIPT_APPEND_PAGE_SENTENCES, total_pages, _now_iso()),
+        )
+        return self.get(note_id)
+
+    def _update(self, note_id: str, **fields: Any) -> None:
+        fields["updated_at"] = _now_iso()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        self.conn.execute(f"UPDATE transcript_appends SET {assignments} WHERE note_id = ?",
+                          (*fields.values(), note_id))
+
+    def unfinished(self) -> List[Dict[str, Any]]:
+        """Appends a resume sweep should pick up again."""
+        rows = self.conn.execute(
+            "SELECT note_id FROM transcript_appends WHERE status IN ('pending', 'failed') AND runs < ? "
+            "ORDER BY updated_at",
+            (TRANSCRIPT_APPEND_MAX_RUNS,),
+        ).fetchall()
+        return [self.get(row["note_id"]) for row in rows]
+
+    def abandon(self, note_id: str, reason: str) -> None:
+        self._update(note_id, status="abandoned", last_error=reason)
+
+    def snapshot(self) -> Dict[str, Any]:
+        rows = self.conn.execute("SELECT status, COUNT(*) AS n FROM transcript_appends GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    # ── bridge calls ──
+    async def _create_pages(self, note_id: str, compact: CompactTranscript, page_size: int,
+                            total_pages: int, transcript_url: Optional[str]) -> Dict[str, Any]:
+        labels = []
+        for page in range(total_pages):
+            start = compact.start_time(page * page_size)
+            labels.append(f"Part {page + 1} of {total_pages}" + (f" · {_clock(start)}" if start is not None else ""))
+        try:
+            client = get_notion_client()
+            # The request hook takes one token (the page create); the bridge appends the headings
+            # 100 per Notion call. acquire() is capped at the bucket's capacity, so debit the excess
+            cost = -(-(total_pages + 3) // 100)
+            notion_bucket.debit(cost - await notion_bucket.acquire(cost))
+            resp = await client.post(
+                f"{NOTION_API_BASE}/api/notes/{note_id}/transcript/pages",
+                json={"parts": labels, "transcript_url": transcript_url},
+                timeout=NOTION_TIMEOUT,
+            )
+            resp.raise_for_status()
+            data = resp.json()
+        except Exception as e:
+            raise as_provider_error(e, "notion", f"Transcript page creation failed for note {note_id}") from e
+        if len(data.get("part_ids") or []) != total_pages:
+            raise ProviderError(f"Transcript page creation for note {note_id} returned {data}", "notion")
+        return data
+
+    async def _write_part(self, note_id: str, part_id: str, body: bytes, replace: bool) -> None:
+        try:
+            client = get_notion_client()
+            # The bridge lists the part's children first when replacing
+            await notion_bucket.acquire(2 if replace else 1)
+            resp = await client.put(
+                f"{NOTION_API_BASE}/api/notes/{note_id}/transcript/parts/{part_id}",
+                content=body,
+                headers={"Content-Type": "application/json"},
+                # Clearing a partly written part costs one Notion call per leftover block
+                timeout=TRANSCRIPT_TIMEOUT if replace else NOTION_TIMEOUT,
+            )
+            resp.raise_for_status()
+        except Exception as e:
+            raise as_provider_error(e, "notion", f"Transcript part write failed for note {note_id}") from e
+
+    # ── run ──
+    async def append(self, note_id: str, compact: CompactTranscript, transcript_url: Optional[str] = None,
+                     meeting_id: Optional[str] = None) -> Dict[str, Any]:
+        """Send every page not yet acknowledged; returns the final progress record."""
+        total_pages = -(-len(compact) // TRANSCRIPT_APPEND_PAGE_SENTENCES)
+        record = self.get(note_id)
+        if record and record["status"] == "completed":
+            return record
+        if (record is None or record["total_pages"] != total_pages
+                or record["page_size"] != TRANSCRIPT_APPEND_PAGE_SENTENCES):
+            record = self._start_record(note_id, meeting_id, total_pages)
+        # Only pages of parts created by this run are known to be empty on their first write
+        attempted = None if record["part_ids"] else set()
+        self._update(note_id, runs=record["runs"] + 1, status="pending")
+        page_size = record["page_size"]
+
+        try:
+            if not record["part_ids"]:
+                created = await self._create_pages(note_id, compact, page_size, total_pages, transcript_url)
+                record["child_page_id"], record["part_ids"] = created["child_page_id"], created["part_ids"]
+                self._update(note_id, child_page_id=record["child_page_id"], part_ids=json.dumps(record["part_ids"]))
+
+            acked = record["acked"]
+            sem = asyncio.Semaphore(TRANSCRIPT_APPEND_CONCURRENCY)
+
+            async def _page(page: int) -> None:
+                async with sem:
+                    start = page * page_size
+                    replace = attempted is None or page in attempted
+                    body = (b'{"replace":' + (b"true" if replace else b"false") + b',"sentences":['
+                            + compact.append_json(start, start + page_size) + b"]}")
+                    if attempted is not None:
+                        attempted.add(page)
+                    await self._write_part(note_id, record["part_ids"][page], body, replace)
+                    acked.add(page)
+                    self._update(note_id, acked=json.dumps(sorted(acked)))
+
+            for round_index in range(TRANSCRIPT_APPEND_ROUNDS):
+                todo = [page for page in range(total_pages) if page not in acked]
+                if not todo:
+                    break
+                if round_index:
+                    logger.info(f"Transcript append for note {note_id}: retrying {len(todo)} page(s)")
+                results = await asyncio.gather(*(_page(page) for page in todo), return_exceptions=True)
+                errors = [r for r in results if isinstance(r, BaseException)]
+                if not errors:
+                    break
+                error = as_provider_error(errors[0], "notion")
+                if not error.transient or round_index == TRANSCRIPT_APPEND_ROUNDS - 1:
+                    raise error
+                delay = TRANSCRIPT_APPEND_RETRY_SECONDS * (2 ** round_index)
+                if error.retry_after:
+                    delay = max(delay, (error.retry_after - datetime.now(timezone.utc)).total_seconds())
+                await asyncio.sleep(delay)
+        except Exception as e:
+            self._update(note_id, status="failed", last_error=str(e)[:500])
+            raise
+
+        self._update(note_id, status="completed", last_error=None)
+        logger.info(f"Transcript appended to note {note_id}: {total_pages} page(s) → child page {record['child_page_id']}")
+        return self.get(note_id)
+
+
+transcript_appender = TranscriptAppender()
@@ -0,0 +1,244 @@
+"""
+Transcript Cache — Local, compressed, content-addressed transcript store.
+
+Every retry of a meeting used to pull its full transcript over the network
+again: the Meeting Register snapshot through the bridge, or Fireflies when no
+snapshot existed. The retry worker now looks here first:
+
+  - blobs are canonical JSON, gzip-compressed, named by their SHA-256
+    (<TRANSCRIPT_CACHE_DIR>/<hash[:2]>/<hash>.json.gz); identical content is
+    stored once and a blob is never rewritten
+  - an index table in the shared job store maps external meeting id →
+    content hash, blob size, last use, and whether the Meeting Register
+    snapshot is known to hold the same content
+  - total blob size is bounded by TRANSCRIPT_CACHE_MAX_BYTES; the least
+    recently used meetings are evicted first, and a blob goes when no
+    meeting references it any more
+  - compression and file I/O run in a worker thread; index reads and writes
+    stay on the event loop with the other local stores
+
+The Meeting Register snapshot remains the durable copy shared by replicas.
+main._process_claimed_retry_row writes it through in the background for
+transcripts the snapshot does not have yet (remote_stored = 0).
+"""
+
+import os
+import gzip
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from job_store import AGENT_DATA_DIR, get_connection
+from transcript_snapshot import without_attachments
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_CACHE_DIR = os.getenv("TRANSCRIPT_CACHE_DIR", os.path.join(AGENT_DATA_DIR, "transcript-cache"))
+TRANSCRIPT_CACHE_MAX_BYTES = int(os.getenv("TRANSCRIPT_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+TRANSCRIPT_CACHE_COMPRESS_LEVEL = int(os.getenv("TRANSCRIPT_CACHE_COMPRESS_LEVEL", "6"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcript_cache (
+    external_id   TEXT PRIMARY KEY,
+    content_hash  TEXT NOT NULL,
+    size_bytes    INTEGER NOT NULL,
+    remote_stored INTEGER NOT NULL DEFAULT 0,
+    last_used     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transcript_cache_hash ON transcript_cache(content_hash);
+CREATE INDEX IF NOT EXISTS idx_transcript_cache_lru ON transcript_cache(last_used);
+"""
+
+
+def _json_default(value: Any) -> Any:
+    # Spooled sentences (transcript_spool.SpooledSentences) are read back into a list
+    if hasattr(value, "__iter__") and hasattr(value, "__len__"):
+        return list(value)
+    return str(value)
+
+
+def _canonical(transcript: Dict[str, Any]) -> bytes:
+    return json.dumps(transcript, sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+                      default=_json_default).encode("utf-8")
+
+
+class TranscriptCache:
+    """Size-bounded LRU of gzip transcript blobs, keyed by meeting id and content hash."""
+
+    def __init__(self, directory: str = TRANSCRIPT_CACHE_DIR, max_bytes: int = TRANSCRIPT_CACHE_MAX_BYTES,
+                 conn=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.conn = conn or get_connection()
+        self.conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.directory, digest[:2], f"{digest}.json.gz")
+
+    # ── blob I/O (worker thread) ──
+    def _write_blob(self, transcript: Dict[str, Any]) -> Tuple[str, int]:
+        raw = _canonical(transcript)
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._path(digest)
+        if os.path.exists(path):
+            return digest, os.path.getsize(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(gzip.compress(raw, compresslevel=TRANSCRIPT_CACHE_COMPRESS_LEVEL))
+        os.replace(tmp_path, path)
+        return digest, os.path.getsize(path)
+
+    def _read_blob(self, digest: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(digest), "rb") as f:
+                raw = gzip.decompress(f.read())
+        except (OSError, EOFError):
+            return None
+        if hashlib.sha256(raw).hexdigest() != digest:
+            return None
+        return json.loads(raw)
+
+    # ── index ──
+    def _entry(self, external_id: str):
+        return self.conn.execute(
+            "SELECT content_hash, size_bytes, remote_stored FROM transcript_cache WHERE external_id = ?",
+            (external_id,),
+        ).fetchone()
+
+    def _drop(self, external_id: str) -> None:
+        entry = self._entry(external_id)
+        if entry is None:
+            return
+        self.conn.execute("DELETE FROM transcript_cache WHERE external_id = ?", (external_id,))
+        self._unlink_if_unreferenced(entry["content_hash"])
+
+    def _unlink_if_unreferenced(self, digest: str) -> None:
+        still_used = self.conn.execute(
+            "SELECT 1 FROM transcript_cache WHERE content_hash = ? LIMIT 1", (digest,)
+        ).fetchone()
+        if still_used is None:
+            try:
+                os.remove(self._path(digest))
+            except FileNotFoundError:
+                pass
+
+    def total_bytes(self) -> int:
+        # Meetings sharing a blob count it once
+        row = self.conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) AS total FROM "
+            "(SELECT content_hash, MAX(size_bytes) AS size_bytes FROM transcript_cache GROUP BY content_hash)"
+        ).fetchone()
+        return int(row["total"])
+
+    def _evict(self, keep: str) -> None:
+        total = self.total_bytes()
+        while total > self.max_bytes:
+            victim = self.conn.execute(
+                "SELECT external_id FROM transcript_cache WHERE external_id != ? ORDER BY last_used LIMIT 1",
+                (keep,),
+            ).fetchone()
+            if victim is None:
+                break
+            self._drop(victim["external_id"])
+            self.evictions += 1
+            total = self.total_bytes()
+
+    # ── public ──
+    async def get(self, external_id: str) -> Optional[Dict[str, Any]]:
+        """The cached transcript for a meeting, or None. A corrupt or missing blob is a miss."""
+        entry = self._entry(external_id)
+        transcript = None
+        if entry is not None:
+            transcript = await asyncio.to_thread(self._read_blob, entry["content_hash"])
+            if transcript is None:
+                logger.warning(f"Transcript cache blob for {external_id} is missing or corrupt; dropping it")
+                self._drop(external_id)
+        if transcript is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.conn.execute("UPDATE transcript_cache SET last_used = ? WHERE external_id = ?",
+                          (time.time(), external_id))
+        return transcript
+
+    async def put(self, external_id: str, transcript: Dict[str, Any], remote_stored: bool = False) -> str:
+        """
+        Cache a transcript and return its content hash. remote_stored records that the
+        Meeting Register snapshot holds this content; it survives re-puts of the same content.
+        """
+        # Copied on the loop: it may attach _compact_transcript while the thread serializes
+        digest, size = await asyncio.to_thread(self._write_blob, without_attachments(transcript))
+        previous = self._entry(external_id)
+        changed = previous is None or previous["content_hash"] != digest
+        self.conn.execute(
+            """
+            INSERT INTO transcript_cache (external_id, content_hash, size_bytes, remote_stored, last_used)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(external_id) DO UPDATE SET
+                content_hash = excluded.content_hash,
+                size_bytes = excluded.size_bytes,
+                remote_stored = CASE WHEN transcript_cache.content_hash = excluded.content_hash
+                                     THEN MAX(transcript_cache.remote_stored, excluded.remote_stored)
+                                     ELSE excluded.remote_stored END,
+                last_used = excluded.last_used
+            """,
+            (external_id, digest, size, 1 if remote_stored else 0, time.time()),
+        )
+        if previous is not None and changed:
+            self._unlink_if_unreferenced(previous["content_hash"])
+        self._evict(keep=external_id)
+        return digest
+
+    def cached_ids(self, external_ids: Iterable[Optional[str]]) -> Set[str]:
+        """Which of these meetings have a local copy (no read-ahead needed)."""
+        ids = [i for i in external_ids if i]
+        found: Set[str] = set()
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT external_id FROM transcript_cache WHERE external_id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            found.update(row["external_id"] for row in rows)
+        return found
+
+    def unstored_digest(self, external_id: str) -> Optional[str]:
+        """Content hash of the cached copy if the Meeting Register snapshot may not hold it yet."""
+        entry = self._entry(external_id)
+        return entry["content_hash"] if entry and not entry["remote_stored"] else None
+
+    def mark_remote_stored(self, external_id: str, digest: str) -> None:
+        """The Meeting Register snapshot now holds this content (no-op if the cache moved on)."""
+        self.conn.execute(
+            "UPDATE transcript_cache SET remote_stored = 1 WHERE external_id = ? AND content_hash = ?",
+            (external_id, digest),
+        )
+
+    def discard(self, external_id: str) -> None:
+        self._drop(external_id)
+
+    def snapshot(self) -> Dict[str, Any]:
+        row = self.conn.execute(
+            "SELECT COUNT(*) AS meetings, COUNT(DISTINCT content_hash) AS blobs, "
+            "COALESCE(SUM(1 - remote_stored), 0) AS pending_write_through FROM transcript_cache"
+        ).fetchone()
+        return {
+            "meetings": row["meetings"],
+            "blobs": row["blobs"],
+            "bytes": self.total_bytes(),
+            "max_bytes": self.max_bytes,
+            "pending_write_through": row["pending_write_through"],
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+transcript_cache = TranscriptCache()
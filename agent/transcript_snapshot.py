@@ -0,0 +1,154 @@
+"""
+Transcript Snapshot — Compact, versioned format for the Meeting Register transcript cache.
+
+_store_cached_transcript used to post the raw transcript (every sentence a
+verbose {"speaker_name", "text", "start_time"} dict), which the bridge then
+wrote into Notion as ~1800-character code blocks; long meetings ran into the
+120s upload timeout. Snapshots are now posted as a small JSON envelope:
+
+  {"snapshot_format": "compact", "version": 1, "codec": "zstd" | "gzip",
+   "id", "title", "sentence_count", "raw_bytes", "data": <base64>}
+
+`data` is the compressed JSON of one columnar payload:
+
+  meta        every top-level transcript field except sentences, verbatim
+              (underscore keys are in-process attachments and are skipped)
+  speakers    distinct speaker names, in order of first appearance
+  speaker     one index into speakers per sentence (-1 = no speaker)
+  text        sentence texts
+  start_time  sentence start times (null = unknown)
+
+zstd is used when the optional `zstandard` package is installed, gzip
+otherwise; decoding handles both. The bridge stores and returns the envelope
+as-is (raw transcripts posted by webhook-server are compacted there with
+gzip), and legacy snapshots (a plain transcript with sentences[]) still
+decode, so rows cached before the switch keep working. Set
+TRANSCRIPT_SNAPSHOT_FORMAT=json to post raw transcripts to an older bridge.
+"""
+
+import os
+import gzip
+import json
+import base64
+from typing import Any, Dict, List, Optional
+
+try:
+    import zstandard as _zstd
+except ImportError:  # optional; gzip is always available
+    _zstd = None
+
+TRANSCRIPT_SNAPSHOT_FORMAT = os.getenv("TRANSCRIPT_SNAPSHOT_FORMAT", "compact").lower()
+TRANSCRIPT_SNAPSHOT_CODEC = os.getenv("TRANSCRIPT_SNAPSHOT_CODEC", "zstd" if _zstd else "gzip").lower()
+TRANSCRIPT_SNAPSHOT_LEVEL = int(os.getenv("TRANSCRIPT_SNAPSHOT_LEVEL", "6"))
+
+SNAPSHOT_FORMAT = "compact"
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotFormatError(ValueError):
+    """A snapshot this agent cannot decode (unknown version or codec, or corrupt data)."""
+
+
+def without_attachments(transcript: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Shallow copy without underscore keys (in-process attachments such as the rendered
+    CompactTranscript). Take it on the event loop before handing a transcript to a thread.
+    """
+    return {k: v for k, v in transcript.items() if not k.startswith("_")}
+
+
+def is_compact(payload: Any) -> bool:
+    return isinstance(payload, dict) and payload.get("snapshot_format") == SNAPSHOT_FORMAT
+
+
+def _compress(raw: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if _zstd is None:
+            raise SnapshotFormatError("zstd codec requested but the zstandard package is not installed")
+        return _zstd.ZstdCompressor(level=TRANSCRIPT_SNAPSHOT_LEVEL).compress(raw)
+    if codec == "gzip":
+        return gzip.compress(raw, compresslevel=min(TRANSCRIPT_SNAPSHOT_LEVEL, 9))
+    raise SnapshotFormatError(f"Unknown snapshot codec: {codec}")
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if _zstd is None:
+            raise SnapshotFormatError("Snapshot is zstd-compressed but the zstandard package is not installed")
+        return _zstd.ZstdDecompressor().decompress(data)
+    if codec == "gzip":
+        return gzip.decompress(data)
+    raise SnapshotFormatError(f"Unknown snapshot codec: {codec}")
+
+
+def encode_snapshot(transcript: Dict[str, Any], codec: Optional[str] = None) -> Dict[str, Any]:
+    """Compact envelope for a transcript dict (sentences may be any iterable of sentence dicts)."""
+    codec = codec or TRANSCRIPT_SNAPSHOT_CODEC
+    speakers: List[str] = []
+    speaker_index: Dict[str, int] = {}
+    speaker: List[int] = []
+    text: List[str] = []
+    start_time: List[Any] = []
+    for sentence in transcript.get("sentences") or []:
+        name = sentence.get("speaker_name") or None
+        if name is None:
+            speaker.append(-1)
+        else:
+            if name not in speaker_index:
+                speaker_index[name] = len(speakers)
+                speakers.append(name)
+            speaker.append(speaker_index[name])
+        text.append(sentence.get("text") or "")
+        start = sentence.get("start_time")
+        start_time.append(sentence.get("raw_start_time") if start is None else start)
+
+    payload = {
+        "meta": {k: v for k, v in transcript.items() if k != "sentences" and not k.startswith("_")},
+        "speakers": speakers,
+        "speaker": speaker,
+        "text": text,
+        "start_time": start_time,
+    }
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+    return {
+        "snapshot_format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "codec": codec,
+        "id": transcript.get("id"),
+        "title": transcript.get("title"),
+        "sentence_count": len(text),
+        "raw_bytes": len(raw),
+        "data": base64.b64encode(_compress(raw, codec)).decode("ascii"),
+    }
+
+
+def decode_snapshot(envelope: Dict[str, Any]) -> Dict[str, Any]:
+    """Transcript dict from a compact envelope; legacy plain snapshots pass through."""
+    if not is_compact(envelope):
+        return envelope
+    if envelope.get("version") != SNAPSHOT_VERSION:
+        raise SnapshotFormatError(f"Unsupported transcript snapshot version: {envelope.get('version')}")
+    try:
+        raw = _decompress(base64.b64decode(envelope["data"]), envelope.get("codec", "gzip"))
+        payload = json.loads(raw)
+        speakers = payload["speakers"]
+        sentences = [
+            {"speaker_name": speakers[sid] if sid >= 0 else None, "text": text, "start_time": start}
+            for sid, text, start in zip(payload["speaker"], payload["text"], payload["start_time"])
+        ]
+    except SnapshotFormatError:
+        raise
+    except Exception as e:
+        raise SnapshotFormatError(f"Corrupt transcript snapshot: {e}") from e
+    if len(sentences) != envelope.get("sentence_count", len(sentences)):
+        raise SnapshotFormatError("Corrupt transcript snapshot: sentence count mismatch")
+    transcript = dict(payload["meta"])
+    transcript["sentences"] = sentences
+    return transcript
+
+
+def snapshot_body(transcript: Dict[str, Any]) -> Dict[str, Any]:
+    """What _store_cached_transcript posts: the compact envelope unless disabled."""
+    if TRANSCRIPT_SNAPSHOT_FORMAT == "json":
+        return without_attachments(transcript)
+    return encode_snapshot(transcript)
@@ -0,0 +1,199 @@
+"""
+Transcript Spool — On-disk, memory-mappable sentence storage for ingest.
+
+Long board meetings used to be held in memory three or four times over (the
+request body, one Pydantic Sentence per line, model_dump(), the prompt text,
+the transcript-append payload). Ingest now writes sentences to a spool file
+as they are parsed and hands later stages a lazy SpooledSentences sequence:
+
+  - one compact JSON object per line, byte offsets kept in an array('Q')
+  - reads go through mmap, so the OS pages sentences in and out on demand
+  - iteration decodes one sentence at a time; nothing keeps the full list
+
+spool_ndjson_stream() consumes an NDJSON request body incrementally (first
+line = transcript metadata, every following line = one sentence), so peak
+memory per meeting is bounded by the longest line, not the transcript length.
+That bound is for the NDJSON endpoint only: a JSON /process-transcript body is
+still parsed and validated whole before spool_sentences() writes it out.
+"""
+
+import os
+import json
+import mmap
+import uuid
+import logging
+from array import array
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional, Tuple
+
+from job_store import AGENT_DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+SPOOL_DIR = os.getenv("TRANSCRIPT_SPOOL_DIR", os.path.join(AGENT_DATA_DIR, "spool"))
+# Guard against a malformed stream that never sends a newline
+MAX_NDJSON_LINE_BYTES = int(os.getenv("MAX_NDJSON_LINE_BYTES", str(1024 * 1024)))
+
+
+def _normalize_sentence(raw: Any) -> Dict[str, Any]:
+    if not isinstance(raw, dict) or not isinstance(raw.get("text"), str):
+        raise ValueError("each sentence must be an object with a string 'text'")
+    return {
+        "speaker_name": raw.get("speaker_name"),
+        "text": raw["text"],
+        "start_time": raw.get("start_time", raw.get("raw_start_time")),
+    }
+
+
+class SpooledSentences:
+    """Read-only, lazily decoded sequence of sentences backed by a spool file."""
+
+    def __init__(self, path: str, offsets: array):
+        self.path = path
+        self._offsets = offsets  # n + 1 byte offsets; sentence i is [offsets[i], offsets[i+1])
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+
+    def _buffer(self):
+        if len(self) == 0:
+            return b""
+        if self._mmap is None:
+            self._file = open(self.path, "rb")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("sentence index out of range")
+        buf = self._buffer()
+        return json.loads(buf[self._offsets[index]:self._offsets[index + 1]])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        buf = self._buffer()
+        for i in range(len(self)):
+            yield json.loads(buf[self._offsets[i]:self._offsets[i + 1]])
+
+    def close(self, delete: bool = True) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if delete:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+class SpoolWriter:
+    """Append-only writer that produces a SpooledSentences when finished."""
+
+    def __init__(self, meeting_id: str):
+        os.makedirs(SPOOL_DIR, exist_ok=True)
+        safe_id = "".join(c for c in str(meeting_id) if c.isalnum() or c in "-_")[:64] or "meeting"
+        self.path = os.path.join(SPOOL_DIR, f"{safe_id}-{uuid.uuid4().hex[:8]}.ndjson")
+        self._file = open(self.path, "wb")
+        self._offsets = array("Q", [0])
+
+    def append(self, sentence: Any) -> None:
+        line = json.dumps(_normalize_sentence(sentence), ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+        self._file.write(line)
+        self._offsets.append(self._offsets[-1] + len(line))
+
+    def finish(self) -> SpooledSentences:
+        self._file.close()
+        return SpooledSentences(self.path, self._offsets)
+
+    def abort(self) -> None:
+        self._file.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def spool_sentences(meeting_id: str, sentences: Iterable[Any]) -> SpooledSentences:
+    """Spool an already-parsed sentence iterable (JSON ingest path)."""
+    writer = SpoolWriter(meeting_id)
+    try:
+        for sentence in sentences:
+            writer.append(sentence)
+    except Exception:
+        writer.abort()
+        raise
+    return writer.finish()
+
+
+async def spool_ndjson_stream(chunks: AsyncIterator[bytes]) -> Tuple[Dict[str, Any], SpooledSentences]:
+    """Consume an NDJSON body: line 1 is the transcript metadata, each later line one sentence.
+
+    Returns (metadata_dict, spooled_sentences). Raises ValueError on malformed input.
+    """
+    header: Optional[Dict[str, Any]] = None
+    writer: Optional[SpoolWriter] = None
+    pending = b""
+
+    def _handle(line: bytes) -> None:
+        nonlocal header, writer
+        line = line.strip()
+        if not line:
+            return
+        obj = json.loads(line)
+        if header is None:
+            if not isinstance(obj, dict) or "id" not in obj:
+                raise ValueError("first NDJSON line must be the transcript metadata object with an 'id'")
+            header = {k: v for k, v in obj.items() if k != "sentences"}
+            writer = SpoolWriter(header["id"])
+            for sentence in obj.get("sentences") or []:
+                writer.append(sentence)
+            return
+        writer.append(obj)
+
+    try:
+        async for chunk in chunks:
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                _handle(line)
+            if len(pending) > MAX_NDJSON_LINE_BYTES:
+                raise ValueError(f"NDJSON line exceeds {MAX_NDJSON_LINE_BYTES} bytes")
+        _handle(pending)
+    except Exception:
+        if writer is not None:
+            writer.abort()
+        raise
+
+    if header is None:
+        raise ValueError("empty NDJSON body")
+    return header, writer.finish()
+
+
+def release_sentences(transcript_data: Dict[str, Any]) -> None:
+    """Close and delete the spool behind a transcript dict, if it has one."""
+    sentences = transcript_data.get("sentences")
+    if isinstance(sentences, SpooledSentences):
+        sentences.close(delete=True)
+
+
+def clear_orphaned_spools() -> int:
+    """Remove spool files left behind by a previous process (the ingest queue is in memory)."""
+    if not os.path.isdir(SPOOL_DIR):
+        return 0
+    removed = 0
+    for name in os.listdir(SPOOL_DIR):
+        if name.endswith(".ndjson"):
+            try:
+                os.remove(os.path.join(SPOOL_DIR, name))
+                removed += 1
+            except OSError:
+                pass
+    return removed
@@ -1,4 +1,5 @@
 import express from 'express';
+import zlib from 'zlib';
 import {
   createProject, updateProject,
   createPerson, updatePerson,
@@ -9,11 +10,25 @@ import {
   getSpeakerAliases, createSpeakerAlias, updateSpeakerAlias,
   getMeetingRegister, createMeetingRegister, updateMeetingRegister,
   findMeetingRegisterByExternalId, upsertMeetingRegisterByExternalId,
+  acquireMeetingRegisterLease, releaseMeetingRegisterLease,
   getAgentConfig, updateAgentConfig, getFullContext,
 } from './notion.js';
 
 const router = express.Router();
 
+// Answer with Notion's own status (and Retry-After) when the failure came from
+// the Notion API, so the agent can tell a rate limit from a rejected payload.
+// Anything else is a 500.
+function errorStatus(error) {
+  return Number.isInteger(error?.status) && error.status >= 400 ? error.status : 500;
+}
+
+function sendError(res, error) {
+  const retryAfter = error?.headers?.get?.('retry-after') ?? error?.headers?.['retry-after'];
+  if (retryAfter) res.set('Retry-After', String(retryAfter));
+  res.status(errorStatus(error)).json({ error: error.message, code: error.code });
+}
+
 // Get all projects
 router.get('/projects', async (req, res) => {
   try {
@@ -30,7 +45,7 @@ router.get('/projects', async (req, res) => {
     res.json(formatted);
   } catch (error) {
     console.error('Error fetching projects:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -41,7 +56,7 @@ router.post('/projects', async (req, res) => {
     res.json({ id: result.id, success: true });
   } catch (error) {
     console.error('Error creating project:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -52,7 +67,7 @@ router.patch('/projects/:id', async (req, res) => {
     res.json({ success: true });
   } catch (error) {
     console.error('Error updating project:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -69,7 +84,7 @@ router.get('/tasks', async (req, res) => {
     res.json(formatted);
   } catch (error) {
     console.error('Error fetching tasks:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -80,7 +95,7 @@ router.post('/tasks', async (req, res) => {
     res.json({ id: result.id, success: true, reused: !!result.reused });
   } catch (error) {
     console.error('Error creating task:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -91,7 +106,7 @@ router.get('/people', async (req, res) => {
     res.json(await getPeople(activeOnly));
   } catch (error) {
     console.error('Error fetching people:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -102,7 +117,7 @@ router.post('/people', async (req, res) => {
     res.json({ id: result.id, success: true });
   } catch (error) {
     console.error('Error creating person:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -113,7 +128,7 @@ router.patch('/people/:id', async (req, res) => {
     res.json({ success: true });
   } catch (error) {
     console.error('Error updating person:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -124,7 +139,7 @@ router.get('/departments', async (req, res) => {
     res.json(await getDepartments(activeOnly));
   } catch (error) {
     console.error('Error fetching departments:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -134,14 +149,14 @@ router.patch('/departments/:id', async (req, res) => {
     res.json({ success: true });
   } catch (error) {
     console.error('Error updating department:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
 // ─── Quarterly Rocks ────────────────────────────────────────────────
 router.get('/rocks', async (req, res) => {
   try { res.json(await getQuarterlyRocks()); }
-  catch (error) { res.status(500).json({ error: error.message }); }
+  catch (error) { sendError(res, error); }
 });
 
 router.post('/rocks', async (req, res) => {
@@ -150,20 +165,20 @@ router.post('/rocks', async (req, res) => {
     res.json({ id: result.id, success: true });
   } catch (error) {
     console.error('Error creating rock:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
 // ─── Planning Cycles ────────────────────────────────────────────────
 router.get('/planning-cycles', async (req, res) => {
   try { res.json(await getPlanningCycles()); }
-  catch (error) { res.status(500).json({ error: error.message }); }
+  catch (error) { sendError(res, error); }
 });
 
 // ─── Scorecard Metrics ──────────────────────────────────────────────
 router.get('/scorecard-metrics', async (req, res) => {
   try { res.json(await getScorecardMetrics()); }
-  catch (error) { res.status(500).json({ error: error.message }); }
+  catch (error) { sendError(res, error); }
 });
 
 router.post('/scorecard-metrics', async (req, res) => {
@@ -172,7 +187,7 @@ router.post('/scorecard-metrics', async (req, res) => {
     res.json({ id: result.id, success: true });
   } catch (error) {
     console.error('Error creating metric:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -181,7 +196,7 @@ router.get('/eos-issues', async (req, res) => {
   try {
     const unresolvedOnly = req.query.all !== 'true';
     res.json(await getEosIssues(unresolvedOnly));
-  } catch (error) { res.status(500).json({ error: error.message }); }
+  } catch (error) { sendError(res, error); }
 });
 
 router.post('/eos-issues', async (req, res) => {
@@ -190,14 +205,14 @@ router.post('/eos-issues', async (req, res) => {
     res.json({ id: result.id, success: true });
   } catch (error) {
     console.error('Error creating EOS issue:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
 // ─── Speaker Aliases ────────────────────────────────────────────────
 router.get('/speaker-aliases', async (req, res) => {
   try { res.json(await getSpeakerAliases()); }
-  catch (error) { res.status(500).json({ error: error.message }); }
+  catch (error) { sendError(res, error); }
 });
 
 router.post('/speaker-aliases', async (req, res) => {
@@ -206,7 +221,7 @@ router.post('/speaker-aliases', async (req, res) => {
     res.json({ id: result.id, success: true });
   } catch (error) {
     console.error('Error creating speaker alias:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -216,14 +231,15 @@ router.patch('/speaker-aliases/:id', async (req, res) => {
     res.json({ success: true });
   } catch (error) {
     console.error('Error updating speaker alias:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
 // ─── Meeting Register ───────────────────────────────────────────────
+// ?editedSince=<ISO> returns only rows edited on/after that time (agent mirror delta sync).
 router.get('/meeting-register', async (req, res) => {
-  try { res.json(await getMeetingRegister()); }
-  catch (error) { res.status(500).json({ error: error.message }); }
+  try { res.json(await getMeetingRegister(req.query.editedSince || undefined)); }
+  catch (error) { sendError(res, error); }
 });
 
 router.post('/meeting-register', async (req, res) => {
@@ -232,7 +248,7 @@ router.post('/meeting-register', async (req, res) => {
     res.json({ id: result.id, success: true });
   } catch (error) {
     console.error('Error creating meeting register entry:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -243,10 +259,62 @@ router.patch('/meeting-register/:id', async (req, res) => {
     res.json({ success: true });
   } catch (error) {
     console.error('Error updating meeting register entry:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
+// Run `fn` over `items` with at most REGISTER_BATCH_CONCURRENCY in flight; each
+// item reports its own outcome ({ success: true, ...result } or the error).
+const REGISTER_BATCH_CONCURRENCY = Math.max(1, parseInt(process.env.REGISTER_BATCH_CONCURRENCY || '3', 10));
+
+async function runRegisterBatch(items, label, fn) {
+  const results = new Array(items.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const index = next++;
+      const item = items[index] || {};
+      try {
+        results[index] = { success: true, ...(await fn(item)) };
+      } catch (error) {
+        console.error(`Error ${label(item)}:`, error.message);
+        results[index] = { success: false, error: error.message, status: errorStatus(error) };
+      }
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(REGISTER_BATCH_CONCURRENCY, items.length) }, worker));
+  return results;
+}
+
+// Apply many meeting register updates in one call: { updates: [{ id, fields }] }.
+router.post('/meeting-register/batch-update', async (req, res) => {
+  const updates = Array.isArray(req.body?.updates) ? req.body.updates : null;
+  if (!updates) return res.status(400).json({ error: 'updates must be an array' });
+
+  const results = await runRegisterBatch(updates, (u) => `updating meeting register entry ${u.id}`, async ({ id, fields }) => {
+    if (!id) throw Object.assign(new Error('id is required'), { status: 400 });
+    await updateMeetingRegister(id, fields || {});
+    return { id };
+  });
+  results.forEach((r, i) => { r.id = updates[i]?.id; });
+  res.json({ success: results.every((r) => r.success), results });
+});
+
+// Upsert many meeting register rows by external meeting ID in one call:
+// { items: [{ externalMeetingId, createOnlyFields, ...fields }] } (same item shape as upsert-by-external).
+router.post('/meeting-register/upsert-by-external/batch', async (req, res) => {
+  const items = Array.isArray(req.body?.items) ? req.body.items : null;
+  if (!items) return res.status(400).json({ error: 'items must be an array' });
+
+  const results = await runRegisterBatch(items, (i) => `upserting meeting register entry ${i.externalMeetingId}`,
+    async ({ externalMeetingId, createOnlyFields, ...rest }) => {
+      if (!externalMeetingId) throw Object.assign(new Error('externalMeetingId is required'), { status: 400 });
+      return upsertMeetingRegisterByExternalId(externalMeetingId, rest, createOnlyFields || {});
+    });
+  results.forEach((r, i) => { r.externalMeetingId = items[i]?.externalMeetingId; });
+  res.json({ success: results.every((r) => r.success), results });
+});
+
 // Lookup meeting register row by external meeting ID.
 router.get('/meeting-register/by-external/:externalMeetingId', async (req, res) => {
   try {
@@ -255,7 +323,32 @@ router.get('/meeting-register/by-external/:externalMeetingId', async (req, res)
     res.json({ id: row.id });
   } catch (error) {
     console.error('Error finding meeting register entry:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
+  }
+});
+
+// Acquire or renew the cross-replica processing lease for one meeting.
+router.post('/meeting-register/by-external/:externalMeetingId/lease', async (req, res) => {
+  try {
+    const { owner, ttlSeconds } = req.body || {};
+    if (!owner) return res.status(400).json({ error: 'owner is required' });
+    const ttl = Number(ttlSeconds) > 0 ? Number(ttlSeconds) : 900;
+    res.json(await acquireMeetingRegisterLease(req.params.externalMeetingId, owner, ttl));
+  } catch (error) {
+    console.error('Error acquiring meeting register lease:', error.message);
+    sendError(res, error);
+  }
+});
+
+// Release the processing lease (only if still held by `owner`).
+router.delete('/meeting-register/by-external/:externalMeetingId/lease', async (req, res) => {
+  try {
+    const owner = req.query.owner;
+    if (!owner) return res.status(400).json({ error: 'owner is required' });
+    res.json(await releaseMeetingRegisterLease(req.params.externalMeetingId, owner));
+  } catch (error) {
+    console.error('Error releasing meeting register lease:', error.message);
+    sendError(res, error);
   }
 });
 
@@ -270,14 +363,14 @@ router.post('/meeting-register/upsert-by-external', async (req, res) => {
     res.json({ success: true, ...result });
   } catch (error) {
     console.error('Error upserting meeting register entry:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
 // ─── Agent Config ───────────────────────────────────────────────────
 router.get('/agent-config', async (req, res) => {
   try { res.json(await getAgentConfig()); }
-  catch (error) { res.status(500).json({ error: error.message }); }
+  catch (error) { sendError(res, error); }
 });
 
 router.patch('/agent-config/:id', async (req, res) => {
@@ -286,7 +379,7 @@ router.patch('/agent-config/:id', async (req, res) => {
     res.json({ success: true });
   } catch (error) {
     console.error('Error updating agent config:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -297,7 +390,7 @@ router.get('/context', async (req, res) => {
     res.json(ctx);
   } catch (error) {
     console.error('Error fetching context:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -661,7 +754,7 @@ router.post('/notes', async (req, res) => {
     res.json({ id: result.id, success: true });
   } catch (error) {
     console.error('Error creating note:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -877,7 +970,7 @@ router.post('/agendas', async (req, res) => {
     res.json({ id: result.id, success: true });
   } catch (error) {
     console.error('Error creating agenda:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -890,11 +983,8 @@ function formatTimestamp(seconds) {
   return `${String(m).padStart(2, '0')}:${String(s).padStart(2, '0')}`;
 }
 
-function buildTranscriptBlocks(sentences, transcriptUrl) {
-  const blocks = [];
-
-  // Header
-  blocks.push(buildHeading(2, '📄 FULL TRANSCRIPT'));
+function buildTranscriptHeaderBlocks(transcriptUrl) {
+  const blocks = [buildHeading(2, '📄 FULL TRANSCRIPT')];
   if (transcriptUrl) {
     blocks.push({
       object: 'block', type: 'paragraph',
@@ -907,7 +997,11 @@ function buildTranscriptBlocks(sentences, transcriptUrl) {
     });
   }
   blocks.push(buildDivider());
+  return blocks;
+}
 
+function buildSentenceBlocks(sentences) {
+  const blocks = [];
   // Group sentences into segments of ~30 per block
   const CHUNK = 30;
   for (let i = 0; i < sentences.length; i += CHUNK) {
@@ -927,14 +1021,28 @@ function buildTranscriptBlocks(sentences, transcriptUrl) {
       blocks.push(buildParagraph([{ text: content.slice(j, j + 1900), bold: false }]));
     }
   }
-
   return blocks;
 }
 
+function buildTranscriptBlocks(sentences, transcriptUrl) {
+  return [...buildTranscriptHeaderBlocks(transcriptUrl), ...buildSentenceBlocks(sentences)];
+}
+
+// Paged transcript: one toggle heading per part, each part's sentences nested under it,
+// so parts can be written concurrently and rewritten individually on retry
+function buildTranscriptPartHeading(label) {
+  return { object: 'block', type: 'heading_3', heading_3: { rich_text: [richText(label)], is_toggleable: true } };
+}
+
 const TRANSCRIPT_CACHE_CHILD_TITLE = '🤖 Transcript Cache';
 const TRANSCRIPT_CACHE_BEGIN = 'TRANSCRIPT_CACHE_BEGIN';
 const TRANSCRIPT_CACHE_END = 'TRANSCRIPT_CACHE_END';
 const TRANSCRIPT_CACHE_CHUNK_SIZE = 1800;
+// Compact snapshot envelope (see agent/transcript_snapshot.py): columnar sentences,
+// compressed and base64-encoded. The agent posts it ready-made; raw transcripts
+// (webhook-server) are compacted here with gzip.
+const TRANSCRIPT_SNAPSHOT_FORMAT = 'compact';
+const TRANSCRIPT_SNAPSHOT_VERSION = 1;
 
 function getBlockPlainText(block) {
   const richText = block?.[block.type]?.rich_text || [];
@@ -980,15 +1088,65 @@ function normalizeTranscriptSnapshot(transcript) {
   };
 }
 
+function isCompactSnapshot(payload) {
+  return payload?.snapshot_format === TRANSCRIPT_SNAPSHOT_FORMAT && typeof payload.data === 'string';
+}
+
+function encodeCompactSnapshot(snapshot) {
+  const { sentences, ...meta } = snapshot;
+  const speakers = [];
+  const speakerIndex = new Map();
+  const speaker = [];
+  const text = [];
+  const startTime = [];
+  for (const sentence of sentences) {
+    if (!sentence.speaker_name) {
+      speaker.push(-1);
+    } else {
+      if (!speakerIndex.has(sentence.speaker_name)) {
+        speakerIndex.set(sentence.speaker_name, speakers.length);
+        speakers.push(sentence.speaker_name);
+      }
+      speaker.push(speakerIndex.get(sentence.speaker_name));
+    }
+    text.push(sentence.text);
+    startTime.push(sentence.start_time);
+  }
+  const raw = Buffer.from(JSON.stringify({ meta, speakers, speaker, text, start_time: startTime }));
+  return {
+    snapshot_format: TRANSCRIPT_SNAPSHOT_FORMAT,
+    version: TRANSCRIPT_SNAPSHOT_VERSION,
+    codec: 'gzip',
+    id: snapshot.id,
+    title: snapshot.title,
+    sentence_count: sentences.length,
+    raw_bytes: raw.length,
+    data: zlib.gzipSync(raw, { level: 9 }).toString('base64'),
+  };
+}
+
 function buildTranscriptCacheBlocks(transcript) {
-  const snapshot = normalizeTranscriptSnapshot(transcript);
+  const envelope = isCompactSnapshot(transcript)
+    ? transcript
+    : encodeCompactSnapshot(normalizeTranscriptSnapshot(transcript));
+  const snapshot = {
+    snapshot_format: envelope.snapshot_format,
+    version: envelope.version,
+    codec: envelope.codec,
+    id: envelope.id,
+    title: envelope.title || 'Untitled Meeting',
+    sentence_count: envelope.sentence_count || 0,
+    raw_bytes: envelope.raw_bytes || null,
+    data: envelope.data,
+    cached_at: new Date().toISOString(),
+  };
   const serialized = JSON.stringify(snapshot);
   const chunkCount = Math.ceil(serialized.length / TRANSCRIPT_CACHE_CHUNK_SIZE) || 1;
   const blocks = [
     buildHeading(2, 'AUTONOMOUS TRANSCRIPT CACHE'),
     buildCallout(
       `Cached transcript snapshot for ${snapshot.title}. ` +
-      `Sentences: ${snapshot.sentences.length}. Cached at: ${snapshot.cached_at}`,
+      `Sentences: ${snapshot.sentence_count}. Cached at: ${snapshot.cached_at}`,
       '🤖'
     ),
     buildParagraph(TRANSCRIPT_CACHE_BEGIN),
@@ -1092,7 +1250,79 @@ router.post('/notes/:id/transcript', async (req, res) => {
     res.json({ success: true, child_page_id: childPageId, blocks_written: allBlocks.length });
   } catch (error) {
     console.error('Error appending transcript:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
+  }
+});
+
+// POST /api/notes/:id/transcript/pages — create the transcript child page with one (empty) toggle per part
+router.post('/notes/:id/transcript/pages', async (req, res) => {
+  try {
+    const noteId = req.params.id;
+    const { parts = [], transcript_url } = req.body;
+
+    if (!Array.isArray(parts) || !parts.length) {
+      return res.status(400).json({ error: 'parts array of labels is required and must not be empty' });
+    }
+
+    const childPage = await notion.pages.create({
+      parent: { page_id: noteId },
+      icon: { type: 'emoji', emoji: '📄' },
+      properties: {
+        title: { title: [{ text: { content: '📄 Full Transcript' } }] }
+      }
+    });
+
+    const header = buildTranscriptHeaderBlocks(transcript_url);
+    const blocks = [...header, ...parts.map(label => buildTranscriptPartHeading(String(label)))];
+    const created = [];
+    const BATCH = 100;
+    for (let i = 0; i < blocks.length; i += BATCH) {
+      const response = await notion.blocks.children.append({
+        block_id: childPage.id,
+        children: blocks.slice(i, i + BATCH)
+      });
+      created.push(...response.results);
+    }
+    const partIds = created.slice(header.length).map(block => block.id);
+
+    console.log(`Created paged transcript (${partIds.length} parts) for note ${noteId}`);
+    res.json({ success: true, child_page_id: childPage.id, part_ids: partIds });
+  } catch (error) {
+    console.error('Error creating paged transcript:', error.message);
+    sendError(res, error);
+  }
+});
+
+// PUT /api/notes/:id/transcript/parts/:partId — (re)write one part's sentences; safe to repeat
+router.put('/notes/:id/transcript/parts/:partId', async (req, res) => {
+  try {
+    const { partId } = req.params;
+    const { sentences = [], replace = true } = req.body;
+
+    if (!sentences.length) {
+      return res.status(400).json({ error: 'sentences array is required and must not be empty' });
+    }
+
+    // A retried part may have been partly written by the attempt that failed;
+    // callers send replace: false only for a part's first write
+    const existing = replace ? await listAllBlockChildren(partId) : [];
+    for (const block of existing) {
+      await notion.blocks.delete({ block_id: block.id });
+    }
+
+    const blocks = buildSentenceBlocks(sentences);
+    const BATCH = 100;
+    for (let i = 0; i < blocks.length; i += BATCH) {
+      await notion.blocks.children.append({
+        block_id: partId,
+        children: blocks.slice(i, i + BATCH)
+      });
+    }
+
+    res.json({ success: true, blocks_written: blocks.length, blocks_replaced: existing.length });
+  } catch (error) {
+    console.error('Error writing transcript part:', error.message);
+    sendError(res, error);
   }
 });
 
@@ -1102,8 +1332,10 @@ router.post('/meeting-register/:id/transcript-cache', async (req, res) => {
     const meetingRegisterId = req.params.id;
     const transcript = req.body || {};
 
-    if (!transcript.id || !Array.isArray(transcript.sentences)) {
-      return res.status(400).json({ error: 'Transcript payload must include id and sentences[]' });
+    if (!transcript.id || !(isCompactSnapshot(transcript) || Array.isArray(transcript.sentences))) {
+      return res.status(400).json({
+        error: 'Transcript payload must include id and sentences[], or be a compact snapshot',
+      });
     }
 
     const existingCache = await findTranscriptCacheChild(meetingRegisterId);
@@ -1134,7 +1366,7 @@ router.post('/meeting-register/:id/transcript-cache', async (req, res) => {
         'Raw Transcript': {
           rich_text: [{
             text: {
-              content: `Cached transcript snapshot stored at ${snapshot.cached_at} (${snapshot.sentences.length} sentences)`
+              content: `Cached transcript snapshot stored at ${snapshot.cached_at} (${snapshot.sentence_count} sentences)`
             }
           }]
         }
@@ -1143,18 +1375,18 @@ router.post('/meeting-register/:id/transcript-cache', async (req, res) => {
 
     console.log(
       `Stored transcript cache for meeting register ${meetingRegisterId} ` +
-      `(${snapshot.sentences.length} sentences, child page ${childPage.id})`
+      `(${snapshot.sentence_count} sentences, ${blocks.length} blocks, child page ${childPage.id})`
     );
 
     res.json({
       success: true,
       child_page_id: childPage.id,
       blocks_written: blocks.length,
-      sentences_cached: snapshot.sentences.length,
+      sentences_cached: snapshot.sentence_count,
     });
   } catch (error) {
     console.error('Error storing transcript cache:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -1178,7 +1410,7 @@ router.get('/meeting-register/:id/transcript-cache', async (req, res) => {
     });
   } catch (error) {
     console.error('Error loading transcript cache:', error.message);
-    res.status(500).json({ error: error.message });
+    sendError(res, error);
   }
 });
 
@@ -1,5 +1,6 @@
 import { Client } from '@notionhq/client';
 import dotenv from 'dotenv';
+import { randomUUID } from 'crypto';
 
 dotenv.config();
 
@@ -637,10 +638,15 @@ export async function createSpeakerAlias(data) {
 }
 
 // ─── Meeting Register ────────────────────────────────────────────────────────
-export async function getMeetingRegister() {
-  const all = await queryAll(DATABASES.meetingRegister);
+// `editedSince` (ISO timestamp) limits the query to rows edited on/after it, for delta sync.
+export async function getMeetingRegister(editedSince = undefined) {
+  const filter = editedSince
+    ? { timestamp: 'last_edited_time', last_edited_time: { on_or_after: editedSince } }
+    : undefined;
+  const all = await queryAll(DATABASES.meetingRegister, filter);
   return all.map(m => ({
     id: m.id,
+    lastEditedTime: m.last_edited_time,
     title: getTitle(m),
     meetingDate: getDate(m, 'Meeting Date'),
     meetingFormat: getSelect(m, 'Meeting Format'),
@@ -668,6 +674,8 @@ export async function getMeetingRegister() {
     forceRerun: getCheckbox(m, 'Force Rerun'),
     lastAttemptAt: getDate(m, 'Last Attempt At'),
     retrySource: getRichText(m, 'Retry Source'),
+    leaseOwner: parseLeaseOwner(getRichText(m, 'Lease Owner')).owner,
+    leaseExpiresAt: getDate(m, 'Lease Expires At'),
     createdTime: getCreatedTime(m, 'Created time'),
   }));
 }
@@ -705,12 +713,14 @@ export async function createMeetingRegister(data) {
 }
 
 // Find one meeting register row using external meeting ID from Fireflies.
+// If concurrent creates left duplicates, every caller settles on the oldest row.
 export async function findMeetingRegisterByExternalId(externalMeetingId) {
   if (!externalMeetingId) return null;
   const results = await queryAll(DATABASES.meetingRegister, {
     property: 'External Meeting ID',
     rich_text: { equals: externalMeetingId }
   });
+  results.sort((a, b) => a.created_time.localeCompare(b.created_time) || a.id.localeCompare(b.id));
   return results[0] || null;
 }
 
@@ -737,6 +747,8 @@ export async function updateMeetingRegister(meetingRegisterId, data) {
   if (data.forceRerun !== undefined) properties['Force Rerun'] = { checkbox: !!data.forceRerun };
   if (data.lastAttemptAt !== undefined) properties['Last Attempt At'] = data.lastAttemptAt ? { date: { start: data.lastAttemptAt } } : { date: null };
   if (data.retrySource !== undefined) properties['Retry Source'] = { rich_text: data.retrySource ? [{ text: { content: data.retrySource } }] : [] };
+  if (data.leaseOwner !== undefined) properties['Lease Owner'] = { rich_text: data.leaseOwner ? [{ text: { content: data.leaseOwner } }] : [] };
+  if (data.leaseExpiresAt !== undefined) properties['Lease Expires At'] = data.leaseExpiresAt ? { date: { start: data.leaseExpiresAt } } : { date: null };
   if (data.facilitatorIds !== undefined) properties.Facilitator = { relation: (data.facilitatorIds || []).map(id => ({ id })) };
   if (data.attendeeIds !== undefined) properties.Attendees = { relation: (data.attendeeIds || []).map(id => ({ id })) };
   if (data.departmentIds !== undefined) properties.Department = { relation: (data.departmentIds || []).map(id => ({ id })) };
@@ -763,6 +775,96 @@ export async function upsertMeetingRegisterByExternalId(externalMeetingId, data,
   return { id: created.id, created: true };
 }
 
+// Processing lease so only one agent replica runs a meeting at a time.
+// Acquiring also renews: the current owner may call again to extend expiry.
+//
+// Notion has no compare-and-set, so a claim is a token write checked after a settle delay:
+//   1. read the row; a live lease held by another owner fails the claim
+//   2. write "<owner> <token>" and a whole-second expiry
+//   3. wait LEASE_SETTLE_MS (longer than Notion's read-after-write propagation), re-read,
+//      and win only if owner, token and expiry are still exactly ours
+// A claim whose read-to-write gap exceeds LEASE_CLAIM_MAX_GAP_MS is given up (and cleared),
+// so a competing writer that read the row before ours always lands inside our settle window.
+//
+// A meeting with no register row yet gets a lock row (retrySource "meeting_lease") first;
+// the retry worker ignores such rows until a webhook upsert turns them into queue rows.
+const LEASE_SETTLE_MS = Math.max(0, parseInt(process.env.LEASE_SETTLE_MS || '4500', 10));
+const LEASE_CLAIM_MAX_GAP_MS = Math.max(1, Math.floor(LEASE_SETTLE_MS / 3));
+export const LEASE_ROW_SOURCE = 'meeting_lease';
+
+function parseLeaseOwner(text) {
+  const value = text || '';
+  const split = value.lastIndexOf(' ');
+  return split < 0 ? { owner: value, token: '' } : { owner: value.slice(0, split), token: value.slice(split + 1) };
+}
+
+function leaseSecond(value) {
+  const ms = value ? Date.parse(value) : NaN;
+  return Number.isNaN(ms) ? null : Math.floor(ms / 1000);
+}
+
+async function findOrCreateLeaseRow(externalMeetingId) {
+  const existing = await findMeetingRegisterByExternalId(externalMeetingId);
+  if (existing) return existing;
+  const created = await createMeetingRegister({
+    title: 'Awaiting Fireflies transcript',
+    meetingDate: new Date().toISOString().split('T')[0],
+    externalMeetingId,
+    retrySource: LEASE_ROW_SOURCE,
+  });
+  // Another replica may have created one at the same time; keep the oldest, drop ours if it lost
+  const canonical = (await findMeetingRegisterByExternalId(externalMeetingId)) || created;
+  if (canonical.id !== created.id) {
+    await notion.pages.update({ page_id: created.id, archived: true });
+  }
+  return canonical;
+}
+
+export async function acquireMeetingRegisterLease(externalMeetingId, owner, ttlSeconds) {
+  const row = await findOrCreateLeaseRow(externalMeetingId);
+  const readAt = Date.now();
+  const current = parseLeaseOwner(getRichText(row, 'Lease Owner'));
+  const currentExpiry = getDate(row, 'Lease Expires At');
+  if (current.owner && current.owner !== owner && currentExpiry && Date.parse(currentExpiry) > readAt) {
+    return { acquired: false, id: row.id, owner: current.owner, expiresAt: currentExpiry };
+  }
+
+  const token = randomUUID();
+  const expiresAt = new Date((Math.floor(readAt / 1000) + ttlSeconds) * 1000).toISOString();
+  await updateMeetingRegister(row.id, { leaseOwner: `${owner} ${token}`, leaseExpiresAt: expiresAt });
+  if (Date.now() - readAt > LEASE_CLAIM_MAX_GAP_MS) {
+    // Too slow to rule out a competing claim that read the row before ours landed
+    await releaseLeaseToken(row.id, owner, token);
+    return { acquired: false, id: row.id, owner: null, expiresAt: new Date(Date.now() + LEASE_SETTLE_MS).toISOString() };
+  }
+
+  await new Promise((resolve) => setTimeout(resolve, LEASE_SETTLE_MS));
+  const check = await notion.pages.retrieve({ page_id: row.id });
+  const winner = parseLeaseOwner(getRichText(check, 'Lease Owner'));
+  const winnerExpiry = getDate(check, 'Lease Expires At');
+  const acquired = winner.owner === owner && winner.token === token && leaseSecond(winnerExpiry) === leaseSecond(expiresAt);
+  return { acquired, id: row.id, owner: winner.owner || null, expiresAt: winnerExpiry };
+}
+
+// Clear a claim only if it is still exactly the one this call wrote.
+async function releaseLeaseToken(rowId, owner, token) {
+  const check = await notion.pages.retrieve({ page_id: rowId });
+  const current = parseLeaseOwner(getRichText(check, 'Lease Owner'));
+  if (current.owner !== owner || current.token !== token) return false;
+  await updateMeetingRegister(rowId, { leaseOwner: '', leaseExpiresAt: null });
+  return true;
+}
+
+// Release a lease held by `owner` (no-op if another replica has taken it over).
+export async function releaseMeetingRegisterLease(externalMeetingId, owner) {
+  const row = await findMeetingRegisterByExternalId(externalMeetingId);
+  if (!row) return { released: false };
+  const current = parseLeaseOwner(getRichText(row, 'Lease Owner'));
+  if (current.owner !== owner) return { released: false };
+  const released = await releaseLeaseToken(row.id, owner, current.token);
+  return released ? { released: true, id: row.id } : { released: false };
+}
+
 // ─── Agent Config ────────────────────────────────────────────────────────────
 export async function getAgentConfig() {
   const all = await queryAll(DATABASES.agentConfig);
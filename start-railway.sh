@@ -37,6 +37,7 @@ export RETRY_POLL_SECONDS="${RETRY_POLL_SECONDS:-10}"
 export MAX_RETRY_ATTEMPTS="${MAX_RETRY_ATTEMPTS:-50}"
 export CLAUDE_AGENT_URL="${CLAUDE_AGENT_URL:-http://127.0.0.1:8000}"
 export NOTION_API_BASE="${NOTION_API_BASE:-http://127.0.0.1:${PORT}}"
+export SHUTDOWN_DRAIN_SECONDS="${SHUTDOWN_DRAIN_SECONDS:-60}"
 PYTHON_BIN="${PYTHON_BIN:-/app/venv/bin/python}"
 
 # Log environment status
@@ -50,6 +51,7 @@ echo "  - RETRY_POLL_SECONDS: $RETRY_POLL_SECONDS"
 echo "  - MAX_RETRY_ATTEMPTS: $MAX_RETRY_ATTEMPTS"
 echo "  - CLAUDE_AGENT_URL: $CLAUDE_AGENT_URL"
 echo "  - NOTION_API_BASE: $NOTION_API_BASE"
+echo "  - SHUTDOWN_DRAIN_SECONDS: $SHUTDOWN_DRAIN_SECONDS"
 
 if [ ! -x "$PYTHON_BIN" ]; then
     echo "❌ ERROR: Python runtime not found at $PYTHON_BIN"
@@ -163,6 +165,19 @@ echo "  - Webhook: /tmp/logs/webhook.log"
 echo "  - Agent: /tmp/logs/agent.log"
 echo "  - Retry: /tmp/logs/immediate-retry.log"
 
+# Graceful shutdown: let the agent drain first (it hands unfinished meetings back
+# to the Meeting Register through the bridge), then stop the webhook server.
+shutdown() {
+    echo "🛑 Shutdown requested — draining agent (up to ${SHUTDOWN_DRAIN_SECONDS}s)..."
+    kill -TERM $AGENT_PID 2>/dev/null || true
+    wait $AGENT_PID 2>/dev/null || true
+    echo "✅ Agent drained, stopping webhook server"
+    kill -TERM $WEBHOOK_PID $LOG_TAIL_PID 2>/dev/null || true
+    wait $WEBHOOK_PID 2>/dev/null || true
+    exit 0
+}
+trap shutdown TERM INT
+
 # Keep the container running and monitor services
 while true; do
     # Check if services are still running
@@ -181,5 +196,7 @@ while true; do
     
     echo "$(date): Services running - Webhook PID: $WEBHOOK_PID, Agent PID: $AGENT_PID" >> /tmp/logs/status.log
     
-    sleep 300
+    # Background sleep + wait so the TERM trap runs immediately
+    sleep 300 &
+    wait $!
 done
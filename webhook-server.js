@@ -225,6 +225,13 @@ app.post('/webhook/fireflies', async (req, res) => {
         }
       }
 
+      // The retry worker sleeps until its next scheduled row; nudge it so this
+      // meeting is picked up now rather than at the next resync.
+      if (!immediateProcessing.success) {
+        axios.post(`${CLAUDE_AGENT_URL}/worker/wake`, null, { timeout: 5000 })
+          .catch((wakeError) => console.warn('Retry worker wake failed; it will resync on its own:', wakeError.message));
+      }
+
       res.status(200).json({
         success: true,
         message: 'Transcript queued for durable background processing',